@@ -4,6 +4,7 @@ import contextlib
 import os
 import signal
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -14,8 +15,10 @@ from PySide6.QtWidgets import QApplication, QMenu, QSystemTrayIcon, QToolTip
 from core.context_manager import ContextManager
 from core.exceptions import ConfigurationError
 from core.openai_service import OpenAiService
+from modules.context.clipboard_history_menu_provider import ClipboardHistoryMenuProvider
 from modules.context.context_menu_provider import ContextMenuProvider
 from modules.gui.hotkey_manager import PyQtHotkeyManager
+from modules.gui.icons import get_icon_atlas
 from modules.gui.menu_coordinator import PyQtMenuCoordinator, PyQtMenuEventHandler
 from modules.gui.shared import MENU_STYLESHEET, TOOLTIP_STYLE
 from modules.history.history_execution_handler import HistoryExecutionHandler
@@ -31,6 +34,9 @@ from modules.speech.speech_menu_provider import (
     SpeechMenuProvider,
 )
 from modules.utils.clipboard import SystemClipboardManager
+from modules.utils.clipboard_history import DEFAULT_MAX_CLIP_BYTES, DEFAULT_MAX_CLIPS, ClipboardHistory, is_concealed
+from modules.utils.clipboard_image import get_clipboard_image_encoder
+from modules.utils.clipboard_monitor import ClipboardMonitor, get_default_poll_interval_ms
 from modules.utils.config import ConfigService, load_config, validate_config
 from modules.utils.keymap_actions import initialize_global_action_registry
 from modules.utils.notification_config import is_notification_enabled
@@ -119,6 +125,8 @@ class PromtheusApp(QObject):
 
         # Core services
         self.clipboard_manager: SystemClipboardManager | None = None
+        self.clipboard_monitor: ClipboardMonitor | None = None
+        self.clipboard_history: ClipboardHistory | None = None
         self.context_manager: ContextManager | None = None
         self.openai_service: OpenAiService | None = None
         self.prompt_store_service: PromptStoreService | None = None
@@ -166,6 +174,8 @@ class PromtheusApp(QObject):
         """Initialize basic services needed for configuration loading."""
         # Initialize clipboard manager
         self.clipboard_manager = SystemClipboardManager()
+        # Capture callbacks are queued to the encoder, so it must live on the GUI thread
+        get_clipboard_image_encoder()
 
         # Initialize context manager
         self.context_manager = ContextManager()
@@ -179,6 +189,9 @@ class PromtheusApp(QObject):
             if not self.config:
                 raise RuntimeError("Configuration not loaded")
 
+            # Serve clipboard reads from an event-driven snapshot
+            self._initialize_clipboard_monitor()
+
             # Initialize prompt providers
             self._initialize_prompt_providers()
 
@@ -223,6 +236,12 @@ class PromtheusApp(QObject):
             # Initialize menu providers
             self._initialize_menu_providers()
 
+            # Build the context menu once the event loop runs, so the first hotkey press only shows it
+            QTimer.singleShot(0, self.menu_coordinator.prebuild_menu)
+
+            # Then rasterize the icon palette in idle batches, so dialogs do not render SVGs on first open
+            QTimer.singleShot(0, get_icon_atlas().start)
+
             # Show warning notification if API key is missing (delayed to ensure notification manager is ready)
             if self._pending_api_key_warning and self.notification_manager:
                 QTimer.singleShot(500, lambda: self._show_api_key_warning())
@@ -231,6 +250,38 @@ class PromtheusApp(QObject):
             print(f"Failed to initialize application: {e}")
             sys.exit(1)
 
+    def _initialize_clipboard_monitor(self) -> None:
+        """Attach a clipboard snapshot monitor to the clipboard manager."""
+        clipboard_settings = ConfigService().get_settings_data().get("clipboard", {})
+        poll_interval_ms = clipboard_settings.get("poll_interval_ms", get_default_poll_interval_ms())
+        self.clipboard_monitor = ClipboardMonitor(self.app.clipboard(), poll_interval_ms, parent=self)
+        self.clipboard_manager.set_monitor(self.clipboard_monitor)
+
+        history_settings = clipboard_settings.get("history", {})
+        self.clipboard_history = ClipboardHistory(
+            max_clips=history_settings.get("max_clips", DEFAULT_MAX_CLIPS),
+            max_bytes=history_settings.get("max_bytes", DEFAULT_MAX_CLIP_BYTES),
+        )
+        self.clipboard_monitor.snapshot_changed.connect(self._record_clipboard_clip)
+        self._record_clipboard_clip()
+
+    def _record_clipboard_clip(self, _version: int = 0) -> None:
+        """Add the current clipboard content to the clipboard history."""
+        snapshot = self.clipboard_monitor.get_snapshot()
+        if snapshot is None:
+            return
+        if is_concealed(snapshot.mime_types):
+            return  # Password managers mark secrets so they stay out of clipboard history
+        if snapshot.has_image:
+            get_clipboard_image_encoder().capture_bytes(self.app.clipboard(), self._record_clipboard_image)
+        else:
+            self.clipboard_history.add_text(snapshot.text)
+
+    def _record_clipboard_image(self, image_data: tuple[bytes, str] | None) -> None:
+        """Add a captured clipboard image to the clipboard history."""
+        if image_data:
+            self.clipboard_history.add_image(*image_data)
+
     def _initialize_openai_service(self) -> None:
         """Initialize OpenAI service with all model configurations."""
         if not self.config or not self.config.models:
@@ -272,9 +323,16 @@ class PromtheusApp(QObject):
     def _initialize_history_service(self) -> None:
         """Initialize unified history service."""
         try:
-            from modules.history.history_service import HistoryService
-
-            self.history_service = HistoryService()
+            from modules.history.history_service import DEFAULT_HOT_ENTRIES, DEFAULT_MAX_BYTES, HistoryService
+            from modules.history.history_storage import DEFAULT_COMPRESSION_THRESHOLD
+
+            history_settings = ConfigService().get_settings_data().get("history", {})
+            self.history_service = HistoryService(
+                max_entries=history_settings.get("max_entries", 100),
+                max_bytes=history_settings.get("max_bytes", DEFAULT_MAX_BYTES),
+                hot_entries=history_settings.get("hot_entries", DEFAULT_HOT_ENTRIES),
+                compression_threshold=history_settings.get("compression_threshold", DEFAULT_COMPRESSION_THRESHOLD),
+            )
             self.history_service.initialize()  # Clear temp images on startup
         except Exception:
             self.history_service = None
@@ -513,6 +571,12 @@ class PromtheusApp(QObject):
                 self.clipboard_manager,
                 self.prompt_store_service,
             ),
+            ClipboardHistoryMenuProvider(
+                self.clipboard_history,
+                self.context_manager,
+                self.clipboard_manager,
+                self.notification_manager,
+            ),
             SpeechMenuProvider(
                 self._speech_to_text,
                 self.history_service,
@@ -576,10 +640,12 @@ class PromtheusApp(QObject):
     def _on_show_menu_hotkey_pressed(self) -> None:
         """Handle F2 hotkey press event for showing context menu."""
 
+        requested_at = time.perf_counter()
+
         # Use QTimer.singleShot to ensure execution on main Qt thread
         def show_menu():
             if self.menu_coordinator:
-                self.menu_coordinator.show_menu()
+                self.menu_coordinator.show_menu(requested_at)
 
         QTimer.singleShot(0, show_menu)
 
@@ -739,6 +805,10 @@ class PromtheusApp(QObject):
         if self.notification_manager:
             self.notification_manager.cleanup()
 
+        # Stop local transcription worker
+        if self.openai_service:
+            self.openai_service.close()
+
         # Hide system tray and cleanup menu
         if self.system_tray:
             self.system_tray.hide()
@@ -0,0 +1,492 @@
+"""End-to-end benchmark of the speech-to-text pipeline.
+
+Plays audio fixtures through a fake sounddevice input stream into the real
+SpeechToTextService, which uploads to a local stand-in for the transcription
+API. Each run reports how long the pipeline spends encoding, uploading and
+transcribing, and how soon the transcription callback fires after recording
+stops. Runs cover several pipeline configurations (compression, silence
+trimming, segmentation) so their effect can be compared.
+
+Usage:
+    python -m benchmarks.speech_pipeline --output speech-benchmark.json
+    python -m benchmarks.speech_pipeline --fixture meeting=recordings/meeting.wav --variant segmented
+
+Results are written as JSON for regression tracking.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import re
+import statistics
+import sys
+import threading
+import time
+import types
+import wave
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+FIXTURE_RATE = 44100
+STREAM_BLOCK_FRAMES = 512
+CALLBACK_TIMEOUT = 120.0
+HANDLER_NAME = "BenchmarkHandler"
+
+# Pipeline configurations, as speech_to_text_model overrides. "raw_upload" is
+# benchmark-only: the recording is sent as WAV at its native rate without
+# trimming or skipping silent audio, as the pipeline did before any of these steps.
+VARIANTS: dict[str, dict[str, Any]] = {
+    "wav_whole": {
+        "raw_upload": True,
+        "audio_format": "wav",
+        "segmentation": {"enabled": False},
+    },
+    "compressed_whole": {
+        "audio_format": "flac",
+        "segmentation": {"enabled": False},
+        "silence_trimming": {"enabled": False},
+    },
+    "trimmed_whole": {
+        "audio_format": "flac",
+        "segmentation": {"enabled": False},
+        "silence_trimming": {"enabled": True},
+    },
+    "segmented": {
+        "audio_format": "flac",
+        "segmentation": {"enabled": True},
+        "silence_trimming": {"enabled": True},
+    },
+}
+
+
+# --- Fixtures -----------------------------------------------------------------
+
+
+def _noise(rng: np.random.Generator, count: int, level: float = 30.0) -> np.ndarray:
+    return rng.normal(0.0, level, count)
+
+
+def _syllable(rng: np.random.Generator, rate: int) -> np.ndarray:
+    """A voiced burst with a few harmonics and a smooth envelope, sometimes led by a fricative."""
+    duration = rng.uniform(0.12, 0.3)
+    t = np.arange(int(duration * rate)) / rate
+    f0 = rng.uniform(110, 220) * (1 + 0.05 * np.sin(2 * np.pi * rng.uniform(2, 5) * t))
+    phase = 2 * np.pi * np.cumsum(f0) / rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 6)) * rng.uniform(2000, 5000)
+    voiced *= np.hanning(len(t))
+    if rng.random() < 0.3:
+        fricative = _noise(rng, int(rng.uniform(0.05, 0.1) * rate), rng.uniform(300, 600))
+        return np.concatenate((fricative, voiced))
+    return voiced
+
+
+def synthetic_speech(seconds: float, rate: int = FIXTURE_RATE, seed: int = 0) -> np.ndarray:
+    """Speech-like int16 audio: words of 1-4 syllables, short gaps, and a longer pause every few seconds."""
+    rng = np.random.default_rng(seed)
+    total = int(seconds * rate)
+    parts = [_noise(rng, int(0.3 * rate))]
+    length = len(parts[0])
+    next_pause = rng.uniform(3, 6) * rate
+    while length < total:
+        for _ in range(rng.integers(1, 5)):
+            parts.append(_syllable(rng, rate))
+            length += len(parts[-1])
+        if length >= next_pause:
+            gap = rng.uniform(0.7, 1.5)
+            next_pause = length + rng.uniform(3, 6) * rate
+        else:
+            gap = rng.uniform(0.05, 0.15)
+        parts.append(_noise(rng, int(gap * rate)))
+        length += len(parts[-1])
+    audio = np.concatenate(parts)[:total] + _noise(rng, total)
+    return np.clip(audio, -32768, 32767).astype(np.int16)
+
+
+def background_noise(seconds: float, rate: int = FIXTURE_RATE, seed: int = 0) -> np.ndarray:
+    """Microphone noise without speech."""
+    rng = np.random.default_rng(seed)
+    return _noise(rng, int(seconds * rate)).astype(np.int16)
+
+
+def default_fixtures() -> dict[str, np.ndarray]:
+    return {
+        "speech": synthetic_speech(6, seed=1),
+        "silence": background_noise(5, seed=2),
+        "long_dictation": synthetic_speech(90, seed=3),
+    }
+
+
+def load_wav_fixture(path: Path) -> tuple[np.ndarray, int]:
+    """Load a recorded 16-bit mono WAV fixture."""
+    with wave.open(str(path), "rb") as wav_file:
+        if wav_file.getsampwidth() != 2 or wav_file.getnchannels() != 1:
+            raise ValueError(f"{path}: fixtures must be 16-bit mono WAV")
+        rate = wav_file.getframerate()
+        samples = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+    return samples, rate
+
+
+# --- Fake sounddevice ---------------------------------------------------------
+
+
+class FakeInputStream:
+    """Stand-in for sounddevice.RawInputStream that plays the current fixture in real time.
+
+    Once the fixture is exhausted it keeps delivering background noise like
+    a live microphone until the stream is stopped.
+    """
+
+    def __init__(self, sounddevice: "FakeSoundDevice", callback, samplerate: int, **_kwargs):
+        self._device = sounddevice
+        self._callback = callback
+        self._rate = int(samplerate)
+        self._running = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running.clear()
+        if self._thread is not None:
+            self._thread.join()
+
+    def close(self) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        noise = background_noise(1, self._rate, seed=99)
+        interval = STREAM_BLOCK_FRAMES / self._rate / self._device.speed
+        deadline = time.perf_counter()
+        noise_pos = 0
+        while self._running.is_set():
+            block = self._device.next_block(STREAM_BLOCK_FRAMES)
+            if block is None:
+                block = noise[noise_pos : noise_pos + STREAM_BLOCK_FRAMES]
+                noise_pos = (noise_pos + STREAM_BLOCK_FRAMES) % (len(noise) - STREAM_BLOCK_FRAMES)
+            self._callback(block.tobytes(), len(block), None, None)
+            deadline += interval
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+
+
+class FakeSoundDevice(types.ModuleType):
+    """Replaces the sounddevice module with a single input device that plays fixtures."""
+
+    def __init__(self, speed: float):
+        super().__init__("sounddevice")
+        self.speed = speed
+        self.rate = FIXTURE_RATE
+        self.default = types.SimpleNamespace(device=[0, None])
+        self.fixture_done = threading.Event()
+        self._lock = threading.Lock()
+        self._fixture = np.zeros(0, dtype=np.int16)
+        self._position = 0
+
+    def load(self, samples: np.ndarray, rate: int) -> None:
+        """Queue a fixture; it plays from the start of the next stream blocks."""
+        with self._lock:
+            self.rate = rate
+            self._fixture = samples
+            self._position = 0
+            self.fixture_done.clear()
+
+    def next_block(self, frames: int) -> np.ndarray | None:
+        with self._lock:
+            if self._position >= len(self._fixture):
+                self.fixture_done.set()
+                return None
+            block = self._fixture[self._position : self._position + frames]
+            self._position += frames
+            return block
+
+    def query_devices(self, device=None, kind=None):
+        info = {"name": f"benchmark fixture ({self.rate} Hz)", "hostapi": 0, "max_input_channels": 1}
+        return info if device is not None or kind is not None else [info]
+
+    def check_input_settings(self, device=None, channels=None, samplerate=None, **_kwargs) -> None:
+        if samplerate != self.rate:
+            raise ValueError(f"fixture device only supports {self.rate} Hz")
+
+    def RawInputStream(self, **kwargs) -> FakeInputStream:
+        return FakeInputStream(self, **kwargs)
+
+    def _initialize(self) -> None:
+        pass
+
+    def _terminate(self) -> None:
+        pass
+
+
+# --- Stand-in transcription API -------------------------------------------------
+
+
+@dataclass
+class UploadRecord:
+    bytes: int
+    filename: str
+    received: float
+
+
+@dataclass
+class TranscriptionServer:
+    """Local HTTP server answering OpenAI-style transcription requests after a fixed latency."""
+
+    latency_ms: float
+    uploads: list[UploadRecord] = field(default_factory=list)
+
+    def __post_init__(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                match = re.search(rb'filename="([^"]*)"', body[:4096])
+                filename = match.group(1).decode(errors="replace") if match else ""
+                server.uploads.append(UploadRecord(len(body), filename, time.perf_counter()))
+                time.sleep(server.latency_ms / 1000)
+                payload = json.dumps({"text": f"transcript of {filename}"}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+# --- Instrumented runs --------------------------------------------------------
+
+
+class StageTimer:
+    """Collects wall-clock durations of pipeline stages from any thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.durations: dict[str, list[float]] = {}
+        self.finished_at: dict[str, float] = {}
+
+    def wrap(self, stage: str, func):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                with self._lock:
+                    self.durations.setdefault(stage, []).append(end - start)
+                    self.finished_at[stage] = max(self.finished_at.get(stage, 0.0), end)
+
+        return timed
+
+    def total_ms(self, stage: str) -> float:
+        return round(sum(self.durations.get(stage, [])) * 1000, 2)
+
+    def max_ms(self, stage: str) -> float:
+        return round(max(self.durations.get(stage, [0.0])) * 1000, 2)
+
+
+def _instrument(speech_module, service, timer: StageTimer) -> None:
+    """Time encoding and transcription inside the real pipeline."""
+    speech_module.encode_audio = timer.wrap("encode", speech_module.encode_audio)
+    speech_module.transcode_recording = timer.wrap("encode", speech_module.transcode_recording)
+    service.openai_service.transcribe_audio = timer.wrap("transcription", service.openai_service.transcribe_audio)
+
+
+def run_once(
+    speech_module,
+    sounddevice: FakeSoundDevice,
+    server: TranscriptionServer,
+    fixture: np.ndarray,
+    rate: int,
+    variant: dict[str, Any],
+) -> dict[str, Any]:
+    """Record one fixture through a fresh SpeechToTextService and measure each stage."""
+    from core.openai_service import OpenAiService
+
+    variant = dict(variant)
+    raw_upload = variant.pop("raw_upload", False)
+    config = {"model": "whisper-1", "api_key": "benchmark", "base_url": server.base_url, **variant}
+    if raw_upload:
+        config["sample_rate"] = rate
+    service = speech_module.SpeechToTextService(OpenAiService([], speech_to_text_config=config))
+    if raw_upload:
+        # No trimming settings also disables the check that drops recordings without speech
+        service._get_trimming_settings = lambda: None
+    originals = (speech_module.encode_audio, speech_module.transcode_recording)
+    timer = StageTimer()
+    _instrument(speech_module, service, timer)
+
+    result: dict[str, Any] = {}
+    done = threading.Event()
+
+    def on_transcription(text: str, _duration: float) -> None:
+        result["callback_at"] = time.perf_counter()
+        result["text"] = text
+        done.set()
+
+    def on_error(message: str) -> None:
+        result["error"] = message
+        done.set()
+
+    service.add_transcription_callback(on_transcription, handler_name=HANDLER_NAME)
+    service.set_error_callback(on_error)
+    server.uploads.clear()
+    sounddevice.load(fixture, rate)
+
+    try:
+        service.start_recording(HANDLER_NAME)
+        while not sounddevice.fixture_done.wait(0.05):
+            if done.is_set():
+                return {"error": result.get("error", "recording stopped early")}
+        stopped_at = time.perf_counter()
+        service.stop_recording()
+        if not done.wait(CALLBACK_TIMEOUT):
+            result["error"] = "timed out waiting for the transcription callback"
+    finally:
+        speech_module.encode_audio, speech_module.transcode_recording = originals
+        service.recorder.disarm()
+
+    if "error" in result:
+        return {"error": result["error"]}
+
+    # Dispatch is measured from the last stage that finished before the callback
+    last_stage_end = max(timer.finished_at.values(), default=stopped_at)
+    return {
+        "encode_ms": timer.total_ms("encode"),
+        "encode_calls": len(timer.durations.get("encode", [])),
+        "upload_bytes": sum(upload.bytes for upload in server.uploads),
+        "upload_requests": len(server.uploads),
+        "upload_formats": sorted({Path(upload.filename).suffix.lstrip(".") for upload in server.uploads}),
+        "transcription_ms": timer.total_ms("transcription"),
+        "transcription_max_ms": timer.max_ms("transcription"),
+        "callback_dispatch_ms": round((result["callback_at"] - max(last_stage_end, stopped_at)) * 1000, 2),
+        "stop_to_result_ms": round((result["callback_at"] - stopped_at) * 1000, 2),
+        "transcript_chars": len(result["text"]),
+    }
+
+
+def summarize(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Median of each numeric metric across repeated runs."""
+    errors = [run["error"] for run in runs if "error" in run]
+    ok = [run for run in runs if "error" not in run]
+    summary: dict[str, Any] = {"runs": len(runs), "errors": errors}
+    if ok:
+        for key, value in ok[0].items():
+            if isinstance(value, int | float):
+                summary[key] = round(statistics.median(run[key] for run in ok), 2)
+            else:
+                summary[key] = value
+    return summary
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--fixture",
+        action="append",
+        default=[],
+        metavar="NAME=PATH",
+        help="Recorded 16-bit mono WAV fixture; replaces the generated fixtures (repeatable)",
+    )
+    parser.add_argument(
+        "--variant",
+        action="append",
+        choices=sorted(VARIANTS),
+        help="Pipeline configuration to run (repeatable, default: all)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="Stand-in API latency per request")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed of fixtures relative to real time")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per fixture and variant; medians are reported")
+    parser.add_argument("--output", type=Path, help="Write JSON here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    # The fake device must be in place before the speech module imports sounddevice
+    sounddevice = FakeSoundDevice(args.speed)
+    sys.modules["sounddevice"] = sounddevice
+    from modules.utils import audio_encoding
+    from modules.utils import speech_to_text as speech_module
+
+    speech_module.sd = sounddevice
+    speech_module.SOUNDDEVICE_AVAILABLE = True
+
+    if args.fixture:
+        fixtures = {}
+        for spec in args.fixture:
+            name, _, path = spec.partition("=")
+            fixtures[name] = load_wav_fixture(Path(path or name))
+    else:
+        fixtures = {name: (samples, FIXTURE_RATE) for name, samples in default_fixtures().items()}
+
+    server = TranscriptionServer(args.latency_ms)
+    server.start()
+    results = []
+    try:
+        for fixture_name, (samples, rate) in fixtures.items():
+            for variant_name in args.variant or list(VARIANTS):
+                runs = [
+                    run_once(speech_module, sounddevice, server, samples, rate, VARIANTS[variant_name])
+                    for _ in range(max(1, args.repeat))
+                ]
+                summary = summarize(runs)
+                results.append(
+                    {
+                        "fixture": fixture_name,
+                        "variant": variant_name,
+                        "audio_seconds": round(len(samples) / rate, 2),
+                        **summary,
+                    }
+                )
+                print(f"{fixture_name:>16} {variant_name:<18} {json.dumps(summary)}", file=sys.stderr)
+    finally:
+        server.stop()
+
+    report = {
+        "benchmark": "speech_pipeline",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "soundfile": audio_encoding.SOUNDFILE_AVAILABLE,
+        },
+        "settings": {"latency_ms": args.latency_ms, "speed": args.speed, "repeat": args.repeat},
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,8 @@
 """Abstract interfaces and protocols for the Promptheus application."""
 
 from abc import ABC, abstractmethod
-from typing import Protocol
+from collections.abc import Callable
+from typing import BinaryIO, Protocol
 
 from .models import (
     ExecutionResult,
@@ -78,6 +79,34 @@ class ClipboardManager(ABC):
         """Get image data from clipboard as (base64_data, media_type) tuple."""
         pass
 
+    def capture_image(self, callback: Callable[[tuple[str, str] | None], None]) -> bool:
+        """Capture the clipboard image and pass it to callback, possibly later.
+
+        Returns False if the clipboard holds no image.
+        """
+        image_data = self.get_image_data()
+        if image_data is None:
+            return False
+        callback(image_data)
+        return True
+
+
+class SpeechBackend(ABC):
+    """Abstract base class for speech-to-text engines used in place of the API."""
+
+    @abstractmethod
+    def transcribe(self, audio_file: BinaryIO, filename: str | None = None) -> str:
+        """Transcribe an encoded audio file (WAV, FLAC or Ogg) and return the text."""
+        pass
+
+    def warm_up(self) -> None:
+        """Start loading the engine in the background so the next transcription is fast."""
+        return None
+
+    def close(self) -> None:
+        """Release the engine and its resources."""
+        return None
+
 
 class PromptStoreServiceProtocol(Protocol):
     """Protocol for the main PromptStore service."""
@@ -18,6 +18,8 @@ from openai import (
 from openai.types.chat.chat_completion_message_param import ChatCompletionMessageParam
 
 from core.exceptions import ConfigurationError
+from core.interfaces import SpeechBackend
+from core.speech_backends import create_speech_backend
 
 BASE64_PATTERN = re.compile(r"(data:[^;]+;base64,)[A-Za-z0-9+/=]{50,}")
 
@@ -52,6 +54,7 @@ class OpenAiService:
         self._models_by_id: dict[str, dict[str, Any]] = {}
         self._unavailable_models: dict[str, str] = {}
         self._speech_to_text_config = speech_to_text_config
+        self._speech_backend: SpeechBackend | None = None
 
         for model in models_config:
             model_id = model.get("id")
@@ -82,6 +85,14 @@ class OpenAiService:
                 self._unavailable_models[model_id] = str(e)
 
         if self._speech_to_text_config:
+            try:
+                self._speech_backend = create_speech_backend(self._speech_to_text_config)
+            except ConfigurationError as e:
+                self._unavailable_models["speech_to_text"] = str(e)
+                return
+            if self._speech_backend is not None:
+                return
+
             api_key = self._speech_to_text_config.get("api_key")
             if not api_key:
                 self._unavailable_models["speech_to_text"] = "Missing API key"
@@ -226,13 +237,16 @@ class OpenAiService:
         self,
         audio_file: BinaryIO,
         model_key: str = "speech_to_text",
+        filename: str | None = None,
     ) -> str:
         """
         Transcribe audio using specified model.
 
         Args:
-            audio_file: Binary audio file object
+            audio_file: Binary audio file object, e.g. an in-memory buffer
             model_key: Key of the model configuration to use (defaults to "speech_to_text")
+            filename: Name to upload the audio as; its extension tells the API the format.
+                Defaults to the file object's own name.
 
         Returns:
             Transcribed text
@@ -241,6 +255,9 @@ class OpenAiService:
             ConfigurationError: If model_key is not found
             Exception: If transcription fails
         """
+        if model_key == "speech_to_text" and self._speech_backend is not None:
+            return self._speech_backend.transcribe(audio_file, filename)
+
         if model_key not in self._clients:
             raise ConfigurationError(f"Model '{model_key}' not found in configuration")
 
@@ -256,7 +273,7 @@ class OpenAiService:
         try:
             transcription = client.audio.transcriptions.create(
                 model=model_name,
-                file=audio_file,
+                file=(filename, audio_file) if filename else audio_file,
             )
             return transcription.text.strip()
         except AuthenticationError as e:
@@ -289,7 +306,7 @@ class OpenAiService:
             ConfigurationError: If model_key is not found
             Exception: If transcription fails
         """
-        if model_key not in self._clients:
+        if not self.has_model(model_key):
             raise ConfigurationError(f"Model '{model_key}' not found in configuration")
 
         if not os.path.exists(file_path):
@@ -343,8 +360,27 @@ class OpenAiService:
         Returns:
             True if model is available, False otherwise
         """
+        if model_key == "speech_to_text" and self._speech_backend is not None:
+            return True
         return model_key in self._clients
 
+    def prepare_transcription(self, model_key: str = "speech_to_text") -> None:
+        """
+        Get the transcription backend ready ahead of a transcription request.
+
+        Local backends start loading their model in the background; the API needs no preparation.
+
+        Args:
+            model_key: Key of the model configuration that will transcribe
+        """
+        if model_key == "speech_to_text" and self._speech_backend is not None:
+            self._speech_backend.warm_up()
+
+    def close(self) -> None:
+        """Release local transcription backends."""
+        if self._speech_backend is not None:
+            self._speech_backend.close()
+
     def get_model_unavailable_reason(self, model_key: str) -> str | None:
         """
         Get reason why a model is unavailable, if any.
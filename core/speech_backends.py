@@ -0,0 +1,199 @@
+"""Speech-to-text backends that run without the OpenAI API.
+
+The local backend runs faster-whisper on the CPU in a worker process. The
+worker is started on first use (or by warm_up() when a recording starts)
+and keeps the model loaded, so only the first transcription pays for
+loading it. Running it in a separate process keeps inference and its native
+libraries out of the GUI process.
+"""
+
+import contextlib
+import importlib.util
+import io
+import logging
+import multiprocessing
+import threading
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import Any, BinaryIO
+
+from core.exceptions import ConfigurationError
+from core.interfaces import SpeechBackend
+
+logger = logging.getLogger(__name__)
+
+# Checked without importing: faster-whisper is only imported in the worker process
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
+
+LOCAL_BACKEND = "local"
+WORKER_STOP_TIMEOUT = 2.0
+
+
+@dataclass
+class LocalSpeechSettings:
+    """Local transcription options, from speech_to_text_model when "backend" is "local"."""
+
+    model: str = "base"
+    device: str = "cpu"
+    compute_type: str = "int8"
+    cpu_threads: int = 0
+    beam_size: int = 1
+    language: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "LocalSpeechSettings":
+        data = data or {}
+        defaults = cls()
+        return cls(
+            model=str(data.get("model") or defaults.model),
+            device=str(data.get("device", defaults.device)),
+            compute_type=str(data.get("compute_type", defaults.compute_type)),
+            cpu_threads=max(0, int(data.get("cpu_threads", defaults.cpu_threads))),
+            beam_size=max(1, int(data.get("beam_size", defaults.beam_size))),
+            language=data.get("language") or defaults.language,
+        )
+
+
+def _run_worker(conn: Connection, settings: LocalSpeechSettings) -> None:
+    """Worker process loop: load the model on the first request and keep it for the next ones.
+
+    Requests are ("load",) or ("transcribe", audio_bytes); every request is
+    answered with ("ok", text) or ("error", message).
+    """
+    model = None
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+        if request[0] == "stop":
+            return
+        try:
+            if model is None:
+                from faster_whisper import WhisperModel
+
+                model = WhisperModel(
+                    settings.model,
+                    device=settings.device,
+                    compute_type=settings.compute_type,
+                    cpu_threads=settings.cpu_threads,
+                )
+            text = ""
+            if request[0] == "transcribe":
+                segments, _ = model.transcribe(
+                    io.BytesIO(request[1]),
+                    beam_size=settings.beam_size,
+                    language=settings.language,
+                )
+                text = "".join(segment.text for segment in segments).strip()
+            conn.send(("ok", text))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class LocalWhisperBackend(SpeechBackend):
+    """Transcribes with a faster-whisper model kept resident in a worker process.
+
+    Requests are serialized: the worker handles one recording at a time and
+    already uses every configured CPU thread for it.
+    """
+
+    def __init__(self, settings: LocalSpeechSettings):
+        if not FASTER_WHISPER_AVAILABLE:
+            raise ConfigurationError("Local speech-to-text requires faster-whisper: uv pip install faster-whisper")
+        self.settings = settings
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._conn: Connection | None = None
+        self._lock = threading.Lock()
+
+    def warm_up(self) -> None:
+        """Start the worker and load the model in the background."""
+        threading.Thread(target=self._warm_up, daemon=True).start()
+
+    def transcribe(self, audio_file: BinaryIO, filename: str | None = None) -> str:
+        return self._request(("transcribe", audio_file.read()))
+
+    def close(self) -> None:
+        if self._lock.acquire(blocking=False):
+            try:
+                self._stop_worker()
+            finally:
+                self._lock.release()
+            return
+        # A request is in flight: killing the worker wakes it up, and it cleans up after itself
+        process = self._process
+        if process is not None:
+            process.terminate()
+
+    def _warm_up(self) -> None:
+        try:
+            self._request(("load",))
+        except Exception as e:
+            logger.warning(f"Could not load local speech model '{self.settings.model}': {e}")
+
+    def _request(self, request: tuple) -> str:
+        with self._lock:
+            conn = self._ensure_worker()
+            try:
+                conn.send(request)
+                # Wake up on a reply or when the worker dies, whichever comes first
+                wait([conn, self._process.sentinel])
+                if not conn.poll():
+                    self._process.join(WORKER_STOP_TIMEOUT)
+                    raise RuntimeError(f"worker exited with code {self._process.exitcode}")
+                status, result = conn.recv()
+            except (EOFError, OSError, RuntimeError) as e:
+                self._stop_worker()
+                raise Exception(f"Local transcription worker failed: {e}") from e
+        if status != "ok":
+            raise Exception(f"Local transcription failed: {result}")
+        return result
+
+    def _ensure_worker(self) -> Connection:
+        if self._process is not None and self._process.is_alive():
+            return self._conn
+        self._stop_worker()
+        logger.debug(f"Starting local speech worker for model '{self.settings.model}'")
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_run_worker, args=(child_conn, self.settings), name="speech-worker", daemon=True
+        )
+        try:
+            process.start()
+        except Exception:
+            parent_conn.close()
+            raise
+        finally:
+            child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+        return parent_conn
+
+    def _stop_worker(self) -> None:
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            with contextlib.suppress(OSError):
+                self._conn.send(("stop",))
+            self._process.join(WORKER_STOP_TIMEOUT)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._conn.close()
+        self._process = None
+        self._conn = None
+
+
+def create_speech_backend(speech_to_text_config: dict[str, Any] | None) -> SpeechBackend | None:
+    """Build the backend selected by the "backend" key; None means the OpenAI API.
+
+    Raises:
+        ConfigurationError: If the backend is unknown or cannot be used
+    """
+    backend = (speech_to_text_config or {}).get("backend", "openai")
+    if backend == "openai":
+        return None
+    if backend == LOCAL_BACKEND:
+        return LocalWhisperBackend(LocalSpeechSettings.from_dict(speech_to_text_config))
+    raise ConfigurationError(f"Unknown speech-to-text backend '{backend}'")
@@ -3,6 +3,7 @@
 
 import fcntl
 import logging
+import multiprocessing
 import os
 import sys
 
@@ -138,4 +139,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Spawned speech workers re-run this script in frozen builds
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -0,0 +1,112 @@
+"""Menu provider exposing recent clipboard clips."""
+
+import logging
+
+from core.context_manager import ContextManager
+from core.models import MenuItem, MenuItemType
+from modules.utils.clipboard_history import Clip, ClipboardHistory
+from modules.utils.notification_config import is_notification_enabled
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_LENGTH = 48
+
+
+def _clip_label(clip: Clip) -> str:
+    """Single-line preview of a clip for the menu."""
+    if clip.is_image:
+        format_name = (clip.media_type or "image").split("/")[-1].upper()
+        return f"Image ({format_name}, {max(1, clip.size // 1024)} KB)"
+
+    preview = " ".join(clip.text.split())
+    if len(preview) > PREVIEW_LENGTH:
+        preview = preview[: PREVIEW_LENGTH - 1] + "…"
+    return preview
+
+
+class ClipboardHistoryMenuProvider:
+    """Provides a submenu of recent clipboard clips.
+
+    Clicking a clip puts it back on the clipboard, so the next prompt run
+    uses it as {{clipboard}} input. Shift+click sets it as context instead.
+    """
+
+    def __init__(
+        self,
+        clipboard_history: ClipboardHistory,
+        context_manager: ContextManager | None = None,
+        clipboard_manager=None,
+        notification_manager=None,
+    ):
+        self.clipboard_history = clipboard_history
+        self.context_manager = context_manager
+        self.clipboard_manager = clipboard_manager
+        self.notification_manager = notification_manager
+
+    def get_menu_items(self) -> list[MenuItem]:
+        """Return the clipboard history submenu, or nothing when history is empty."""
+        clips = self.clipboard_history.get_clips()
+        if not clips:
+            return []
+
+        submenu_items = []
+        for clip in clips:
+            item = MenuItem(
+                id=f"clipboard_clip_{clip.key}",
+                label=_clip_label(clip),
+                item_type=MenuItemType.SYSTEM,
+                action=lambda c=clip: self._restore_clip(c),
+                tooltip=None if clip.is_image else clip.text[:500],
+            )
+            item.alternative_action = lambda c=clip: self._set_clip_as_context(c)
+            submenu_items.append(item)
+
+        return [
+            MenuItem(
+                id="clipboard_history",
+                label="Clipboard history",
+                item_type=MenuItemType.SYSTEM,
+                action=lambda: None,
+                submenu_items=submenu_items,
+                icon="history",
+            )
+        ]
+
+    def _restore_clip(self, clip: Clip) -> None:
+        """Put a clip back on the system clipboard."""
+        try:
+            if clip.is_image:
+                from PySide6.QtWidgets import QApplication
+
+                from modules.utils.clipboard_image import write_clipboard_image
+
+                if not write_clipboard_image(QApplication.clipboard(), clip.image, clip.media_type):
+                    logger.warning("Failed to restore image clip to clipboard")
+                    return
+            elif self.clipboard_manager:
+                self.clipboard_manager.set_content(clip.text)
+            else:
+                return
+        except Exception as e:
+            logger.error(f"Failed to restore clip: {e}")
+            return
+
+        if self.notification_manager and is_notification_enabled("clipboard_copy"):
+            self.notification_manager.show_success_notification("Copied")
+
+    def _set_clip_as_context(self, clip: Clip) -> None:
+        """Replace the context with a clip."""
+        if not self.context_manager:
+            return
+
+        if clip.is_image:
+            self.context_manager.set_context_image(clip.image_base64(), clip.media_type)
+        else:
+            self.context_manager.set_context(clip.text)
+
+        if self.notification_manager and is_notification_enabled("context_set"):
+            self.notification_manager.show_success_notification("Context set")
+
+    def refresh(self) -> None:
+        """Refresh the provider's data."""
+        pass
@@ -1,26 +1,43 @@
 """PySide6-based context menu system for the Promptheus application."""
 
 import contextlib
+import logging
 import os
 import subprocess
+import time
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from modules.utils.system import is_linux, is_macos, is_wayland_session, is_windows
 
 from PySide6.QtCore import QEvent, QObject, QPoint, Qt, QTimer
-from PySide6.QtGui import QAction, QCursor
-from PySide6.QtWidgets import QApplication, QLabel, QMenu, QWidget, QWidgetAction
+from PySide6.QtGui import QAction, QActionEvent, QCursor
+from PySide6.QtWidgets import (
+    QApplication,
+    QGraphicsOpacityEffect,
+    QHBoxLayout,
+    QLabel,
+    QMenu,
+    QWidget,
+    QWidgetAction,
+)
 from shiboken6 import isValid
 
 from core.models import MenuItem, MenuItemType
-from modules.gui.icons import DISABLED_OPACITY
-from modules.gui.shared import MENU_STYLESHEET, TOOLTIP_STYLE
+from modules.gui.icons import DISABLED_OPACITY, ICON_COLOR_DISABLED, ICON_COLOR_NORMAL, create_icon_pixmap
+from modules.gui.shared import MENU_ITEM_STYLE, MENU_STYLESHEET, TOOLTIP_STYLE, IconButton, set_style_state
+from modules.prompts.prompt_search import PromptSearchIndex, SearchMatch
+from modules.utils.active_window import ActiveWindowCapture, capture_active_window
+
+logger = logging.getLogger(__name__)
 
 # Timer delay constants (in milliseconds)
 _MENU_SHOW_DELAY_MS = 50  # Delay before showing menu after focus grab
-_MENU_REBUILD_DELAY_MS = 10  # Delay before rebuilding menu after execution
+_MENU_REFRESH_DELAY_MS = 10  # Delay before refreshing the open menu after execution
 _FOCUS_RESTORE_DELAY_MS = 100  # Delay before restoring focus to previous window
-_MENU_TRANSITION_DELAY_MS = 50  # Delay for old menu cleanup during rebuild
+
+# Rows shown for a type-ahead filter; more than fit on screen only make every keystroke relayout them
+_MAX_FILTER_MATCHES = 20
 
 
 def _set_macos_window_move_to_active_space(widget):
@@ -175,6 +192,482 @@ class InvisibleFocusWindow(QWidget):
         super().closeEvent(event)
 
 
+@dataclass(frozen=True)
+class _ItemState:
+    """What a ClickableMenuItem displays for its menu item, compared to find what changed."""
+
+    label: str
+    icon: str | None
+    description: str | None
+    enabled: bool
+    disable_reason: str | None
+    is_recording_action: bool
+    is_executing_action: bool
+
+    @classmethod
+    def of(cls, item: MenuItem) -> "_ItemState":
+        data = item.data or {}
+        return cls(
+            label=item.label,
+            icon=item.icon,
+            description=item.tooltip,
+            enabled=item.enabled,
+            disable_reason=data.get("disable_reason"),
+            is_recording_action=data.get("is_recording_action", False),
+            is_executing_action=data.get("is_executing_action", False),
+        )
+
+    def same_mode(self, other: "_ItemState") -> bool:
+        """Check if enabled, disabled, recording and executing state all match."""
+        return (
+            self.enabled == other.enabled
+            and self.disable_reason == other.disable_reason
+            and self.is_recording_action == other.is_recording_action
+            and self.is_executing_action == other.is_executing_action
+        )
+
+
+class ClickableMenuItem(QWidget):
+    """Menu row for a prompt or action, retained across menu shows and patched via update_item()."""
+
+    def __init__(self, text, menu_item, context_menu):
+        super().__init__()
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self._menu_item = menu_item
+        self._context_menu = context_menu
+        self._disable_reason = None
+        self._is_recording_action = False
+        self._is_executing_action = False
+
+        # Styled by MENU_ITEM_STYLE on the menu; state changes only switch the "state" property
+        self.setObjectName("menuItem")
+        self.setFocusPolicy(Qt.StrongFocus)
+
+        # Layout
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(16, 8, 16, 8)
+        layout.setSpacing(8)
+
+        # Icon (optional)
+        self._icon_label = None
+        if menu_item.icon:
+            self._icon_label = QLabel()
+            self._update_icon()
+            self._icon_label.setFixedSize(16, 16)
+            layout.addWidget(self._icon_label)
+
+        # Text label
+        self._text_label = QLabel(text)
+        self._text_label.setObjectName("menuItemLabel")
+        layout.addWidget(self._text_label)
+
+        # State indicator icons (hidden by default) - stop first, then loader
+        self._stop_label = QLabel()
+        self._stop_label.setFixedSize(20, 20)
+        self._stop_label.setAlignment(Qt.AlignCenter)
+        self._stop_label.hide()
+        layout.addWidget(self._stop_label)
+
+        self._loader_label = QLabel()
+        self._loader_label.setFixedSize(20, 20)
+        self._loader_label.setAlignment(Qt.AlignCenter)
+        self._loader_label.hide()
+        layout.addWidget(self._loader_label)
+
+        layout.addStretch()
+
+        # Info icon for prompts with description (only for PROMPT items)
+        self._info_btn = None
+        if menu_item.item_type == MenuItemType.PROMPT:
+            self._info_btn = IconButton("info", size=16)
+            info_effect = QGraphicsOpacityEffect(self._info_btn)
+            info_effect.setOpacity(DISABLED_OPACITY)
+            self._info_btn.setGraphicsEffect(info_effect)
+            self._info_btn.setObjectName("menuItemButton")
+            self._info_btn.setCursor(Qt.ArrowCursor)
+            self._info_btn.hide()
+            layout.addWidget(self._info_btn)
+
+        # Mic button for alternative execution (only for PROMPT items)
+        self._mic_btn = None
+        if menu_item.item_type == MenuItemType.PROMPT:
+            self._mic_btn = IconButton("mic", size=16)
+            self._mic_btn.setObjectName("menuItemButton")
+            self._mic_btn.setCursor(Qt.PointingHandCursor)
+            self._mic_btn.setToolTip("Record voice input")
+            self._mic_btn.clicked.connect(self._on_mic_clicked)
+            layout.addWidget(self._mic_btn)
+
+        # Message share button (only for PROMPT items)
+        self._message_btn = None
+        if menu_item.item_type == MenuItemType.PROMPT:
+            self._message_btn = IconButton("message-square-share", size=16)
+            self._message_btn.setObjectName("menuItemButton")
+            self._message_btn.setCursor(Qt.PointingHandCursor)
+            self._message_btn.setToolTip("Send message to prompt")
+            self._message_btn.clicked.connect(self._on_message_share_clicked)
+            layout.addWidget(self._message_btn)
+
+    def _check_is_recording_action(self) -> bool:
+        """Check if this menu item is the currently recording action."""
+        if hasattr(self._context_menu, "menu_coordinator") and self._context_menu.menu_coordinator:
+            prompt_store_service = self._context_menu.menu_coordinator.prompt_store_service
+            if prompt_store_service:
+                recording_action_id = prompt_store_service.get_recording_action_id()
+                return recording_action_id == self._menu_item.id
+        return False
+
+    def can_update(self, menu_item: MenuItem) -> bool:
+        """Check if update_item() can patch this widget for menu_item (same type and icon slot)."""
+        return menu_item.item_type == self._menu_item.item_type and bool(menu_item.icon) == bool(self._icon_label)
+
+    def update_item(self, menu_item: MenuItem) -> bool:
+        """Patch the widget in place for a fresh MenuItem with the same identity.
+
+        Only the parts whose state changed are touched. Returns True if anything changed.
+        """
+        old = _ItemState.of(self._menu_item)
+        new = _ItemState.of(menu_item)
+        self._menu_item = menu_item
+        if old == new:
+            return False
+
+        if new.label != old.label:
+            self._text_label.setText(new.label)
+        if new.description != old.description:
+            self.set_description(new.description)
+        if new.icon != old.icon or new.enabled != old.enabled:
+            self._update_icon()
+        if not new.same_mode(old):
+            self._reset_state()
+            self.apply_item_state()
+        return True
+
+    def apply_item_state(self):
+        """Apply the executing, recording or disabled state carried by the menu item."""
+        data = self._menu_item.data or {}
+        if data.get("is_executing_action", False):
+            self.set_executing_action_state(True)
+        elif data.get("is_recording_action", False):
+            self.set_recording_action_state(True)
+        elif data.get("disable_reason"):
+            self.set_disabled_state(data["disable_reason"])
+        elif not self._menu_item.enabled:
+            self.setEnabled(False)
+
+    def _reset_state(self):
+        """Return to the enabled, idle state before another state is applied."""
+        self.setEnabled(True)
+        self.set_executing_action_state(False)
+        self.set_disabled_state(None)
+        self._is_recording_action = False
+        if self._mic_btn:
+            self._mic_btn.set_icon("mic")
+            self._mic_btn.setToolTip("Record voice input")
+        self._update_style(self.hasFocus())
+
+    def _update_icon(self):
+        if self._icon_label:
+            icon_color = ICON_COLOR_DISABLED if not self._menu_item.enabled else ICON_COLOR_NORMAL
+            self._icon_label.setPixmap(create_icon_pixmap(self._menu_item.icon, icon_color, 16))
+
+    def set_description(self, text):
+        """Set description - shows info icon with tooltip, hides it when there is none."""
+        if not self._info_btn:
+            return
+        if text:
+            wrapped_text = f'<div style="max-width: 800px;">{text}</div>'
+            self._info_btn.setToolTip(wrapped_text)
+            self._info_btn.show()
+        else:
+            self._info_btn.setToolTip("")
+            self._info_btn.hide()
+
+    def set_disabled_state(self, disable_reason: str | None):
+        """Set disabled state with visual feedback based on reason."""
+        self._disable_reason = disable_reason
+        self._is_recording_action = self._check_is_recording_action()
+
+        if disable_reason:
+            # Apply opacity effect to text label
+            text_effect = QGraphicsOpacityEffect(self._text_label)
+            text_effect.setOpacity(DISABLED_OPACITY)
+            self._text_label.setGraphicsEffect(text_effect)
+
+            # Apply opacity to icon if present
+            if self._icon_label:
+                icon_effect = QGraphicsOpacityEffect(self._icon_label)
+                icon_effect.setOpacity(DISABLED_OPACITY)
+                self._icon_label.setGraphicsEffect(icon_effect)
+
+            # Update text style
+            set_style_state(self._text_label, "disabled")
+
+            # Update mic button state based on reason - disabled with opacity
+            if self._mic_btn and disable_reason in ("recording", "executing"):
+                self._mic_btn.setEnabled(False)
+                self._mic_btn.setCursor(Qt.ArrowCursor)
+                # Apply opacity to disabled mic button
+                mic_effect = QGraphicsOpacityEffect(self._mic_btn)
+                mic_effect.setOpacity(DISABLED_OPACITY)
+                self._mic_btn.setGraphicsEffect(mic_effect)
+
+            # Message buttons stay enabled - no opacity effect (same as normal state)
+            if self._message_btn:
+                self._message_btn.setEnabled(True)
+                self._message_btn.setCursor(Qt.PointingHandCursor)
+                self._message_btn.setGraphicsEffect(None)
+        else:
+            # Clear opacity effects
+            self._text_label.setGraphicsEffect(None)
+            if self._icon_label:
+                self._icon_label.setGraphicsEffect(None)
+
+            # Restore normal text style
+            set_style_state(self._text_label, "normal")
+
+            # Enable buttons and clear any opacity effects
+            if self._mic_btn:
+                self._mic_btn.setEnabled(True)
+                self._mic_btn.setCursor(Qt.PointingHandCursor)
+                self._mic_btn.setGraphicsEffect(None)
+            if self._message_btn:
+                self._message_btn.setEnabled(True)
+                self._message_btn.setCursor(Qt.PointingHandCursor)
+                self._message_btn.setGraphicsEffect(None)
+
+    def set_recording_action_state(self, is_recording_action: bool):
+        """Set this item as the currently recording action."""
+        self._is_recording_action = is_recording_action
+
+        if is_recording_action and self._mic_btn:
+            # Clear opacity for this specific item since it's the active recording one
+            self.setGraphicsEffect(None)
+
+            # Restore normal text style
+            set_style_state(self, "recording")
+            set_style_state(self._text_label, "normal")
+
+            # Change mic icon to square (stop icon)
+            self._mic_btn.set_icon("square")
+            self._mic_btn.setToolTip("Stop recording")
+            self._mic_btn.setEnabled(True)
+            self._mic_btn.setCursor(Qt.PointingHandCursor)
+
+            # Message button stays enabled
+            if self._message_btn:
+                self._message_btn.setEnabled(True)
+                self._message_btn.setCursor(Qt.PointingHandCursor)
+
+    def set_executing_action_state(self, is_executing_action: bool):
+        """Set this item as the currently executing action."""
+        self._is_executing_action = is_executing_action
+
+        if is_executing_action:
+            # Clear any disabled opacity effects
+            self.setGraphicsEffect(None)
+            set_style_state(self, "executing")
+            set_style_state(self._text_label, "normal")
+            self._text_label.setGraphicsEffect(None)
+            if self._icon_label:
+                self._icon_label.setGraphicsEffect(None)
+
+            # Show stop icon first (in font color), then loader icon
+            stop_pixmap = create_icon_pixmap("square", "#f0f0f0", 14)
+            self._stop_label.setPixmap(stop_pixmap)
+            self._stop_label.show()
+
+            loader_pixmap = create_icon_pixmap("loader", ICON_COLOR_DISABLED, 14)
+            self._loader_label.setPixmap(loader_pixmap)
+            self._loader_label.show()
+
+            # Apply slight opacity to loader only
+            loader_effect = QGraphicsOpacityEffect(self._loader_label)
+            loader_effect.setOpacity(0.85)
+            self._loader_label.setGraphicsEffect(loader_effect)
+
+            # Start rotation animation for loader
+            self._start_loader_animation()
+
+            # Disable mic button during execution
+            if self._mic_btn:
+                self._mic_btn.setEnabled(False)
+                self._mic_btn.setCursor(Qt.ArrowCursor)
+                mic_effect = QGraphicsOpacityEffect(self._mic_btn)
+                mic_effect.setOpacity(DISABLED_OPACITY)
+                self._mic_btn.setGraphicsEffect(mic_effect)
+
+            # Message button stays enabled
+            if self._message_btn:
+                self._message_btn.setEnabled(True)
+                self._message_btn.setCursor(Qt.PointingHandCursor)
+        else:
+            # Hide indicators
+            if self._loader_label:
+                self._loader_label.hide()
+            if self._stop_label:
+                self._stop_label.hide()
+            self._stop_loader_animation()
+
+    def _start_loader_animation(self):
+        """Show a static hourglass icon during execution."""
+        pixmap = create_icon_pixmap("hourglass", ICON_COLOR_DISABLED, 14)
+        self._loader_label.setPixmap(pixmap)
+
+    def _stop_loader_animation(self):
+        """Clear the loader icon."""
+        pass
+
+    def _update_style(self, highlighted: bool):
+        """Update styles for highlight state."""
+        # Don't update style if disabled (keep disabled appearance)
+        if self._disable_reason and not self._is_recording_action and not self._is_executing_action:
+            return
+
+        if highlighted:
+            set_style_state(self, "hover")
+            set_style_state(self._text_label, "hover")
+        else:
+            set_style_state(self, self._idle_state())
+            set_style_state(self._text_label, "normal" if self._menu_item.enabled else "disabled")
+
+    def _idle_state(self) -> str:
+        """Row state when not highlighted."""
+        if self._is_executing_action:
+            return "executing"
+        if self._is_recording_action:
+            return "recording"
+        return "normal"
+
+    def _on_message_share_clicked(self):
+        """Handle message share button click."""
+        # Message button is always enabled, so allow this
+        # Close the menu
+        if self._context_menu.menu:
+            self._context_menu.menu.close()
+        if self._context_menu.focus_window:
+            self._context_menu.focus_window.hide()
+
+        # Get prompt store service, context manager, clipboard manager, and notification manager from menu coordinator
+        prompt_store_service = None
+        context_manager = None
+        clipboard_manager = None
+        notification_manager = None
+        history_service = None
+        if hasattr(self._context_menu, "menu_coordinator") and self._context_menu.menu_coordinator:
+            prompt_store_service = self._context_menu.menu_coordinator.prompt_store_service
+            context_manager = self._context_menu.menu_coordinator.context_manager
+            notification_manager = self._context_menu.menu_coordinator.notification_manager
+            if prompt_store_service:
+                if hasattr(prompt_store_service, "clipboard_manager"):
+                    clipboard_manager = prompt_store_service.clipboard_manager
+                if hasattr(prompt_store_service, "history_service"):
+                    history_service = prompt_store_service.history_service
+
+        # Open message share dialog
+        from modules.gui.prompt_execute_dialog import show_prompt_execute_dialog
+
+        show_prompt_execute_dialog(
+            self._menu_item,
+            self._context_menu.execution_callback,
+            prompt_store_service=prompt_store_service,
+            context_manager=context_manager,
+            clipboard_manager=clipboard_manager,
+            notification_manager=notification_manager,
+            history_service=history_service,
+        )
+
+    def _on_mic_clicked(self):
+        """Handle mic button click - trigger alternative execution (speech input)."""
+        # For recording action, this stops recording (always allowed)
+        # For non-recording actions when enabled
+        if self._context_menu.execution_callback and (self._is_recording_action or self._menu_item.enabled):
+            # True = shift_pressed, triggers alternative execution (speech-to-text)
+            self._context_menu.execution_callback(self._menu_item, True)
+            self._context_menu._close_and_restore_focus()
+
+    def mousePressEvent(self, event):
+        # Check if click is on a button - if so, let the button handle it
+        if self._mic_btn and self._mic_btn.geometry().contains(event.pos()):
+            return super().mousePressEvent(event)
+        if self._message_btn and self._message_btn.geometry().contains(event.pos()):
+            return super().mousePressEvent(event)
+
+        # For text area clicks, check if action is enabled
+        if event.button() == Qt.LeftButton:
+            # If this is the executing action, clicking cancels execution
+            if self._is_executing_action:
+                if hasattr(self._context_menu, "menu_coordinator") and self._context_menu.menu_coordinator:
+                    # Cancel will emit execution_completed signal which triggers auto-refresh
+                    self._context_menu.menu_coordinator.prompt_store_service.cancel_current_execution()
+                event.accept()
+                return
+
+            # Block if disabled (but allow if this is the recording action for stopping)
+            if self._disable_reason and not self._is_recording_action:
+                event.ignore()
+                return
+
+            if (self._menu_item.enabled or self._is_recording_action) and self._context_menu.execution_callback:
+                shift_pressed = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+                self._context_menu.execution_callback(self._menu_item, shift_pressed)
+                self._context_menu._close_and_restore_focus()
+
+    @property
+    def _is_interactive(self):
+        return self._menu_item.enabled or self._is_recording_action or self._is_executing_action
+
+    def enterEvent(self, event):
+        if self._is_interactive:
+            self._update_style(True)
+            self._context_menu.hovered_widgets.add(self)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        if self._is_interactive and not self.hasFocus():
+            self._update_style(False)
+            self._context_menu.hovered_widgets.discard(self)
+        super().leaveEvent(event)
+
+    def focusInEvent(self, event):
+        if self._is_interactive:
+            self._update_style(True)
+        super().focusInEvent(event)
+
+    def focusOutEvent(self, event):
+        if self._is_interactive:
+            self._update_style(False)
+        super().focusOutEvent(event)
+
+    def keyPressEvent(self, event):
+        if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+            # If this is the executing action, Enter cancels execution
+            if self._is_executing_action:
+                if hasattr(self._context_menu, "menu_coordinator") and self._context_menu.menu_coordinator:
+                    # Cancel will emit execution_completed signal which triggers auto-refresh
+                    self._context_menu.menu_coordinator.prompt_store_service.cancel_current_execution()
+                event.accept()
+                return
+
+            if (self._menu_item.enabled or self._is_recording_action) and self._context_menu.execution_callback:
+                shift_pressed = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+                self._context_menu.execution_callback(self._menu_item, shift_pressed)
+                self._context_menu._close_and_restore_focus()
+            event.accept()
+        else:
+            super().keyPressEvent(event)
+
+
+@dataclass(slots=True)
+class _FilterRow:
+    """A menu action as seen by the type-ahead filter; visible mirrors action.isVisible()."""
+
+    action: QAction
+    widget: QWidget | None
+    prompt_id: str | None
+    visible: bool = True
+
+
 class PyQtContextMenu(QObject):
     """PyQt5-based context menu implementation with keyboard navigation."""
 
@@ -188,7 +681,7 @@ class PyQtContextMenu(QObject):
         self.shift_pressed = False
         self.event_filter_installed = False
         self.hovered_widgets = set()
-        self.original_active_window = None
+        self.original_active_window: ActiveWindowCapture | None = None
         self.qt_active_window = None
         self.focus_window: InvisibleFocusWindow | None = None
         self.number_input_buffer = ""
@@ -198,27 +691,70 @@ class PyQtContextMenu(QObject):
         self._cleanable_widgets = []
         self._execution_signal_connected = False
         self._last_menu_position = None
-        self._is_rebuilding_menu = False
+        self._refresh_pending = False
         self._navigable_widgets: list = []
         self._nav_index: int = -1
-
-        self._menu_stylesheet = MENU_STYLESHEET + TOOLTIP_STYLE
+        self._show_requested_at: float | None = None
+        self._last_prepare_ms = 0.0
+        self.last_show_latency_ms: float | None = None
+        self._filter_text = ""
+        self._filter_action: QWidgetAction | None = None
+        self._filter_label: QLabel | None = None
+        self._filter_rows: list[_FilterRow] | None = None
+        self._deferring_action_changes = False
+        self._app_event_filter_installed = False
+
+        self._menu_stylesheet = MENU_STYLESHEET + MENU_ITEM_STYLE + TOOLTIP_STYLE
 
     def set_execution_callback(self, callback: Callable):
         """Set callback for menu item execution."""
         self.execution_callback = callback
 
-    def create_menu(self, items: list[MenuItem]) -> QMenu:
-        """Create a QMenu from menu items with keyboard navigation support."""
-        # Clean up any existing tracked widgets before creating new menu
-        for widget in self._cleanable_widgets:
-            try:
-                if hasattr(widget, "cleanup") and callable(widget.cleanup) and isValid(widget):
-                    widget.cleanup()
-            except Exception:
-                pass
-        self._cleanable_widgets.clear()
+    def prepare_menu(self, items: list[MenuItem]) -> QMenu:
+        """Build the menu on first use, then patch it in place to match items.
+
+        The QMenu and its item widgets are retained between shows: items are
+        matched by identity, so only new items get widgets and only changed
+        items are updated.
+        """
+        started = time.perf_counter()
+        if self.menu is None or not isValid(self.menu):
+            self.menu = self._create_menu_widget()
+
+        # Keep the keyboard position when the open menu is refreshed
+        selected = None
+        if 0 <= self._nav_index < len(self._navigable_widgets):
+            selected = self._navigable_widgets[self._nav_index]
+
+        self.menu.removeAction(self._filter_action)
+        self._sync_menu_items(self.menu, items)
+        self._filter_rows = None
+        if self._filter_text:
+            # New rows arrive visible; hide the ones the active filter excludes
+            self._apply_filter()
+
+        self._update_navigable_widgets(selected)
 
+        self._last_prepare_ms = (time.perf_counter() - started) * 1000
+        return self.menu
+
+    def _update_navigable_widgets(self, selected: QWidget | None = None) -> None:
+        """Collect the visible rows for arrow-key navigation, keeping selected if it is still shown."""
+        self._navigable_widgets = []
+        if self._filter_rows is not None:
+            for row in self._filter_rows:
+                if row.visible and hasattr(row.widget, "_menu_item"):
+                    self._navigable_widgets.append(row.widget)
+        else:
+            for action in self.menu.actions():
+                if isinstance(action, QWidgetAction) and action.isVisible():
+                    widget = action.defaultWidget()
+                    if widget and hasattr(widget, "_menu_item"):
+                        self._navigable_widgets.append(widget)
+        self._nav_index = next((i for i, w in enumerate(self._navigable_widgets) if w is selected), -1)
+
+    def _create_menu_widget(self) -> QMenu:
+        """Create the empty top-level QMenu with keyboard navigation support."""
         menu = QMenu(self.parent)
 
         # Configure window flags for better focus behavior when triggered from external apps
@@ -237,24 +773,23 @@ class PyQtContextMenu(QObject):
         # Enable keyboard navigation with strong focus
         menu.setFocusPolicy(Qt.StrongFocus)
 
-        # Reset shift state and install event filter
-        self.shift_pressed = False
+        # Install event filter
         self.event_filter_installed = True
         menu.installEventFilter(self)
 
-        self._add_menu_items(menu, items)
-
-        self._navigable_widgets = []
-        for action in menu.actions():
-            if isinstance(action, QWidgetAction):
-                widget = action.defaultWidget()
-                if widget and hasattr(widget, "_menu_item"):
-                    self._navigable_widgets.append(widget)
-        self._nav_index = -1
-
         # Connect menu aboutToHide signal to cleanup number timer
         menu.aboutToHide.connect(self._on_menu_about_to_hide)
 
+        # Header showing the type-ahead filter; only in the menu while a filter is active
+        self._filter_label = QLabel()
+        self._filter_label.setObjectName("menuFilter")
+        self._filter_label.setTextFormat(Qt.PlainText)
+        self._filter_action = QWidgetAction(menu)
+        self._filter_action.setDefaultWidget(self._filter_label)
+        self._filter_action.setEnabled(False)
+        self._filter_text = ""
+        self._filter_rows = None
+
         return menu
 
     def create_submenu(self, parent_menu: QMenu, title: str, items: list[MenuItem]) -> QMenu:
@@ -268,20 +803,28 @@ class PyQtContextMenu(QObject):
         submenu.setFocusPolicy(Qt.StrongFocus)
         submenu.installEventFilter(self)
 
-        self._add_menu_items(submenu, items)
+        self._sync_menu_items(submenu, items)
         return submenu
 
-    def show_at_cursor(self, items: list[MenuItem]) -> None:
+    def show_at_cursor(self, items: list[MenuItem], requested_at: float | None = None) -> None:
         """Show context menu at cursor position."""
         cursor_pos = self.get_cursor_position()
-        self.show_at_position(items, cursor_pos)
+        self.show_at_position(items, cursor_pos, requested_at)
+
+    def show_at_position(
+        self, items: list[MenuItem], position: tuple[int, int], requested_at: float | None = None
+    ) -> None:
+        """Show context menu at specific position with invisible focus window for keyboard navigation.
 
-    def show_at_position(self, items: list[MenuItem], position: tuple[int, int]) -> None:
-        """Show context menu at specific position with invisible focus window for keyboard navigation."""
+        requested_at is the time.perf_counter() value of the hotkey press; the
+        delay until the menu is visible is logged and kept in last_show_latency_ms.
+        """
         if not items:
             return
 
         try:
+            self._show_requested_at = requested_at if requested_at is not None else time.perf_counter()
+
             # Store both Qt and external application info
             self._store_qt_active_window()
             self._store_active_window()
@@ -291,7 +834,7 @@ class PyQtContextMenu(QObject):
 
             self.shift_pressed = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
 
-            self.menu = self.create_menu(items)
+            self.prepare_menu(items)
 
             # Calculate anchor offset to position cursor at prompts section
             anchor_offset = self._calculate_anchor_offset()
@@ -314,6 +857,7 @@ class PyQtContextMenu(QObject):
 
             # Install global event filter to detect clicks outside menu
             QApplication.instance().installEventFilter(self)
+            self._app_event_filter_installed = True
 
         except Exception as e:
             print(f"Menu show error: {e}")
@@ -384,59 +928,30 @@ class PyQtContextMenu(QObject):
         self._execution_signal_connected = False
 
     def _on_execution_completed_while_open(self, result):
-        """Refresh menu when execution completes while open."""
-        if result and hasattr(result, "metadata") and result.metadata:
-            action = result.metadata.get("action", "")
-            if action == "speech_recording_started":
-                return
-
+        """Refresh menu when execution completes or recording toggles while open."""
+        if self._refresh_pending:
+            return
         if self.menu and self.menu.isVisible() and self._last_menu_position:
-            QTimer.singleShot(_MENU_REBUILD_DELAY_MS, self._rebuild_and_show_menu)
+            self._refresh_pending = True
+            QTimer.singleShot(_MENU_REFRESH_DELAY_MS, self._refresh_open_menu)
+
+    def _refresh_open_menu(self):
+        """Diff fresh items against the open menu and update only the rows that changed.
 
-    def _rebuild_and_show_menu(self):
-        """Rebuild and show the menu at the stored position."""
+        The menu stays open and is never recreated.
+        """
+        self._refresh_pending = False
         if not hasattr(self, "menu_coordinator") or not self.menu_coordinator:
             return
 
-        pos = self._last_menu_position
-        if not pos:
+        if not self._last_menu_position or not self.menu or not self.menu.isVisible():
             return
 
         items = self.menu_coordinator._get_all_menu_items()
         if not items:
             return
 
-        self._is_rebuilding_menu = True
-
-        old_menu = self.menu
-        self.menu = self.create_menu(items)
-
-        # Show new menu FIRST (before closing old) to prevent blink
-        if self.focus_window:
-            self.focus_window.menu = self.menu
-            self.focus_window._show_menu_at_position(pos)
-
-        # Close old menu AFTER showing new one
-        # Disconnect signals first to prevent cleanup from affecting new menu
-        if old_menu:
-            try:
-                if isValid(old_menu):
-                    old_menu.aboutToHide.disconnect()
-                    old_menu.hide()
-                    QTimer.singleShot(_MENU_TRANSITION_DELAY_MS, lambda: self._cleanup_old_menu(old_menu))
-            except Exception:
-                pass
-
-        QTimer.singleShot(_FOCUS_RESTORE_DELAY_MS, lambda: setattr(self, "_is_rebuilding_menu", False))
-
-    def _cleanup_old_menu(self, menu):
-        """Clean up old menu after transition."""
-        try:
-            if menu and isValid(menu):
-                menu.close()
-                menu.deleteLater()
-        except Exception:
-            pass
+        self.prepare_menu(items)
 
     def _cleanup_menu(self):
         """Internal cleanup method."""
@@ -472,6 +987,10 @@ class PyQtContextMenu(QObject):
         # Clean up number input timer
         self.number_timer.stop()
         self.number_input_buffer = ""
+        self._filter_text = ""
+        self._filter_rows = None
+        self._filter_action = None
+        self._filter_label = None
         self.event_filter_installed = False
         self.hovered_widgets.clear()
 
@@ -479,39 +998,136 @@ class PyQtContextMenu(QObject):
         self.original_active_window = None
         self.qt_active_window = None
 
-    def _add_menu_items(self, menu: QMenu, items: list[MenuItem]) -> None:
-        """Add menu items to a QMenu."""
+    @staticmethod
+    def _item_key(item: MenuItem) -> str:
+        """Identity of a menu item across menu builds."""
+        kind = "submenu" if item.submenu_items else item.item_type.value
+        return f"{kind}:{item.id}"
+
+    def _sync_menu_items(self, menu: QMenu, items: list[MenuItem]) -> None:
+        """Make menu show items, reusing the actions of items it already shows.
+
+        Existing actions are patched in place, new items get new actions, and
+        actions are only removed and re-added when the order changes.
+        """
+        existing = {}
+        for action in menu.actions():
+            key = action.property("item_key")
+            if key:
+                existing[key] = action
+
+        layout: list[QAction | None] = []  # None marks a separator
+        seen: dict[str, int] = {}
         for item in items:
-            if item.item_type == MenuItemType.CONTEXT:
-                action = self._create_context_section_item(menu, item)
-                if action:
-                    if item.section_id:
-                        action.setProperty("section_id", item.section_id)
-                    menu.addAction(action)
-            elif item.item_type == MenuItemType.LAST_INTERACTION:
-                action = self._create_last_interaction_section_item(menu, item)
+            key = self._item_key(item)
+            seen[key] = seen.get(key, 0) + 1
+            if seen[key] > 1:
+                key = f"{key}#{seen[key]}"
+
+            action = existing.pop(key, None)
+            if action is not None and not self._update_action(menu, action, item):
+                self._discard_action(menu, action)
+                action = None
+            if action is None:
+                action = self._create_action(menu, item)
                 if action:
-                    if item.section_id:
-                        action.setProperty("section_id", item.section_id)
-                    menu.addAction(action)
-            elif item.item_type == MenuItemType.SETTINGS_SECTION:
-                action = self._create_settings_section_item(menu, item)
-                if action:
-                    if item.section_id:
-                        action.setProperty("section_id", item.section_id)
-                    menu.addAction(action)
-            elif hasattr(item, "submenu_items") and item.submenu_items:
-                # Create submenu with consistent styling
-                submenu = self.create_submenu(menu, item.label, item.submenu_items)
-                submenu_action = menu.addMenu(submenu)
-                submenu_action.setEnabled(item.enabled)
-            else:
-                action = self._create_custom_menu_item(menu, item)
-                if action:
-                    menu.addAction(action)
+                    action.setProperty("item_key", key)
+
+            if action:
+                if item.section_id:
+                    action.setProperty("section_id", item.section_id)
+                layout.append(action)
+            if item.separator_after:
+                layout.append(None)
+
+        for action in existing.values():
+            self._discard_action(menu, action)
+
+        # Move only the actions that are out of place; re-adding every action is slow in QMenu
+        current = menu.actions()
+        for index, wanted in enumerate(layout):
+            present = current[index] if index < len(current) else None
+            if wanted is None:
+                if present is not None and present.isSeparator():
+                    continue
+                separator = menu.insertSeparator(present) if present is not None else menu.addSeparator()
+                current.insert(index, separator)
+            elif present is not wanted:
+                if present is not None:
+                    menu.insertAction(present, wanted)
+                else:
+                    menu.addAction(wanted)
+                for later in range(index + 1, len(current)):
+                    if current[later] is wanted:
+                        del current[later]
+                        break
+                current.insert(index, wanted)
+        for action in current[len(layout) :]:
+            menu.removeAction(action)
+            if action.isSeparator():
+                action.deleteLater()
+
+    def _create_action(self, menu: QMenu, item: MenuItem) -> QAction | None:
+        """Create the action for a menu item without adding it to the menu."""
+        if item.item_type == MenuItemType.CONTEXT:
+            return self._create_context_section_item(menu, item)
+        if item.item_type == MenuItemType.LAST_INTERACTION:
+            return self._create_last_interaction_section_item(menu, item)
+        if item.item_type == MenuItemType.SETTINGS_SECTION:
+            return self._create_settings_section_item(menu, item)
+        if item.submenu_items:
+            # Create submenu with consistent styling
+            submenu = self.create_submenu(menu, item.label, item.submenu_items)
+            submenu_action = submenu.menuAction()
+            submenu_action.setEnabled(item.enabled)
+            return submenu_action
+        return self._create_custom_menu_item(menu, item)
+
+    def _update_action(self, menu: QMenu, action: QAction, item: MenuItem) -> bool:
+        """Patch an existing action for a fresh item; returns False if it has to be recreated."""
+        if item.submenu_items:
+            submenu = action.menu()
+            if submenu is None:
+                return False
+            submenu.setTitle(item.label)
+            self._sync_menu_items(submenu, item.submenu_items)
+            action.setEnabled(item.enabled)
+            return True
+
+        widget = action.defaultWidget() if isinstance(action, QWidgetAction) else None
+        if widget is None:
+            return False
+        if item.item_type in (MenuItemType.CONTEXT, MenuItemType.LAST_INTERACTION):
+            # These sections subscribe to context and history changes and keep themselves current
+            return True
+        if item.item_type == MenuItemType.SETTINGS_SECTION:
+            if not item.data:
+                return False
+            widget.update_model(item.data.get("current_model", "None"), item.data.get("model_options", []))
+            widget.update_prompt(item.data.get("current_prompt", "None"), item.data.get("prompt_options", []))
+            return True
+        if isinstance(widget, ClickableMenuItem) and widget.can_update(item):
+            if widget.update_item(item):
+                # The row may have changed size; QMenu only re-measures rows on action events
+                QApplication.sendEvent(menu, QActionEvent(QEvent.ActionChanged, action))
+            return True
+        return False
 
-            if hasattr(item, "separator_after") and item.separator_after:
-                menu.addSeparator()
+    def _discard_action(self, menu: QMenu, action: QAction) -> None:
+        """Remove an action whose item is gone and release its widget."""
+        menu.removeAction(action)
+        submenu = action.menu()
+        if submenu is not None:
+            submenu.deleteLater()
+            return
+        if isinstance(action, QWidgetAction):
+            widget = action.defaultWidget()
+            if widget in self._cleanable_widgets:
+                with contextlib.suppress(Exception):
+                    widget.cleanup()
+                self._cleanable_widgets.remove(widget)
+            self.hovered_widgets.discard(widget)
+        action.deleteLater()
 
     def _create_context_section_item(self, menu: QMenu, item: MenuItem) -> QAction | None:
         """Create a context section widget action."""
@@ -585,469 +1201,15 @@ class PyQtContextMenu(QObject):
 
     def _create_custom_menu_item(self, menu: QMenu, item: MenuItem) -> QAction | None:
         """Create a custom menu item with hover effects."""
-        from PySide6.QtWidgets import QGraphicsOpacityEffect, QHBoxLayout
-
-        from modules.gui.icons import ICON_COLOR_DISABLED, ICON_COLOR_NORMAL, create_icon_pixmap
-        from modules.gui.shared.context_widgets import IconButton
-
-        class ClickableMenuItem(QWidget):
-            def __init__(self, text, menu_item, context_menu):
-                super().__init__()
-                self.setAttribute(Qt.WA_StyledBackground, True)
-                self._menu_item = menu_item
-                self._context_menu = context_menu
-                self._disable_reason = None
-                self._is_recording_action = False
-                self._is_executing_action = False
-
-                self._normal_style = """
-                    QWidget {
-                        background-color: transparent;
-                        border-radius: 4px;
-                        margin: 1px;
-                    }
-                """
-                self._hover_style = """
-                    QWidget {
-                        background-color: #454545;
-                        border-radius: 4px;
-                        margin: 1px;
-                    }
-                """
-                self._label_style = """
-                    QLabel {
-                        background: transparent;
-                        color: #f0f0f0;
-                        font-size: 13px;
-                    }
-                """
-                self._label_hover_style = """
-                    QLabel {
-                        background: transparent;
-                        color: #ffffff;
-                        font-size: 13px;
-                    }
-                """
-                self._label_disabled_style = """
-                    QLabel {
-                        background: transparent;
-                        color: #666666;
-                        font-size: 13px;
-                    }
-                """
-
-                self.setStyleSheet(self._normal_style)
-                self.setFocusPolicy(Qt.StrongFocus)
-
-                # Layout
-                layout = QHBoxLayout(self)
-                layout.setContentsMargins(16, 8, 16, 8)
-                layout.setSpacing(8)
-
-                # Icon (optional)
-                self._icon_label = None
-                if menu_item.icon:
-                    self._icon_label = QLabel()
-                    icon_color = ICON_COLOR_DISABLED if not menu_item.enabled else ICON_COLOR_NORMAL
-                    pixmap = create_icon_pixmap(menu_item.icon, icon_color, 16)
-                    self._icon_label.setPixmap(pixmap)
-                    self._icon_label.setFixedSize(16, 16)
-                    self._icon_label.setStyleSheet("background: transparent;")
-                    layout.addWidget(self._icon_label)
-
-                # Text label
-                self._text_label = QLabel(text)
-                self._text_label.setStyleSheet(self._label_style)
-                layout.addWidget(self._text_label)
-
-                # State indicator icons (hidden by default) - stop first, then loader
-                self._stop_label = QLabel()
-                self._stop_label.setFixedSize(20, 20)
-                self._stop_label.setStyleSheet("background: transparent;")
-                self._stop_label.setAlignment(Qt.AlignCenter)
-                self._stop_label.hide()
-                layout.addWidget(self._stop_label)
-
-                self._loader_label = QLabel()
-                self._loader_label.setFixedSize(20, 20)
-                self._loader_label.setStyleSheet("background: transparent;")
-                self._loader_label.setAlignment(Qt.AlignCenter)
-                self._loader_label.hide()
-                layout.addWidget(self._loader_label)
-
-                layout.addStretch()
-
-                # Info icon for prompts with description (only for PROMPT items)
-                self._info_btn = None
-                if menu_item.item_type == MenuItemType.PROMPT:
-                    self._info_btn = IconButton("info", size=16)
-                    info_effect = QGraphicsOpacityEffect(self._info_btn)
-                    info_effect.setOpacity(DISABLED_OPACITY)
-                    self._info_btn.setGraphicsEffect(info_effect)
-                    self._info_btn.setStyleSheet("""
-                        QPushButton {
-                            background: transparent;
-                            border: none;
-                            padding: 2px;
-                            min-width: 20px;
-                            max-width: 20px;
-                            min-height: 20px;
-                            max-height: 20px;
-                        }
-                    """)
-                    self._info_btn.setCursor(Qt.ArrowCursor)
-                    self._info_btn.hide()
-                    layout.addWidget(self._info_btn)
-
-                # Mic button for alternative execution (only for PROMPT items)
-                self._mic_btn = None
-                if menu_item.item_type == MenuItemType.PROMPT:
-                    self._mic_btn = IconButton("mic", size=16)
-                    self._mic_btn.setStyleSheet("""
-                        QPushButton {
-                            background: transparent;
-                            border: none;
-                            padding: 2px;
-                            min-width: 20px;
-                            max-width: 20px;
-                            min-height: 20px;
-                            max-height: 20px;
-                        }
-                    """)
-                    self._mic_btn.setCursor(Qt.PointingHandCursor)
-                    self._mic_btn.setToolTip("Record voice input")
-                    self._mic_btn.clicked.connect(self._on_mic_clicked)
-                    layout.addWidget(self._mic_btn)
-
-                # Message share button (only for PROMPT items)
-                self._message_btn = None
-                if menu_item.item_type == MenuItemType.PROMPT:
-                    self._message_btn = IconButton("message-square-share", size=16)
-                    self._message_btn.setStyleSheet("""
-                        QPushButton {
-                            background: transparent;
-                            border: none;
-                            padding: 2px;
-                            min-width: 20px;
-                            max-width: 20px;
-                            min-height: 20px;
-                            max-height: 20px;
-                        }
-                    """)
-                    self._message_btn.setCursor(Qt.PointingHandCursor)
-                    self._message_btn.setToolTip("Send message to prompt")
-                    self._message_btn.clicked.connect(self._on_message_share_clicked)
-                    layout.addWidget(self._message_btn)
-
-            def _check_is_recording_action(self) -> bool:
-                """Check if this menu item is the currently recording action."""
-                if hasattr(self._context_menu, "menu_coordinator") and self._context_menu.menu_coordinator:
-                    prompt_store_service = self._context_menu.menu_coordinator.prompt_store_service
-                    if prompt_store_service:
-                        recording_action_id = prompt_store_service.get_recording_action_id()
-                        return recording_action_id == self._menu_item.id
-                return False
-
-            def set_description(self, text):
-                """Set description - shows info icon with tooltip."""
-                if self._info_btn and text:
-                    wrapped_text = f'<div style="max-width: 800px;">{text}</div>'
-                    self._info_btn.setToolTip(wrapped_text)
-                    self._info_btn.show()
-
-            def set_disabled_state(self, disable_reason: str | None):
-                """Set disabled state with visual feedback based on reason."""
-                self._disable_reason = disable_reason
-                self._is_recording_action = self._check_is_recording_action()
-
-                if disable_reason:
-                    # Apply opacity effect to text label
-                    text_effect = QGraphicsOpacityEffect(self._text_label)
-                    text_effect.setOpacity(DISABLED_OPACITY)
-                    self._text_label.setGraphicsEffect(text_effect)
-
-                    # Apply opacity to icon if present
-                    if self._icon_label:
-                        icon_effect = QGraphicsOpacityEffect(self._icon_label)
-                        icon_effect.setOpacity(DISABLED_OPACITY)
-                        self._icon_label.setGraphicsEffect(icon_effect)
-
-                    # Update text style
-                    self._text_label.setStyleSheet(self._label_disabled_style)
-
-                    # Update mic button state based on reason - disabled with opacity
-                    if self._mic_btn and disable_reason in ("recording", "executing"):
-                        self._mic_btn.setEnabled(False)
-                        self._mic_btn.setCursor(Qt.ArrowCursor)
-                        # Apply opacity to disabled mic button
-                        mic_effect = QGraphicsOpacityEffect(self._mic_btn)
-                        mic_effect.setOpacity(DISABLED_OPACITY)
-                        self._mic_btn.setGraphicsEffect(mic_effect)
-
-                    # Message buttons stay enabled - no opacity effect (same as normal state)
-                    if self._message_btn:
-                        self._message_btn.setEnabled(True)
-                        self._message_btn.setCursor(Qt.PointingHandCursor)
-                        self._message_btn.setGraphicsEffect(None)
-                else:
-                    # Clear opacity effects
-                    self._text_label.setGraphicsEffect(None)
-                    if self._icon_label:
-                        self._icon_label.setGraphicsEffect(None)
-
-                    # Restore normal text style
-                    self._text_label.setStyleSheet(self._label_style)
-
-                    # Enable buttons and clear any opacity effects
-                    if self._mic_btn:
-                        self._mic_btn.setEnabled(True)
-                        self._mic_btn.setCursor(Qt.PointingHandCursor)
-                        self._mic_btn.setGraphicsEffect(None)
-                    if self._message_btn:
-                        self._message_btn.setEnabled(True)
-                        self._message_btn.setCursor(Qt.PointingHandCursor)
-                        self._message_btn.setGraphicsEffect(None)
-
-            def set_recording_action_state(self, is_recording_action: bool):
-                """Set this item as the currently recording action."""
-                self._is_recording_action = is_recording_action
-
-                if is_recording_action and self._mic_btn:
-                    # Clear opacity for this specific item since it's the active recording one
-                    self.setGraphicsEffect(None)
-
-                    # Restore normal text style
-                    self._text_label.setStyleSheet(self._label_style)
-
-                    # Change mic icon to square (stop icon)
-                    self._mic_btn.set_icon("square")
-                    self._mic_btn.setToolTip("Stop recording")
-                    self._mic_btn.setEnabled(True)
-                    self._mic_btn.setCursor(Qt.PointingHandCursor)
-
-                    # Message button stays enabled
-                    if self._message_btn:
-                        self._message_btn.setEnabled(True)
-                        self._message_btn.setCursor(Qt.PointingHandCursor)
-
-            def set_executing_action_state(self, is_executing_action: bool):
-                """Set this item as the currently executing action."""
-                self._is_executing_action = is_executing_action
-
-                if is_executing_action:
-                    # Clear any disabled opacity effects
-                    self.setGraphicsEffect(None)
-                    self._text_label.setStyleSheet(self._label_style)
-                    self._text_label.setGraphicsEffect(None)
-                    if self._icon_label:
-                        self._icon_label.setGraphicsEffect(None)
-
-                    # Show stop icon first (in font color), then loader icon
-                    stop_pixmap = create_icon_pixmap("square", "#f0f0f0", 14)
-                    self._stop_label.setPixmap(stop_pixmap)
-                    self._stop_label.show()
-
-                    loader_pixmap = create_icon_pixmap("loader", ICON_COLOR_DISABLED, 14)
-                    self._loader_label.setPixmap(loader_pixmap)
-                    self._loader_label.show()
-
-                    # Apply slight opacity to loader only
-                    loader_effect = QGraphicsOpacityEffect(self._loader_label)
-                    loader_effect.setOpacity(0.85)
-                    self._loader_label.setGraphicsEffect(loader_effect)
-
-                    # Start rotation animation for loader
-                    self._start_loader_animation()
-
-                    # Disable mic button during execution
-                    if self._mic_btn:
-                        self._mic_btn.setEnabled(False)
-                        self._mic_btn.setCursor(Qt.ArrowCursor)
-                        mic_effect = QGraphicsOpacityEffect(self._mic_btn)
-                        mic_effect.setOpacity(DISABLED_OPACITY)
-                        self._mic_btn.setGraphicsEffect(mic_effect)
-
-                    # Message button stays enabled
-                    if self._message_btn:
-                        self._message_btn.setEnabled(True)
-                        self._message_btn.setCursor(Qt.PointingHandCursor)
-                else:
-                    # Hide indicators
-                    if self._loader_label:
-                        self._loader_label.hide()
-                    if self._stop_label:
-                        self._stop_label.hide()
-                    self._stop_loader_animation()
-
-            def _start_loader_animation(self):
-                """Show a static hourglass icon during execution."""
-                pixmap = create_icon_pixmap("hourglass", ICON_COLOR_DISABLED, 14)
-                self._loader_label.setPixmap(pixmap)
-
-            def _stop_loader_animation(self):
-                """Clear the loader icon."""
-                pass
-
-            def _update_style(self, highlighted: bool):
-                """Update styles for highlight state."""
-                # Don't update style if disabled (keep disabled appearance)
-                if self._disable_reason and not self._is_recording_action and not self._is_executing_action:
-                    return
-
-                if highlighted:
-                    self.setStyleSheet(self._hover_style)
-                    self._text_label.setStyleSheet(self._label_hover_style)
-                else:
-                    self.setStyleSheet(self._normal_style)
-                    if self._menu_item.enabled:
-                        self._text_label.setStyleSheet(self._label_style)
-                    else:
-                        self._text_label.setStyleSheet(self._label_disabled_style)
-
-            def _on_message_share_clicked(self):
-                """Handle message share button click."""
-                # Message button is always enabled, so allow this
-                # Close the menu
-                if self._context_menu.menu:
-                    self._context_menu.menu.close()
-                if self._context_menu.focus_window:
-                    self._context_menu.focus_window.hide()
-
-                # Get prompt store service, context manager, clipboard manager, and notification manager from menu coordinator
-                prompt_store_service = None
-                context_manager = None
-                clipboard_manager = None
-                notification_manager = None
-                history_service = None
-                if hasattr(self._context_menu, "menu_coordinator") and self._context_menu.menu_coordinator:
-                    prompt_store_service = self._context_menu.menu_coordinator.prompt_store_service
-                    context_manager = self._context_menu.menu_coordinator.context_manager
-                    notification_manager = self._context_menu.menu_coordinator.notification_manager
-                    if prompt_store_service:
-                        if hasattr(prompt_store_service, "clipboard_manager"):
-                            clipboard_manager = prompt_store_service.clipboard_manager
-                        if hasattr(prompt_store_service, "history_service"):
-                            history_service = prompt_store_service.history_service
-
-                # Open message share dialog
-                from modules.gui.prompt_execute_dialog import show_prompt_execute_dialog
-
-                show_prompt_execute_dialog(
-                    self._menu_item,
-                    self._context_menu.execution_callback,
-                    prompt_store_service=prompt_store_service,
-                    context_manager=context_manager,
-                    clipboard_manager=clipboard_manager,
-                    notification_manager=notification_manager,
-                    history_service=history_service,
-                )
-
-            def _on_mic_clicked(self):
-                """Handle mic button click - trigger alternative execution (speech input)."""
-                # For recording action, this stops recording (always allowed)
-                # For non-recording actions when enabled
-                if self._context_menu.execution_callback and (self._is_recording_action or self._menu_item.enabled):
-                    # True = shift_pressed, triggers alternative execution (speech-to-text)
-                    self._context_menu.execution_callback(self._menu_item, True)
-                    self._context_menu._close_and_restore_focus()
-
-            def mousePressEvent(self, event):
-                # Check if click is on a button - if so, let the button handle it
-                if self._mic_btn and self._mic_btn.geometry().contains(event.pos()):
-                    return super().mousePressEvent(event)
-                if self._message_btn and self._message_btn.geometry().contains(event.pos()):
-                    return super().mousePressEvent(event)
-
-                # For text area clicks, check if action is enabled
-                if event.button() == Qt.LeftButton:
-                    # If this is the executing action, clicking cancels execution
-                    if self._is_executing_action:
-                        if hasattr(self._context_menu, "menu_coordinator") and self._context_menu.menu_coordinator:
-                            # Cancel will emit execution_completed signal which triggers auto-refresh
-                            self._context_menu.menu_coordinator.prompt_store_service.cancel_current_execution()
-                        event.accept()
-                        return
-
-                    # Block if disabled (but allow if this is the recording action for stopping)
-                    if self._disable_reason and not self._is_recording_action:
-                        event.ignore()
-                        return
-
-                    if (self._menu_item.enabled or self._is_recording_action) and self._context_menu.execution_callback:
-                        shift_pressed = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
-                        self._context_menu.execution_callback(self._menu_item, shift_pressed)
-                        self._context_menu._close_and_restore_focus()
-
-            @property
-            def _is_interactive(self):
-                return self._menu_item.enabled or self._is_recording_action or self._is_executing_action
-
-            def enterEvent(self, event):
-                if self._is_interactive:
-                    self._update_style(True)
-                    self._context_menu.hovered_widgets.add(self)
-                super().enterEvent(event)
-
-            def leaveEvent(self, event):
-                if self._is_interactive and not self.hasFocus():
-                    self._update_style(False)
-                    self._context_menu.hovered_widgets.discard(self)
-                super().leaveEvent(event)
-
-            def focusInEvent(self, event):
-                if self._is_interactive:
-                    self._update_style(True)
-                super().focusInEvent(event)
-
-            def focusOutEvent(self, event):
-                if self._is_interactive:
-                    self._update_style(False)
-                super().focusOutEvent(event)
-
-            def keyPressEvent(self, event):
-                if event.key() in (Qt.Key_Return, Qt.Key_Enter):
-                    # If this is the executing action, Enter cancels execution
-                    if self._is_executing_action:
-                        if hasattr(self._context_menu, "menu_coordinator") and self._context_menu.menu_coordinator:
-                            # Cancel will emit execution_completed signal which triggers auto-refresh
-                            self._context_menu.menu_coordinator.prompt_store_service.cancel_current_execution()
-                        event.accept()
-                        return
-
-                    if (self._menu_item.enabled or self._is_recording_action) and self._context_menu.execution_callback:
-                        shift_pressed = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
-                        self._context_menu.execution_callback(self._menu_item, shift_pressed)
-                        self._context_menu._close_and_restore_focus()
-                    event.accept()
-                else:
-                    super().keyPressEvent(event)
-
         widget = ClickableMenuItem(item.label, item, self)
-
-        # Apply disabled state if needed
-        disable_reason = item.data.get("disable_reason") if item.data else None
-        is_recording_action = item.data.get("is_recording_action", False) if item.data else False
-        is_executing_action = item.data.get("is_executing_action", False) if item.data else False
-
-        if is_executing_action:
-            widget.set_executing_action_state(True)
-        elif is_recording_action:
-            widget.set_recording_action_state(True)
-        elif disable_reason:
-            widget.set_disabled_state(disable_reason)
-        elif not item.enabled:
-            widget.setEnabled(False)
+        widget.apply_item_state()
 
         # Set description if available (shows info icon with tooltip)
-        if hasattr(item, "tooltip") and item.tooltip:
+        if item.tooltip:
             widget.set_description(item.tooltip)
 
         action = QWidgetAction(menu)
         action.setDefaultWidget(widget)
-
-        if item.section_id:
-            action.setProperty("section_id", item.section_id)
-
         action.setEnabled(True)
 
         return action
@@ -1057,6 +1219,10 @@ class PyQtContextMenu(QObject):
         if not self.event_filter_installed:
             return False
 
+        if self._deferring_action_changes and event.type() == QEvent.ActionChanged and obj is self.menu:
+            # Batched visibility changes; the menu is re-laid out once afterwards
+            return True
+
         # Handle app-level mouse clicks for click-outside detection
         if (
             event.type() == QEvent.MouseButtonPress
@@ -1075,8 +1241,11 @@ class PyQtContextMenu(QObject):
                 if event.key() == Qt.Key_Shift:
                     self.shift_pressed = True
                 elif event.key() == Qt.Key_Escape:
-                    # Cancel number input on Escape
+                    # Cancel number input on Escape; with a filter active, clear it and keep the menu open
                     self._cancel_number_input()
+                    if obj is self.menu and self._filter_text:
+                        self._set_filter("")
+                        return True
                     return False
                 elif event.key() in (Qt.Key_Down, Qt.Key_Up):
                     if self._navigable_widgets:
@@ -1088,6 +1257,13 @@ class PyQtContextMenu(QObject):
                             new_index = (self._nav_index - 1) % len(self._navigable_widgets)
                         self._navigate_to(new_index)
                     return True
+                elif obj is self.menu and self._is_filter_key(event):
+                    self._cancel_number_input()
+                    self._set_filter(self._filter_text + event.text())
+                    return True
+                elif event.key() == Qt.Key_Backspace and obj is self.menu and self._filter_text:
+                    self._set_filter(self._filter_text[:-1])
+                    return True
                 elif event.key() in (Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space):
                     return False
                 elif event.key() >= Qt.Key_0 and event.key() <= Qt.Key_9:
@@ -1137,11 +1313,24 @@ class PyQtContextMenu(QObject):
                         return True
             elif event.type() == QEvent.Show:
                 self.shift_pressed = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+                if obj is self.menu:
+                    self._record_show_latency()
             elif event.type() == QEvent.Leave:
                 self._clear_all_hover_states()
 
         return False
 
+    def _record_show_latency(self):
+        """Log the time from the hotkey press until the menu became visible."""
+        if self._show_requested_at is None:
+            return
+        self.last_show_latency_ms = (time.perf_counter() - self._show_requested_at) * 1000
+        self._show_requested_at = None
+        logger.debug(
+            f"Context menu visible {self.last_show_latency_ms:.1f} ms after request "
+            f"({self._last_prepare_ms:.1f} ms preparing items)"
+        )
+
     def _first_prompt_index(self) -> int:
         return next(
             (
@@ -1157,6 +1346,138 @@ class PyQtContextMenu(QObject):
             self._nav_index = index
             self._navigable_widgets[index].setFocus(Qt.OtherFocusReason)
 
+    def _is_filter_key(self, event) -> bool:
+        """Letters start a type-ahead filter; once it is active, any printable character extends it."""
+        if event.modifiers() & (Qt.ControlModifier | Qt.AltModifier | Qt.MetaModifier):
+            return False
+        text = event.text()
+        if len(text) != 1 or not text.isprintable():
+            return False
+        return bool(self._filter_text) or text.isalpha()
+
+    def _set_filter(self, text: str) -> None:
+        """Show only the prompts matching text (all items when empty) and focus the best match."""
+        started = time.perf_counter()
+        self._filter_text = text
+        matches = self._apply_filter()
+        self._update_navigable_widgets()
+        if matches:
+            best = next(
+                (i for i, w in enumerate(self._navigable_widgets) if self._prompt_id(w) == matches[0].prompt_id),
+                -1,
+            )
+            if best >= 0:
+                self._navigate_to(best)
+        elif self.menu:
+            self.menu.setFocus(Qt.OtherFocusReason)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.debug(f"Filtered menu for {text!r}: {len(matches)} matches in {elapsed_ms:.2f} ms")
+
+    def _apply_filter(self) -> list[SearchMatch]:
+        """Hide the rows the current filter excludes without rebuilding the menu.
+
+        Only rows whose visibility changes are touched, and QMenu is laid out
+        once for the whole batch instead of once per row. QMenu leaves the
+        widgets of hidden actions on screen, so they are hidden as well. The
+        application-wide event filter is lifted meanwhile; otherwise every
+        hide and show event of every row would pass through Python.
+        """
+        menu = self.menu
+        if menu is None:
+            return []
+
+        matches = []
+        if self._filter_text:
+            index = self._get_search_index()
+            matches = index.search(self._filter_text) if index else []
+        matched_ids = {match.prompt_id for match in matches[:_MAX_FILTER_MATCHES]}
+
+        if self._filter_rows is None:
+            self._filter_rows = []
+            for action in menu.actions():
+                if action is self._filter_action:
+                    continue
+                widget = action.defaultWidget() if isinstance(action, QWidgetAction) else None
+                self._filter_rows.append(_FilterRow(action, widget, self._prompt_id(widget), action.isVisible()))
+
+        filtering = bool(self._filter_text)
+        changes = [row for row in self._filter_rows if row.visible != (not filtering or row.prompt_id in matched_ids)]
+
+        app = QApplication.instance()
+        if self._app_event_filter_installed:
+            app.removeEventFilter(self)
+        # Repainting is suspended for large batches, such as the first keystroke hiding almost every row;
+        # re-enabling it walks all child widgets, which is not worth it for a few rows
+        suspend_updates = len(changes) > _MAX_FILTER_MATCHES * 2
+        if suspend_updates:
+            menu.setUpdatesEnabled(False)
+        self._deferring_action_changes = True
+        try:
+            for row in changes:
+                row.visible = not row.visible
+                row.action.setVisible(row.visible)
+                if row.widget is not None:
+                    row.widget.setVisible(row.visible)
+        finally:
+            self._deferring_action_changes = False
+            if suspend_updates:
+                menu.setUpdatesEnabled(True)
+            if self._app_event_filter_installed:
+                app.installEventFilter(self)
+
+        self._update_filter_header(len(matches))
+        if changes or filtering:
+            # One relayout for the batch; with only the header text changed, it is re-measured
+            changed = changes[-1].action if changes else self._filter_action
+            QApplication.sendEvent(menu, QActionEvent(QEvent.ActionChanged, changed))
+            if menu.isVisible():
+                self._fit_menu_to_screen()
+        return matches
+
+    def _fit_menu_to_screen(self) -> None:
+        """Re-place the open menu after a relayout, as if it had just been shown with these rows.
+
+        QMenu resizes itself to its full size hint when actions change, which
+        for a long prompt list is far larger than the screen and makes every
+        repaint cover all rows. popup() clamps the size to the screen and
+        resets the scroll offset of scrollable menus; on a visible menu it only
+        moves and resizes it.
+        """
+        self.menu.popup(self._last_menu_position or self.menu.pos())
+
+    def _update_filter_header(self, match_count: int) -> None:
+        """Show the filter text above the matches, or remove the header when not filtering."""
+        menu = self.menu
+        header_shown = self._filter_action in menu.actions()
+        if not self._filter_text:
+            if header_shown:
+                menu.removeAction(self._filter_action)
+            return
+
+        noun = "prompt" if match_count == 1 else "prompts"
+        summary = f"{match_count} {noun}" if match_count else "no matching prompts"
+        if match_count > _MAX_FILTER_MATCHES:
+            summary = f"best {_MAX_FILTER_MATCHES} of {summary}"
+        self._filter_label.setText(f"Filter: {self._filter_text}  ({summary})")
+        if not header_shown:
+            actions = menu.actions()
+            menu.insertAction(actions[0] if actions else None, self._filter_action)
+
+    @staticmethod
+    def _prompt_id(widget) -> str | None:
+        menu_item = getattr(widget, "_menu_item", None)
+        if menu_item is None or menu_item.item_type != MenuItemType.PROMPT or not menu_item.data:
+            return None
+        return menu_item.data.get("prompt_id")
+
+    def _get_search_index(self) -> PromptSearchIndex | None:
+        """Get the prompt store's search index, which is rebuilt only when the prompts change."""
+        if hasattr(self, "menu_coordinator") and self.menu_coordinator:
+            prompt_store_service = self.menu_coordinator.prompt_store_service
+            if prompt_store_service and hasattr(prompt_store_service, "get_search_index"):
+                return prompt_store_service.get_search_index()
+        return None
+
     def _handle_number_input(self, menu, digit, is_alternative):
         """Handle number input with debouncing for multi-digit numbers."""
         # Add digit to buffer
@@ -1200,6 +1521,7 @@ class PyQtContextMenu(QObject):
         """Handle menu about to hide - cleanup number timer and restore focus."""
         # Remove global event filter
         QApplication.instance().removeEventFilter(self)
+        self._app_event_filter_installed = False
 
         # Disconnect from execution signal
         self._disconnect_execution_signal()
@@ -1211,14 +1533,28 @@ class PyQtContextMenu(QObject):
         self._nav_index = -1
         self._navigable_widgets = []
 
+        # Show every row again for the next show
+        if self._filter_text:
+            self._filter_text = ""
+            self._apply_filter()
+
+        # The widgets are reused for the next show, so drop any highlight
+        for widget in list(self.hovered_widgets):
+            if isValid(widget) and hasattr(widget, "_update_style"):
+                widget._update_style(False)
+        self.hovered_widgets.clear()
+        focused = self.menu.focusWidget() if self.menu else None
+        if isinstance(focused, ClickableMenuItem):
+            focused.clearFocus()
+
         # Switch back to accessory mode if no dialogs are open
         from modules.utils import system
 
         if is_macos() and system._open_dialog_count == 0:
             self._set_macos_accessory_mode()
 
-        # Restore focus when menu closes (only if not rebuilding and not already restoring)
-        if not self._is_rebuilding_menu and not hasattr(self, "_focus_restore_pending"):
+        # Restore focus when menu closes (only if not already restoring)
+        if not hasattr(self, "_focus_restore_pending"):
             self._focus_restore_pending = True
             QTimer.singleShot(_MENU_SHOW_DELAY_MS, self._restore_focus_with_cleanup)
 
@@ -1282,8 +1618,8 @@ class PyQtContextMenu(QObject):
         widgets_to_clear = list(self.hovered_widgets)
         for widget in widgets_to_clear:
             try:
-                if isValid(widget) and hasattr(widget, "_normal_style"):
-                    widget.setStyleSheet(widget._normal_style)
+                if isValid(widget) and isinstance(widget, ClickableMenuItem):
+                    set_style_state(widget, widget._idle_state())
                 if widget in self.hovered_widgets:
                     self.hovered_widgets.remove(widget)
             except (RuntimeError, AttributeError):
@@ -1311,82 +1647,9 @@ class PyQtContextMenu(QObject):
             self.qt_active_window = None
 
     def _store_active_window(self):
-        """Store information about the currently active external application."""
+        """Start capturing the active external application; it is only waited for when focus is restored."""
         try:
-            if is_macos():
-                # Use AppleScript to get the frontmost application
-                script = """
-                tell application "System Events"
-                    set frontApp to name of first application process whose frontmost is true
-                    set frontAppPath to POSIX path of (file of first application process whose frontmost is true)
-                end tell
-                return frontApp & "|||" & frontAppPath
-                """
-                result = subprocess.run(
-                    ["osascript", "-e", script],
-                    capture_output=True,
-                    text=True,
-                    timeout=1.0,
-                )
-                if result.returncode == 0:
-                    app_info = result.stdout.strip().split("|||")
-                    self.original_active_window = {
-                        "name": app_info[0],
-                        "path": app_info[1] if len(app_info) > 1 else None,
-                    }
-            elif is_linux():
-                if is_wayland_session():
-                    self.original_active_window = None
-                else:
-                    try:
-                        result = subprocess.run(
-                            ["xdotool", "getactivewindow"],
-                            capture_output=True,
-                            text=True,
-                            timeout=1,
-                        )
-                        if result.returncode == 0:
-                            window_id = result.stdout.strip()
-
-                            result = subprocess.run(
-                                ["xdotool", "getwindowname", window_id],
-                                capture_output=True,
-                                text=True,
-                                timeout=1,
-                            )
-                            window_name = result.stdout.strip() if result.returncode == 0 else "Unknown"
-
-                            result = subprocess.run(
-                                ["xdotool", "getwindowpid", window_id],
-                                capture_output=True,
-                                text=True,
-                                timeout=1,
-                            )
-                            pid = result.stdout.strip() if result.returncode == 0 else None
-
-                            self.original_active_window = {
-                                "window_id": window_id,
-                                "name": window_name,
-                                "pid": pid,
-                            }
-                    except FileNotFoundError:
-                        result = subprocess.run(
-                            ["xprop", "-root", "_NET_ACTIVE_WINDOW"],
-                            capture_output=True,
-                            text=True,
-                            timeout=1,
-                        )
-                        if result.returncode == 0:
-                            import re
-
-                            match = re.search(r"0x[0-9a-fA-F]+", result.stdout)
-                            if match:
-                                window_id = match.group()
-                                self.original_active_window = {
-                                    "window_id": window_id,
-                                    "name": "Unknown",
-                                    "pid": None,
-                                }
+            self.original_active_window = capture_active_window()
         except Exception:
             self.original_active_window = None
 
@@ -1409,11 +1672,12 @@ class PyQtContextMenu(QObject):
                 return
 
             # If Qt window is not available, try external focus restoration
-            if not self.original_active_window:
+            original_window = self.original_active_window.result() if self.original_active_window else None
+            if not original_window:
                 return
 
             if is_macos():
-                app_name = self.original_active_window.get("name")
+                app_name = original_window.get("name")
                 if app_name and app_name not in (
                     "Python",
                     "Promptheus",
@@ -1448,7 +1712,7 @@ class PyQtContextMenu(QObject):
                     except Exception as e:
                         print(f"Error restoring macOS focus to {app_name}: {e}")
             elif is_linux() and not is_wayland_session():
-                window_id = self.original_active_window.get("window_id")
+                window_id = original_window.get("window_id")
                 if window_id:
                     try:
                         subprocess.run(
@@ -1,8 +1,12 @@
 """PySide6-based hotkey manager for global hotkey detection."""
 
+import logging
 import os
+import queue
 import threading
+import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -13,6 +17,12 @@ from PySide6.QtCore import QObject, Signal
 from core.exceptions import HotkeyError
 from modules.utils.config import ConfigService
 from modules.utils.keymap import KeymapManager
+from modules.utils.keymap_actions import execute_keymap_action
+
+logger = logging.getLogger(__name__)
+
+# Repeated triggers of the same action within this window are ignored (e.g. key auto-repeat)
+HOTKEY_DEBOUNCE_SECONDS = 1.0
 
 
 def _write_hotkey_debug_log(message: str) -> None:
@@ -30,6 +40,71 @@ class HotkeySignals(QObject):
     action_triggered = Signal(str)
 
 
+def _build_key_map() -> dict[str, Key | keyboard.KeyCode]:
+    """Map key names used in keymaps to pynput keys."""
+    key_map: dict[str, Key | keyboard.KeyCode] = {
+        "f1": Key.f1,
+        "f2": Key.f2,
+        "f3": Key.f3,
+        "f4": Key.f4,
+        "f5": Key.f5,
+        "f6": Key.f6,
+        "f7": Key.f7,
+        "f8": Key.f8,
+        "f9": Key.f9,
+        "f10": Key.f10,
+        "f11": Key.f11,
+        "f12": Key.f12,
+        "f13": Key.f13,
+        "f14": Key.f14,
+        "f15": Key.f15,
+        "f16": Key.f16,
+        "f17": Key.f17,
+        "f18": Key.f18,
+        "f19": Key.f19,
+        "f20": Key.f20,
+        "esc": Key.esc,
+        "escape": Key.esc,
+        "space": Key.space,
+        "tab": Key.tab,
+        "enter": Key.enter,
+        "return": Key.enter,
+        "up": Key.up,
+        "down": Key.down,
+        "left": Key.left,
+        "right": Key.right,
+        "home": Key.home,
+        "end": Key.end,
+        "delete": Key.delete,
+        "backspace": Key.backspace,
+        "page_up": Key.page_up,
+        "page_down": Key.page_down,
+        "caps_lock": Key.caps_lock,
+    }
+
+    # Add letter and number keys
+    for i in range(26):
+        letter = chr(ord("a") + i)
+        key_map[letter] = keyboard.KeyCode.from_char(letter)
+
+    for i in range(10):
+        key_map[str(i)] = keyboard.KeyCode.from_char(str(i))
+
+    return key_map
+
+
+KEY_MAP = _build_key_map()
+
+MODIFIER_MAP = {
+    "cmd": frozenset({Key.cmd, Key.cmd_l, Key.cmd_r}),
+    "ctrl": frozenset({Key.ctrl, Key.ctrl_l, Key.ctrl_r}),
+    "shift": frozenset({Key.shift, Key.shift_l, Key.shift_r}),
+    "alt": frozenset({Key.alt, Key.alt_l, Key.alt_r}),
+    "meta": frozenset({Key.cmd, Key.cmd_l, Key.cmd_r}),  # alias for cmd
+    "super": frozenset({Key.cmd, Key.cmd_l, Key.cmd_r}),  # alias for cmd
+}
+
+
 class HotkeyConfig:
     """Configuration for platform-specific hotkeys from keymap system."""
 
@@ -42,78 +117,109 @@ class HotkeyConfig:
         key_name = parts[-1]
         modifier_names = parts[:-1]
 
-        # Map string names to Key objects
-        key_map = {
-            "f1": Key.f1,
-            "f2": Key.f2,
-            "f3": Key.f3,
-            "f4": Key.f4,
-            "f5": Key.f5,
-            "f6": Key.f6,
-            "f7": Key.f7,
-            "f8": Key.f8,
-            "f9": Key.f9,
-            "f10": Key.f10,
-            "f11": Key.f11,
-            "f12": Key.f12,
-            "f13": Key.f13,
-            "f14": Key.f14,
-            "f15": Key.f15,
-            "f16": Key.f16,
-            "f17": Key.f17,
-            "f18": Key.f18,
-            "f19": Key.f19,
-            "f20": Key.f20,
-            "esc": Key.esc,
-            "escape": Key.esc,
-            "space": Key.space,
-            "tab": Key.tab,
-            "enter": Key.enter,
-            "return": Key.enter,
-            "up": Key.up,
-            "down": Key.down,
-            "left": Key.left,
-            "right": Key.right,
-            "home": Key.home,
-            "end": Key.end,
-            "delete": Key.delete,
-            "backspace": Key.backspace,
-            "page_up": Key.page_up,
-            "page_down": Key.page_down,
-            "caps_lock": Key.caps_lock,
-        }
+        modifier_groups = [MODIFIER_MAP[mod_name] for mod_name in modifier_names if mod_name in MODIFIER_MAP]
 
-        # Add letter and number keys
-        for i in range(26):
-            letter = chr(ord("a") + i)
-            key_map[letter] = keyboard.KeyCode.from_char(letter)
-
-        for i in range(10):
-            key_map[str(i)] = keyboard.KeyCode.from_char(str(i))
-
-        modifier_map = {
-            "cmd": [Key.cmd, Key.cmd_l, Key.cmd_r],
-            "ctrl": [Key.ctrl, Key.ctrl_l, Key.ctrl_r],
-            "shift": [Key.shift, Key.shift_l, Key.shift_r],
-            "alt": [Key.alt, Key.alt_l, Key.alt_r],
-            "meta": [Key.cmd, Key.cmd_l, Key.cmd_r],  # alias for cmd
-            "super": [Key.cmd, Key.cmd_l, Key.cmd_r],  # alias for cmd
-        }
-
-        modifier_groups = []
-        for mod_name in modifier_names:
-            if mod_name in modifier_map:
-                modifier_groups.append(modifier_map[mod_name])
-
-        parsed_key = key_map.get(key_name)
+        parsed_key = KEY_MAP.get(key_name)
         if parsed_key is None:
             parsed_key = keyboard.KeyCode.from_char(key_name)
 
         return {"modifier_groups": modifier_groups, "key": parsed_key}
 
 
-# Global hotkey config will be initialized when needed
-HOTKEY_CONFIG = None
+@dataclass(frozen=True)
+class CompiledHotkey:
+    """A parsed binding: the action fires when key is pressed while one key of each modifier group is held."""
+
+    action: str
+    modifier_groups: tuple[frozenset, ...]
+
+
+class HotkeyMatcher:
+    """Lookup tables from trigger key to the bindings it can fire.
+
+    Bindings are parsed once by compile(); match() runs on every key press
+    anywhere on the system, so it only does a dict lookup and set checks.
+    Character keys are looked up by their character because hashing a
+    pynput KeyCode builds its repr on every call.
+    """
+
+    def __init__(self):
+        self._by_key: dict[Key, tuple[CompiledHotkey, ...]] = {}
+        self._by_char: dict[str, tuple[CompiledHotkey, ...]] = {}
+
+    def compile(self, keymap_manager: KeymapManager) -> None:
+        """Parse all active bindings, keeping keymap order so the first matching binding wins."""
+        config = HotkeyConfig(keymap_manager)
+        by_key: dict[Key, list[CompiledHotkey]] = {}
+        by_char: dict[str, list[CompiledHotkey]] = {}
+        for binding in keymap_manager.get_all_bindings():
+            if not binding.key_combination:
+                continue
+            parsed = config._parse_hotkey(binding.key_combination)
+            hotkey = CompiledHotkey(binding.action, tuple(parsed["modifier_groups"]))
+            key = parsed["key"]
+            if isinstance(key, Key):
+                by_key.setdefault(key, []).append(hotkey)
+            elif key.char is not None:
+                by_char.setdefault(key.char, []).append(hotkey)
+        self._by_key = {key: tuple(hotkeys) for key, hotkeys in by_key.items()}
+        self._by_char = {char: tuple(hotkeys) for char, hotkeys in by_char.items()}
+
+    def match(self, key: Key | keyboard.KeyCode, pressed_keys: set) -> str | None:
+        """Return the action fired by pressing key with pressed_keys held, if any."""
+        if isinstance(key, Key):
+            hotkeys = self._by_key.get(key)
+        elif key.char is not None and not key.is_dead:
+            hotkeys = self._by_char.get(key.char)
+        else:
+            return None
+        if hotkeys is None:
+            return None
+        for hotkey in hotkeys:
+            for group in hotkey.modifier_groups:
+                if group.isdisjoint(pressed_keys):
+                    break
+            else:
+                return hotkey.action
+        return None
+
+
+class HotkeyActionDispatcher:
+    """Runs keymap actions for triggered hotkeys on a worker thread.
+
+    The pynput callback runs inside the OS keyboard hook, so it only queues
+    the action; clipboard reads and image encoding happen here without
+    stalling keyboard input. Actions run one at a time, in trigger order.
+    """
+
+    def __init__(self):
+        self._queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        # A fresh queue per worker, so a stopping worker cannot take the new worker's events
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, args=(self._queue,), name="hotkey-actions", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker after the actions already queued."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread = None
+
+    def submit(self, action_name: str) -> None:
+        self._queue.put(action_name)
+
+    def _run(self, events: queue.SimpleQueue) -> None:
+        while (action_name := events.get()) is not None:
+            try:
+                execute_keymap_action(action_name)
+            except Exception as e:
+                logger.error(f"Hotkey action '{action_name}' failed: {e}")
 
 
 class PyQtHotkeyListener:
@@ -123,24 +229,12 @@ class PyQtHotkeyListener:
         self.keymap_manager = keymap_manager or KeymapManager([])
         self.listener: keyboard.Listener | None = None
         self.pressed_keys: set[Key] = set()
-        self.action_states: dict[str, bool] = {}
-        self.action_timers: dict[str, threading.Timer | None] = {}
+        self.matcher = HotkeyMatcher()
+        self.dispatcher = HotkeyActionDispatcher()
+        self.last_triggered: dict[str, float] = {}
         self.signals = HotkeySignals()
         self.running = False
 
-        # Initialize action states and timers for available actions
-        available_actions = {
-            "open_context_menu",
-            "execute_active_prompt",
-            "speech_to_text_toggle",
-            "set_context_value",
-            "append_context_value",
-            "clear_context",
-        }
-        for action in available_actions:
-            self.action_states[action] = False
-            self.action_timers[action] = None
-
     def connect_action_callback(self, callback: Callable[[str], None]) -> None:
         """Connect callback for any action trigger."""
         self.signals.action_triggered.connect(callback)
@@ -150,9 +244,7 @@ class PyQtHotkeyListener:
         if self.running:
             return
 
-        global HOTKEY_CONFIG
-        if HOTKEY_CONFIG is None:
-            HOTKEY_CONFIG = HotkeyConfig(self.keymap_manager)
+        self.matcher.compile(self.keymap_manager)
 
         _write_hotkey_debug_log("Starting pynput keyboard listener...")
         _write_hotkey_debug_log(f"  DISPLAY={os.environ.get('DISPLAY', 'NOT SET')}")
@@ -160,11 +252,13 @@ class PyQtHotkeyListener:
         _write_hotkey_debug_log(f"  XDG_SESSION_TYPE={os.environ.get('XDG_SESSION_TYPE', 'NOT SET')}")
 
         try:
+            self.dispatcher.start()
             self.listener = keyboard.Listener(on_press=self._on_press, on_release=self._on_release, suppress=False)
             self.listener.start()
             self.running = True
             _write_hotkey_debug_log("Keyboard listener started successfully")
         except Exception as e:
+            self.dispatcher.stop()
             _write_hotkey_debug_log(f"FAILED to start keyboard listener: {type(e).__name__}: {e}")
             raise HotkeyError(f"Failed to start hotkey listener: {e}") from e
 
@@ -172,70 +266,37 @@ class PyQtHotkeyListener:
         """Stop the hotkey listener."""
         self.running = False
 
-        # Cancel all action timers
-        for action, timer in self.action_timers.items():
-            if timer:
-                timer.cancel()
-                self.action_timers[action] = None
-
         if self.listener:
             self.listener.stop()
             self.listener = None
 
+        self.dispatcher.stop()
         self.pressed_keys.clear()
-
-        # Reset action states
-        for action in self.action_states:
-            self.action_states[action] = False
+        self.last_triggered.clear()
 
     def _on_press(self, key: Key) -> None:
         """Handle key press events."""
         self.pressed_keys.add(key)
 
-        # Check all configured hotkeys from keymap
-        all_bindings = self.keymap_manager.get_all_bindings()
-        for binding in all_bindings:
-            if self._is_action_hotkey_pressed(binding.action, binding.key_combination):
-                self._trigger_action_hotkey(binding.action)
-                break  # Only trigger first matching action
+        action_name = self.matcher.match(key, self.pressed_keys)
+        if action_name is not None:
+            self._trigger_action_hotkey(action_name)
 
     def _on_release(self, key: Key) -> None:
         """Handle key release events."""
-        if key in self.pressed_keys:
-            self.pressed_keys.remove(key)
-
-    def _is_action_hotkey_pressed(self, action_name: str, hotkey_combination: str) -> bool:
-        """Check if a specific action's hotkey combination is pressed."""
-        if not hotkey_combination:
-            return False
-
-        parsed = HOTKEY_CONFIG._parse_hotkey(hotkey_combination)
-        modifier_pressed = all(
-            any(mod in self.pressed_keys for mod in group)
-            for group in parsed["modifier_groups"]
-        )
-        key_pressed = parsed["key"] in self.pressed_keys
-        return modifier_pressed and key_pressed
+        self.pressed_keys.discard(key)
 
     def _trigger_action_hotkey(self, action_name: str) -> None:
-        """Trigger action hotkey signal if not already triggered."""
-        if not self.action_states.get(action_name, False):
-            self.action_states[action_name] = True
-            self.signals.action_triggered.emit(action_name)
-
-            # Execute the action through keymap manager
-            from modules.utils.keymap_actions import execute_keymap_action
-
-            execute_keymap_action(action_name)
-
-            # Set reset timer
-            self.action_timers[action_name] = threading.Timer(1.0, lambda: self._reset_action_flag(action_name))
-            self.action_timers[action_name].start()
+        """Hand the action to the Qt thread and the action worker, unless it fired within the debounce window."""
+        now = time.monotonic()
+        last = self.last_triggered.get(action_name)
+        if last is not None and now - last < HOTKEY_DEBOUNCE_SECONDS:
+            return
+        self.last_triggered[action_name] = now
 
-    def _reset_action_flag(self, action_name: str) -> None:
-        """Reset action flag to prevent rapid firing."""
-        self.action_states[action_name] = False
-        self.action_timers[action_name] = None
+        # Queued to the Qt thread for UI actions; everything else runs on the dispatcher thread
+        self.signals.action_triggered.emit(action_name)
+        self.dispatcher.submit(action_name)
 
 
 class PyQtHotkeyManager:
@@ -6,6 +6,7 @@ Public API:
     get_svg_path(name) -> str
     get_svg_content(name) -> str
     get_available_icons() -> List[str]
+    get_icon_atlas() -> IconAtlas (pre-renders the palette at idle)
 
 Color constants:
     ICON_COLOR_NORMAL
@@ -18,6 +19,7 @@ Stylesheet paths:
     SVG_CHEVRON_UP
 """
 
+from .atlas import IconAtlas, get_icon_atlas
 from .constants import (
     DISABLED_OPACITY,
     ICON_COLOR_DISABLED,
@@ -38,6 +40,8 @@ __all__ = [
     "get_svg_content",
     "get_svg_data_url",
     "get_available_icons",
+    "IconAtlas",
+    "get_icon_atlas",
     "ICON_COLOR_NORMAL",
     "ICON_COLOR_HOVER",
     "ICON_COLOR_DISABLED",
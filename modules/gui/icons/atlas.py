@@ -0,0 +1,291 @@
+"""Background pre-rendering of the icon palette.
+
+The first menu or dialog to show an icon would otherwise parse and
+rasterize its SVG on the GUI thread. After startup the atlas renders every
+icon in the palette colors and common sizes at the current device pixel
+ratio, in short batches while the event loop is idle, and seeds the
+renderer's pixmap cache. The result is saved as a single PNG atlas keyed
+by a digest of the SVG sources, colors and sizes, so later launches only
+decode one image. Screen and scale changes re-render for the new ratio.
+"""
+
+import contextlib
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+
+from PySide6.QtCore import QObject, QRect, QRunnable, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QGuiApplication, QImage, QPainter, QPixmap
+
+from modules.utils.paths import get_cache_dir
+
+from .constants import ICON_COLOR_DISABLED, ICON_COLOR_HOVER, ICON_COLOR_NORMAL
+from .loader import get_available_icons, get_svg_content
+from .renderer import _get_dpr, _render_pixmap_raw, cache_pixmap, is_pixmap_cached, render_svg
+
+logger = logging.getLogger(__name__)
+
+# Bump when the atlas layout changes, so stale atlases are not sliced with the new one
+ATLAS_FORMAT_VERSION = 1
+ATLAS_COLORS = tuple(dict.fromkeys((ICON_COLOR_NORMAL, ICON_COLOR_HOVER, ICON_COLOR_DISABLED)))
+ATLAS_ICON_SIZES = (14, 16, 18)
+ATLAS_COLUMNS = 16
+DISK_CACHE_MAX_FILES = 4
+
+_IDLE_BATCH_MS = 4  # Rendering time per event loop pass, short enough not to delay input
+_SCREEN_CHANGE_DELAY_MS = 250  # Screens report several changes at once when plugged or rescaled
+
+
+@dataclass(frozen=True)
+class AtlasEntry:
+    """One rendered icon and its cell in the atlas image."""
+
+    name: str
+    color: str
+    physical_size: int
+    rect: QRect
+
+
+def atlas_entries(icon_names: list[str], dpr: float) -> list[AtlasEntry]:
+    """Lay out every icon, color and size for dpr in a fixed grid of equal cells."""
+    physical_sizes = [int(size * dpr) for size in ATLAS_ICON_SIZES]
+    cell = max(physical_sizes)
+    entries = []
+    for name in sorted(icon_names):
+        for color in ATLAS_COLORS:
+            for physical_size in physical_sizes:
+                row, column = divmod(len(entries), ATLAS_COLUMNS)
+                rect = QRect(column * cell, row * cell, physical_size, physical_size)
+                entries.append(AtlasEntry(name, color, physical_size, rect))
+    return entries
+
+
+def atlas_key(entries: list[AtlasEntry]) -> str:
+    """Digest of everything that determines the atlas pixels."""
+    digest = hashlib.sha1(f"v{ATLAS_FORMAT_VERSION}".encode())
+    for name in sorted({entry.name for entry in entries}):
+        digest.update(name.encode())
+        digest.update(get_svg_content(name).encode())
+    for entry in entries:
+        digest.update(f"{entry.name}:{entry.color}:{entry.physical_size}:{entry.rect.x()},{entry.rect.y()}".encode())
+    return digest.hexdigest()[:16]
+
+
+def _atlas_path(key: str):
+    return get_cache_dir("icons") / f"atlas-{key}.png"
+
+
+def _load_atlas(key: str) -> QImage | None:
+    path = _atlas_path(key)
+    if not path.exists():
+        return None
+    image = QImage(str(path))
+    if image.isNull():
+        return None
+    with contextlib.suppress(OSError):
+        path.touch()
+    return image
+
+
+def _save_atlas(key: str, image: QImage) -> None:
+    """Write the atlas PNG and drop the least recently used ones beyond DISK_CACHE_MAX_FILES."""
+    path = _atlas_path(key)
+    tmp_path = path.with_suffix(".tmp")
+    if not image.save(str(tmp_path), "PNG"):
+        raise OSError(f"Could not write {tmp_path}")
+    tmp_path.replace(path)
+
+    files = sorted(path.parent.glob("atlas-*.png"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old_path in files[DISK_CACHE_MAX_FILES:]:
+        with contextlib.suppress(OSError):
+            old_path.unlink()
+
+
+class _LoadAtlasJob(QRunnable):
+    """Worker that decodes a cached atlas PNG."""
+
+    def __init__(self, atlas: "IconAtlas", generation: int, key: str):
+        super().__init__()
+        self._atlas = atlas
+        self._generation = generation
+        self._key = key
+
+    def run(self):
+        image = None
+        try:
+            image = _load_atlas(self._key)
+        except Exception as e:
+            logger.debug(f"Failed to read icon atlas: {e}")
+        self._atlas._atlas_loaded.emit(self._generation, image)
+
+
+class IconAtlas(QObject):
+    """Pre-renders the icon palette at idle and keeps it current across DPR changes.
+
+    Icons are rendered into the shared pixmap cache that ``create_icon`` and
+    ``create_icon_pixmap`` read from, so callers need no changes. ``ready``
+    is emitted with the device pixel ratio once every entry is cached.
+    """
+
+    ready = Signal(float)
+    _atlas_loaded = Signal(int, object)  # generation, QImage | None
+
+    def __init__(self, parent: QObject | None = None, persist: bool = True):
+        super().__init__(parent)
+        self._persist = persist
+        self._dpr: float | None = None
+        self._current_dpr: float | None = None
+        self._generation = 0
+        self._key = ""
+        self._entries: list[AtlasEntry] = []
+        self._pending: list[AtlasEntry] = []
+        self._started_at = 0.0
+        self._watching_screens = False
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setInterval(0)
+        self._batch_timer.timeout.connect(self._render_batch)
+
+        self._screen_timer = QTimer(self)
+        self._screen_timer.setSingleShot(True)
+        self._screen_timer.setInterval(_SCREEN_CHANGE_DELAY_MS)
+        self._screen_timer.timeout.connect(self._on_screens_settled)
+
+        self._atlas_loaded.connect(self._on_atlas_loaded, Qt.QueuedConnection)
+
+    @property
+    def dpr(self) -> float | None:
+        """Device pixel ratio of the last completed atlas."""
+        return self._dpr
+
+    def start(self) -> None:
+        """Fill the cache for the current device pixel ratio and follow screen changes."""
+        if not self._watching_screens:
+            self._watch_screens()
+        self._begin(_get_dpr())
+
+    def stop(self) -> None:
+        self._generation += 1
+        self._batch_timer.stop()
+        self._screen_timer.stop()
+        self._pending = []
+
+    def _begin(self, dpr: float) -> None:
+        self.stop()
+        self._started_at = time.perf_counter()
+        try:
+            self._entries = atlas_entries(get_available_icons(), dpr)
+            self._key = atlas_key(self._entries)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Icon atlas unavailable: {e}")
+            return
+        self._pending = [entry for entry in self._entries if not is_pixmap_cached(*self._cache_key(entry))]
+        self._dpr = None
+        self._current_dpr = dpr
+
+        if self._persist:
+            self._pool.start(_LoadAtlasJob(self, self._generation, self._key))
+        else:
+            self._batch_timer.start()
+
+    def _on_atlas_loaded(self, generation: int, image: QImage | None) -> None:
+        """Slice a cached atlas into the pixmap cache, or render it if there was none (GUI thread)."""
+        if generation != self._generation:
+            return
+        if image is not None:
+            for entry in self._pending:
+                cache_pixmap(*self._cache_key(entry), QPixmap.fromImage(image.copy(entry.rect)))
+            self._pending = []
+            self._finish(loaded=True)
+            return
+        self._batch_timer.start()
+
+    def _render_batch(self) -> None:
+        """Render entries until the batch budget is spent, then yield to the event loop."""
+        deadline = time.perf_counter() + _IDLE_BATCH_MS / 1000
+        while self._pending and time.perf_counter() < deadline:
+            entry = self._pending.pop()
+            key = self._cache_key(entry)
+            if not is_pixmap_cached(*key):
+                try:
+                    cache_pixmap(*key, render_svg(*key))
+                except ValueError as e:
+                    logger.debug(f"Skipping icon {entry.name}: {e}")
+        if not self._pending:
+            self._batch_timer.stop()
+            self._finish(loaded=False)
+
+    def _finish(self, loaded: bool) -> None:
+        dpr = self._dpr = self._current_dpr
+        elapsed_ms = (time.perf_counter() - self._started_at) * 1000
+        source = "loaded" if loaded else "rendered"
+        logger.debug(f"Icon atlas {source} {len(self._entries)} icons at {dpr}x in {elapsed_ms:.1f} ms")
+        if self._persist and not loaded:
+            self._save()
+        self.ready.emit(dpr)
+
+    def _save(self) -> None:
+        """Compose the atlas from the cache and write it from a worker thread."""
+        width = max(entry.rect.right() for entry in self._entries) + 1
+        height = max(entry.rect.bottom() for entry in self._entries) + 1
+        image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        for entry in self._entries:
+            # The target rect is in device pixels here, whatever ratio the cached pixmap carries
+            painter.drawPixmap(entry.rect, _render_pixmap_raw(*self._cache_key(entry)))
+        painter.end()
+
+        key = self._key
+
+        def save():
+            try:
+                _save_atlas(key, image)
+            except OSError as e:
+                logger.debug(f"Failed to write icon atlas: {e}")
+
+        self._pool.start(save)
+
+    @staticmethod
+    def _cache_key(entry: AtlasEntry) -> tuple[str, str, int]:
+        return entry.name, entry.color, entry.physical_size
+
+    def _watch_screens(self) -> None:
+        app = QGuiApplication.instance()
+        if app is None:
+            return
+        self._watching_screens = True
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._on_screens_changed)
+        app.primaryScreenChanged.connect(self._on_screens_changed)
+        for screen in app.screens():
+            self._on_screen_added(screen, initial=True)
+
+    def _on_screen_added(self, screen, initial: bool = False) -> None:
+        # A scale change shows up as a logical DPI change on the screen
+        screen.logicalDotsPerInchChanged.connect(self._on_screens_changed)
+        if not initial:
+            self._on_screens_changed()
+
+    def _on_screens_changed(self, *_args) -> None:
+        self._screen_timer.start()
+
+    def _on_screens_settled(self) -> None:
+        dpr = _get_dpr()
+        if self._current_dpr is not None and dpr != self._current_dpr:
+            logger.debug(f"Device pixel ratio changed to {dpr}, re-rendering icon atlas")
+            self._begin(dpr)
+
+
+_icon_atlas: IconAtlas | None = None
+
+
+def get_icon_atlas() -> IconAtlas:
+    """Get the shared IconAtlas instance."""
+    global _icon_atlas
+    if _icon_atlas is None:
+        _icon_atlas = IconAtlas()
+    return _icon_atlas
@@ -1,6 +1,6 @@
 """Icon rendering with caching."""
 
-from functools import lru_cache
+from collections import OrderedDict
 
 from PySide6.QtCore import QByteArray, QRect, QSize, Qt
 from PySide6.QtGui import QColor, QFont, QFontMetrics, QIcon, QPainter, QPixmap
@@ -10,15 +10,31 @@ from PySide6.QtWidgets import QApplication
 from .constants import ICON_COLOR_NORMAL
 from .loader import get_svg_content
 
+# Rendered pixmaps keyed by (name, color, physical size); the icon atlas seeds it ahead of first use
+PIXMAP_CACHE_SIZE = 1024
+_pixmap_cache: OrderedDict[tuple[str, str, int], QPixmap] = OrderedDict()
+
 
 def _get_dpr() -> float:
     app = QApplication.instance()
     return app.devicePixelRatio() if app else 1.0
 
 
-@lru_cache(maxsize=256)
 def _render_pixmap_raw(name: str, color: str, physical_size: int) -> QPixmap:
-    """Render SVG to pixmap at exact physical size (no dpr scaling)."""
+    """Get the SVG rendered at exact physical size (no dpr scaling), rendering it on a cache miss."""
+    key = (name, color, physical_size)
+    pixmap = _pixmap_cache.get(key)
+    if pixmap is not None:
+        _pixmap_cache.move_to_end(key)
+        return pixmap
+
+    pixmap = render_svg(name, color, physical_size)
+    cache_pixmap(name, color, physical_size, pixmap)
+    return pixmap
+
+
+def render_svg(name: str, color: str, physical_size: int) -> QPixmap:
+    """Render SVG to a new pixmap at exact physical size, bypassing the cache."""
     svg_content = get_svg_content(name)
     svg_data = svg_content.replace("currentColor", color)
 
@@ -35,6 +51,18 @@ def _render_pixmap_raw(name: str, color: str, physical_size: int) -> QPixmap:
     return pixmap
 
 
+def is_pixmap_cached(name: str, color: str, physical_size: int) -> bool:
+    return (name, color, physical_size) in _pixmap_cache
+
+
+def cache_pixmap(name: str, color: str, physical_size: int, pixmap: QPixmap) -> None:
+    """Store a rendered pixmap, evicting the least recently used ones beyond PIXMAP_CACHE_SIZE."""
+    _pixmap_cache[(name, color, physical_size)] = pixmap
+    _pixmap_cache.move_to_end((name, color, physical_size))
+    while len(_pixmap_cache) > PIXMAP_CACHE_SIZE:
+        _pixmap_cache.popitem(last=False)
+
+
 def _render_pixmap(name: str, color: str, size: int, dpr: float) -> QPixmap:
     """Render SVG to pixmap with dpr scaling."""
     physical_size = int(size * dpr)
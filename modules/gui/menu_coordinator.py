@@ -148,8 +148,12 @@ class PyQtMenuCoordinator(QObject):
         """Set debounce delay for number input in milliseconds."""
         self.context_menu.set_number_input_debounce_ms(debounce_ms)
 
-    def show_menu(self) -> None:
-        """Show the context menu at cursor position."""
+    def show_menu(self, requested_at: float | None = None) -> None:
+        """Show the context menu at cursor position.
+
+        requested_at is the time.perf_counter() value of the hotkey press, used
+        to measure how long the menu takes to appear.
+        """
         if self.context_menu.menu and self.context_menu.menu.isVisible():
             self.context_menu.menu.close()
         try:
@@ -159,11 +163,20 @@ class PyQtMenuCoordinator(QObject):
                 return
 
             self.last_menu_items = items
-            self.context_menu.show_at_cursor(items)
+            self.context_menu.show_at_cursor(items, requested_at)
 
         except (RuntimeError, Exception) as e:
             self._handle_error(f"Failed to show menu: {str(e)}")
 
+    def prebuild_menu(self) -> None:
+        """Build the context menu widgets ahead of the first show."""
+        try:
+            items = self._get_all_menu_items()
+            if items:
+                self.context_menu.prepare_menu(items)
+        except (RuntimeError, Exception) as e:
+            logger.warning(f"Failed to prebuild menu: {e}")
+
     def cleanup(self) -> None:
         """Clean up resources."""
         if self.context_manager:
@@ -218,6 +231,7 @@ class PyQtMenuCoordinator(QObject):
                 data=item.data,
                 enabled=item.enabled,
                 tooltip=getattr(item, "tooltip", None),
+                submenu_items=item.submenu_items,
                 icon=item.icon,
             )
 
@@ -298,7 +312,12 @@ class PyQtMenuCoordinator(QObject):
     def _build_prompt_items(self) -> list[MenuItem]:
         """Build prompt menu items from non-dynamic providers."""
         prompt_items = []
-        dynamic_providers = {"LastInteractionMenuProvider", "ContextMenuProvider", "SpeechMenuProvider"}
+        dynamic_providers = {
+            "LastInteractionMenuProvider",
+            "ContextMenuProvider",
+            "ClipboardHistoryMenuProvider",
+            "SpeechMenuProvider",
+        }
 
         for provider in self.providers:
             if provider.__class__.__name__ not in dynamic_providers:
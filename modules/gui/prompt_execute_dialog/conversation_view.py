@@ -0,0 +1,382 @@
+"""Virtualized view of the current conversation branch for PromptExecuteDialog.
+
+Creating a message bubble costs several milliseconds, so the view never
+rebuilds the whole branch. Only messages near the visible part of the
+scroll area are backed by bubble widgets; runs of off-screen messages are
+stood in for by one spacer of their measured or estimated height. Bubbles
+that scroll away or leave the branch go to a pool and are rebound to other
+messages. Showing a new branch keeps the bubbles of messages it shares
+with the previous one.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget
+
+from modules.gui.prompt_execute_dialog.data import ConversationNode, ConversationTree
+from modules.gui.prompt_execute_dialog.message_widgets import AssistantBubble, UserMessageBubble
+from modules.gui.shared.theme import SCROLL_CONTENT_SPACING
+from modules.gui.shared.widgets import BUBBLE_TEXT_EDIT_MIN_HEIGHT
+
+if TYPE_CHECKING:
+    from modules.gui.prompt_execute_dialog.dialog import PromptExecuteDialog
+
+logger = logging.getLogger(__name__)
+
+# Extra height above and below the viewport kept as real bubbles, as a fraction of the viewport
+OVERSCAN_RATIO = 0.5
+# The last messages always have bubbles: new output streams into them and the input sits below them
+PINNED_TAIL = 2
+# Unused bubbles kept per role for rebinding
+POOL_LIMIT = 16
+
+# Estimation for messages that have not been measured yet
+_DEFAULT_CHROME_HEIGHT = 40  # Header and spacing around the text edit
+_TEXT_EDIT_EXTRA_HEIGHT = 20  # Added to the document height by get_text_edit_content_height
+_TEXT_EDIT_HORIZONTAL_INSET = 48  # Bubble margin, text edit padding, border and right margin
+_IMAGE_ROW_HEIGHT = 40
+
+
+@dataclass
+class _Slot:
+    """A message on the shown branch and the bubble showing it, if any."""
+
+    node: ConversationNode
+    number: int
+    height: int | None = None  # Measured or estimated height, valid while measured_content is the node's content
+    measured_content: str | None = None
+    bubble: UserMessageBubble | AssistantBubble | None = None
+
+    @property
+    def role(self) -> str:
+        return self.node.role
+
+
+class ConversationView(QObject):
+    """Shows the current branch of the conversation tree as message bubbles.
+
+    ``bubbles`` lists the bubbles currently backed by widgets, in branch
+    order. The dialog's ``_message_bubbles`` refers to the same list.
+    """
+
+    def __init__(self, dialog: "PromptExecuteDialog"):
+        super().__init__(dialog)
+        self.dialog = dialog
+        self.bubbles: list[UserMessageBubble | AssistantBubble] = []
+        self._slots: list[_Slot] = []
+        self._pool: dict[str, list[UserMessageBubble | AssistantBubble]] = {"user": [], "assistant": []}
+        self._spacers: list[QWidget] = []
+        self._chrome_height: dict[str, int] = {}
+        self._measured_width = 0
+        self._updating = False
+
+        self.container = QWidget()
+        self._layout = QVBoxLayout(self.container)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(SCROLL_CONTENT_SPACING)
+        self.container.hide()
+
+        scroll_bar = dialog.scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._on_scrolled)
+        dialog.scroll_area.viewport().installEventFilter(self)
+
+    def show_branch(self, tree: ConversationTree | None) -> None:
+        """Show the current path of tree, reusing the bubbles of messages already shown.
+
+        Bubbles whose message content differs from the tree are reset to the
+        tree's content, as the tree is authoritative when a branch is shown.
+        """
+        started = time.perf_counter()
+        previous = {slot.node.node_id: slot for slot in self._slots}
+        slots = []
+        if tree and not tree.is_empty():
+            for i, (user_node, assistant_node) in enumerate(tree.get_message_pairs()):
+                for node in (user_node, assistant_node):
+                    if node is None:
+                        continue
+                    slot = previous.pop(node.node_id, None)
+                    if slot is None or slot.role != node.role:
+                        slot = _Slot(node, i + 1)
+                    else:
+                        slot.node = node
+                        slot.number = i + 1
+                    slots.append(slot)
+
+        for slot in previous.values():
+            self._release(slot, sync=False)
+        self._slots = slots
+        self._update(refresh=True)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.debug(f"Showed {len(slots)} messages with {len(self.bubbles)} bubbles in {elapsed_ms:.1f} ms")
+
+    def clear(self) -> None:
+        """Remove every message, keeping the bubbles for reuse."""
+        for slot in self._slots:
+            self._release(slot, sync=False)
+        self._slots = []
+        self._update()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize and self._slots:
+            self._update()
+        return False
+
+    def _on_scrolled(self, _value: int) -> None:
+        if self._slots:
+            self._update()
+
+    # --- Windowing ---
+
+    def _update(self, refresh: bool = False) -> None:
+        """Back the messages around the viewport with bubbles and lay out the rest as spacers.
+
+        With refresh, bubbles that stay bound are checked against their
+        messages; otherwise only bubbles that appear are bound.
+        """
+        if self._updating:
+            return
+        self._updating = True
+        try:
+            # Keeping the viewport in place can scroll it onto messages that still need bubbles
+            for _ in range(3):
+                if not self._update_window(refresh):
+                    break
+                refresh = False
+        finally:
+            self._updating = False
+
+    def _update_window(self, refresh: bool) -> bool:
+        """Bind and release bubbles for the current scroll position; return whether it moved."""
+        self._measure()
+        scroll_bar = self.dialog.scroll_area.verticalScrollBar()
+        scroll_value = scroll_bar.value()
+        tops = self._tops()
+        anchor = self._anchor_index(tops, scroll_value)
+
+        wanted = self._wanted_indexes(tops)
+        for i, slot in enumerate(self._slots):
+            if slot.bubble is not None and i not in wanted:
+                self._release(slot, sync=True)
+        bound = []
+        for i in sorted(wanted):
+            slot = self._slots[i]
+            if slot.bubble is None:
+                self._bind(slot, self._acquire(slot.role))
+                bound.append(slot.bubble)
+            elif refresh:
+                self._refresh(slot)
+
+        self._rebuild_layout()
+        self._flush_layout()
+        if bound:
+            # Text heights depend on the width the bubbles only get once laid out
+            for bubble in bound:
+                bubble.fit_to_content()
+            self._flush_layout()
+        self._measure()
+
+        if anchor is None:
+            return False
+        # Keep the message at the top of the viewport in place while heights above it settle
+        target = self._tops()[anchor] - (tops[anchor] - scroll_value)
+        if target == scroll_value:
+            return False
+        scroll_bar.setValue(target)
+        return scroll_bar.value() != scroll_value
+
+    def _tops(self) -> list[int]:
+        """Top of each message in scroll area content coordinates."""
+        top = self.container.y()
+        tops = []
+        for slot in self._slots:
+            tops.append(top)
+            top += self._height(slot) + SCROLL_CONTENT_SPACING
+        return tops
+
+    def _anchor_index(self, tops: list[int], scroll_value: int) -> int | None:
+        if not self.container.isVisible():
+            return None
+        for i, top in enumerate(tops):
+            if top + self._height(self._slots[i]) > scroll_value:
+                return i
+        return None
+
+    def _wanted_indexes(self, tops: list[int]) -> set[int]:
+        """Messages within the overscanned viewport, plus the tail and the one receiving output."""
+        count = len(self._slots)
+        wanted = set(range(max(0, count - PINNED_TAIL), count))
+
+        viewport_height = self.dialog.scroll_area.viewport().height()
+        overscan = int(viewport_height * OVERSCAN_RATIO)
+        view_top = self.dialog.scroll_area.verticalScrollBar().value() - overscan
+        view_bottom = view_top + viewport_height + 2 * overscan
+        for i, top in enumerate(tops):
+            if top > view_bottom:
+                break
+            if top + self._height(self._slots[i]) >= view_top:
+                wanted.add(i)
+
+        pending_id = self.dialog._execution_handler._pending_assistant_node_id
+        if pending_id:
+            wanted.update(i for i, slot in enumerate(self._slots) if slot.node.node_id == pending_id)
+        return wanted
+
+    def _rebuild_layout(self) -> None:
+        """Lay out the bound bubbles in branch order with one spacer per run of unbound messages."""
+        layout = self._layout
+        while layout.count():
+            widget = layout.takeAt(0).widget()
+            if widget is not None and widget.objectName() == "conversationSpacer":
+                widget.hide()
+                self._spacers.append(widget)
+
+        self.bubbles[:] = []
+        run_height = 0
+        run_length = 0
+        for slot in [*self._slots, None]:
+            if slot is not None and slot.bubble is None:
+                run_height += self._height(slot)
+                run_length += 1
+                continue
+            if run_length:
+                spacer = self._spacers.pop() if self._spacers else self._create_spacer()
+                # The spacer replaces run_length items and the layout spacing between them
+                spacer.setFixedHeight(run_height + (run_length - 1) * SCROLL_CONTENT_SPACING)
+                layout.addWidget(spacer)
+                spacer.show()
+                run_height = run_length = 0
+            if slot is not None:
+                layout.addWidget(slot.bubble)
+                slot.bubble.show()
+                self.bubbles.append(slot.bubble)
+
+        self.container.setVisible(bool(self._slots))
+
+    def _flush_layout(self) -> None:
+        """Apply pending layout changes so the scroll range matches the new content height."""
+        self._layout.activate()
+        self.dialog.sections_layout.activate()
+        QApplication.sendPostedEvents(self.dialog.sections_container, QEvent.LayoutRequest)
+
+    def _create_spacer(self) -> QWidget:
+        spacer = QWidget()
+        spacer.setObjectName("conversationSpacer")
+        return spacer
+
+    # --- Heights ---
+
+    def _measure(self) -> None:
+        """Record the height of every bound bubble; forget measurements taken at another width."""
+        width = self.container.width()
+        resized = width != self._measured_width
+        self._measured_width = width
+        for slot in self._slots:
+            bubble = slot.bubble
+            if bubble is None:
+                if resized:
+                    slot.height = None
+                continue
+            wrapped = bubble.header.is_wrapped()
+            if resized and not wrapped:
+                bubble.fit_to_content()
+            slot.height = bubble.sizeHint().height()
+            slot.measured_content = slot.node.content
+            if not wrapped and not slot.node.images:
+                self._chrome_height[slot.role] = slot.height - bubble.text_edit.maximumHeight()
+
+    def _height(self, slot: _Slot) -> int:
+        if slot.height is None or slot.measured_content != slot.node.content:
+            # Kept until the message is measured, its content changes or the width does
+            slot.height = self._estimate_height(slot)
+            slot.measured_content = slot.node.content
+        return slot.height
+
+    def _estimate_height(self, slot: _Slot) -> int:
+        """Height of a message that has not been shown at this width, from its line count."""
+        font_metrics = self.dialog.input_edit.fontMetrics()
+        text_width = max(1, self.container.width() - _TEXT_EDIT_HORIZONTAL_INSET)
+        chars_per_line = max(1, text_width // max(1, font_metrics.averageCharWidth()))
+        lines = sum(1 + len(line) // chars_per_line for line in slot.node.content.split("\n"))
+        text_height = max(BUBBLE_TEXT_EDIT_MIN_HEIGHT, lines * font_metrics.lineSpacing() + _TEXT_EDIT_EXTRA_HEIGHT)
+        height = self._chrome_height.get(slot.role, _DEFAULT_CHROME_HEIGHT) + text_height
+        if slot.node.images:
+            height += _IMAGE_ROW_HEIGHT
+        return height
+
+    # --- Bubbles ---
+
+    def _acquire(self, role: str) -> UserMessageBubble | AssistantBubble:
+        pool = self._pool[role]
+        if pool:
+            return pool.pop()
+        dialog = self.dialog
+        if role == "user":
+            bubble = UserMessageBubble(node_id="", message_number=0, show_delete_button=False)
+            bubble.images_changed.connect(dialog._update_send_buttons_state)
+        else:
+            bubble = AssistantBubble(node_id="", output_number=0, show_delete_button=False)
+            bubble.regenerate_requested.connect(dialog._on_regenerate_from_bubble)
+            bubble.branch_prev_requested.connect(dialog._on_branch_prev)
+            bubble.branch_next_requested.connect(dialog._on_branch_next)
+        bubble.text_changed.connect(dialog._on_bubble_text_changed)
+        bubble.text_edit.installEventFilter(dialog)
+        return bubble
+
+    def _bind(self, slot: _Slot, bubble: UserMessageBubble | AssistantBubble) -> None:
+        node = slot.node
+        if isinstance(bubble, UserMessageBubble):
+            bubble.bind(node.node_id, slot.number, node.content, node.images, node.undo_stack, node.redo_stack)
+        else:
+            bubble.bind(node.node_id, slot.number, node.content, node.undo_stack, node.redo_stack)
+            self._update_branch_info(bubble)
+        slot.bubble = bubble
+
+    def _refresh(self, slot: _Slot) -> None:
+        """Bring a bubble that stays on the branch in line with its message."""
+        bubble = slot.bubble
+        node = slot.node
+        images_differ = isinstance(bubble, UserMessageBubble) and bubble.get_images() != node.images
+        if bubble.get_content() != node.content or images_differ:
+            self._bind(slot, bubble)
+            return
+        if isinstance(bubble, UserMessageBubble):
+            bubble.set_message_number(slot.number)
+        else:
+            bubble.set_output_number(slot.number)
+            self._update_branch_info(bubble)
+
+    def _update_branch_info(self, bubble: AssistantBubble) -> None:
+        siblings, idx = self.dialog._conversation_tree.get_siblings(bubble.node_id)
+        bubble.set_branch_info(idx + 1, len(siblings))
+
+    def _release(self, slot: _Slot, sync: bool) -> None:
+        """Detach the bubble from its message, saving edits to the message first if sync is set."""
+        bubble = slot.bubble
+        if bubble is None:
+            return
+        slot.bubble = None
+        if sync:
+            node = slot.node
+            content = bubble.get_content()
+            # Skip empty assistant content, as _sync_bubbles_to_tree does
+            if node.role == "user" or content.strip():
+                node.content = content
+                node.last_text = content
+            if isinstance(bubble, UserMessageBubble):
+                node.images = bubble.get_images()
+            node.undo_stack, node.redo_stack = bubble.get_undo_state()
+            slot.measured_content = node.content
+
+        self._layout.removeWidget(bubble)
+        bubble.hide()
+        pool = self._pool[slot.role]
+        if len(pool) < POOL_LIMIT:
+            pool.append(bubble)
+        else:
+            bubble.setParent(None)
+            bubble.deleteLater()
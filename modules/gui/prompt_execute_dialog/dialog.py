@@ -17,6 +17,7 @@ from core.context_manager import ContextItem, ContextItemType, ContextManager
 from core.models import MenuItem
 from modules.gui.icons import create_composite_icon, create_icon
 from modules.gui.prompt_execute_dialog.conversation_manager import ConversationManager
+from modules.gui.prompt_execute_dialog.conversation_view import ConversationView
 from modules.gui.prompt_execute_dialog.data import (
     ContextSectionState,
     ConversationNode,
@@ -292,9 +293,11 @@ class PromptExecuteDialog(BaseDialog):
         self.output_section = self._create_output_section()
         # Output section is hidden until user clicks Alt+Enter
 
-        # Initialize conversation tree
+        # Initialize conversation tree; its bubbles go in front of the stretch
         self._conversation_tree = ConversationTree()
-        self._message_bubbles: list[UserMessageBubble | AssistantBubble] = []
+        self._conversation_view = ConversationView(self)
+        self.sections_layout.insertWidget(0, self._conversation_view.container)
+        self._message_bubbles: list[UserMessageBubble | AssistantBubble] = self._conversation_view.bubbles
 
         # Button bar (includes tabs inline)
         self._create_button_bar(layout)
@@ -1385,69 +1388,28 @@ class PromptExecuteDialog(BaseDialog):
 
     def _restore_conversation_tree(self, tree: ConversationTree | None):
         """Restore conversation tree and rebuild message bubbles."""
-        self._clear_message_bubbles()
         if not tree:
+            self._clear_message_bubbles()
             self._conversation_tree = ConversationTree()
             return
         self._conversation_tree = tree
         self._rebuild_message_bubbles_from_tree()
 
     def _clear_message_bubbles(self):
-        """Remove all message bubble widgets from layout."""
-        for bubble in self._message_bubbles:
-            self.sections_layout.removeWidget(bubble)
-            bubble.setParent(None)
-            bubble.deleteLater()
-        self._message_bubbles.clear()
+        """Remove all message bubbles from the conversation view, keeping the widgets for reuse."""
+        self._conversation_view.clear()
 
     def _rebuild_message_bubbles_from_tree(self):
-        """Rebuild message bubble widgets from the conversation tree."""
-        self._clear_message_bubbles()
+        """Show the current branch of the conversation tree.
 
+        Bubbles of messages that were already shown are kept, and only the
+        messages near the visible area get bubble widgets.
+        """
         if not self._conversation_tree or self._conversation_tree.is_empty():
+            self._clear_message_bubbles()
             return
 
-        pairs = self._conversation_tree.get_message_pairs()
-        for i, (user_node, assistant_node) in enumerate(pairs):
-            message_number = i + 1
-
-            # Create user message bubble
-            user_bubble = UserMessageBubble(
-                node_id=user_node.node_id,
-                message_number=message_number,
-                content=user_node.content,
-                images=list(user_node.images),
-                show_delete_button=False,
-            )
-            user_bubble.text_changed.connect(self._on_bubble_text_changed)
-            user_bubble.images_changed.connect(self._update_send_buttons_state)
-            user_bubble.text_edit.installEventFilter(self)
-            self._message_bubbles.append(user_bubble)
-            # Insert before stretch
-            insert_idx = self.sections_layout.count() - 1
-            self.sections_layout.insertWidget(insert_idx, user_bubble)
-
-            # Create assistant bubble if response exists
-            if assistant_node:
-                assistant_bubble = AssistantBubble(
-                    node_id=assistant_node.node_id,
-                    output_number=message_number,
-                    content=assistant_node.content,
-                    show_delete_button=False,
-                )
-                assistant_bubble.text_changed.connect(self._on_bubble_text_changed)
-                assistant_bubble.regenerate_requested.connect(self._on_regenerate_from_bubble)
-                assistant_bubble.branch_prev_requested.connect(self._on_branch_prev)
-                assistant_bubble.branch_next_requested.connect(self._on_branch_next)
-                assistant_bubble.text_edit.installEventFilter(self)
-                self._message_bubbles.append(assistant_bubble)
-                insert_idx = self.sections_layout.count() - 1
-                self.sections_layout.insertWidget(insert_idx, assistant_bubble)
-
-                # Update branch navigation
-                siblings, idx = self._conversation_tree.get_siblings(assistant_node.node_id)
-                assistant_bubble.set_branch_info(idx + 1, len(siblings))
-
+        self._conversation_view.show_branch(self._conversation_tree)
         self._update_delete_button_visibility()
 
         # Ensure focus stays on sticky input for next message
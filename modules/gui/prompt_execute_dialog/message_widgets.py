@@ -279,6 +279,45 @@ class UserMessageBubble(QWidget):
     def set_delete_button_visible(self, visible: bool):
         self.header.set_delete_button_visible(visible)
 
+    def bind(
+        self,
+        node_id: str,
+        message_number: int,
+        content: str,
+        images: list[ContextItem] | None = None,
+        undo_stack: list[str] | None = None,
+        redo_stack: list[str] | None = None,
+    ):
+        """Show another message in this bubble, as if it had been created for it."""
+        self._save_timer.stop()
+        self.node_id = node_id
+        self.set_message_number(message_number)
+        if self._images or images:
+            self._images = list(images or [])
+            self._rebuild_image_chips()
+        self.set_content(content)
+        self._undo_stack = list(undo_stack or [])
+        self._redo_stack = list(redo_stack or [])
+        self._update_undo_redo_buttons()
+        if self.header.is_collapsed():
+            self._toggle_section()
+        if self.header.is_wrapped():
+            self._toggle_wrap()
+        else:
+            self.fit_to_content()
+
+    def get_undo_state(self) -> tuple[list[str], list[str]]:
+        """Record any pending edit and return copies of the undo and redo stacks."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save_state_if_changed()
+        return list(self._undo_stack), list(self._redo_stack)
+
+    def fit_to_content(self):
+        content_height = get_text_edit_content_height(self.text_edit, min_height=BUBBLE_TEXT_EDIT_MIN_HEIGHT)
+        self.text_edit.setMinimumHeight(content_height)
+        self.text_edit.setMaximumHeight(content_height)
+
 
 class AssistantBubble(QWidget):
     """Chat bubble widget for assistant (AI) responses.
@@ -458,6 +497,41 @@ class AssistantBubble(QWidget):
     def set_delete_button_visible(self, visible: bool):
         self.header.set_delete_button_visible(visible)
 
+    def bind(
+        self,
+        node_id: str,
+        output_number: int,
+        content: str,
+        undo_stack: list[str] | None = None,
+        redo_stack: list[str] | None = None,
+    ):
+        """Show another response in this bubble, as if it had been created for it."""
+        self._save_timer.stop()
+        self.node_id = node_id
+        self.set_output_number(output_number)
+        self.set_content(content)
+        self._undo_stack = list(undo_stack or [])
+        self._redo_stack = list(redo_stack or [])
+        self._update_undo_redo_buttons()
+        if self.header.is_collapsed():
+            self._toggle_section()
+        if self.header.is_wrapped():
+            self._toggle_wrap()
+        else:
+            self.fit_to_content()
+
+    def get_undo_state(self) -> tuple[list[str], list[str]]:
+        """Record any pending edit and return copies of the undo and redo stacks."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save_state_if_changed()
+        return list(self._undo_stack), list(self._redo_stack)
+
+    def fit_to_content(self):
+        content_height = get_text_edit_content_height(self.text_edit, min_height=BUBBLE_TEXT_EDIT_MIN_HEIGHT)
+        self.text_edit.setMinimumHeight(content_height)
+        self.text_edit.setMaximumHeight(content_height)
+
     def set_branch_info(self, current: int, total: int):
         """Update branch navigation display.
 
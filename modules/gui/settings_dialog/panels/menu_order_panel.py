@@ -28,6 +28,7 @@ from ..settings_panel_base import SettingsPanelBase
 SECTION_LABELS = {
     "LastInteractionMenuProvider": "Last Interaction",
     "ContextMenuProvider": "Context",
+    "ClipboardHistoryMenuProvider": "Clipboard History",
     "SpeechMenuProvider": "Speech to Text",
     "prompts": "Prompts",
     "settings": "Settings",
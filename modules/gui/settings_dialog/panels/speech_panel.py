@@ -9,6 +9,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from core.speech_backends import LOCAL_BACKEND
 from modules.gui.shared.theme import (
     COLOR_BORDER,
     COLOR_TEXT,
@@ -116,19 +117,26 @@ class SpeechPanel(SettingsPanelBase):
         display_name = self._display_name_edit.text().strip()
         api_key_env = self._api_key_env_edit.text().strip()
 
-        if not all([model, display_name, api_key_env]):
+        # Keep keys that are only configurable in settings.json (backend, segmentation, ...)
+        speech_config = dict(self._config_service.get_settings_data().get("speech_to_text_model") or {})
+        is_local = speech_config.get("backend", "openai") == LOCAL_BACKEND
+
+        if not all([model, display_name]) or not (api_key_env or is_local):
             self.mark_clean()
             return True
 
-        speech_config = {
-            "model": model,
-            "display_name": display_name,
-            "api_key_env": api_key_env,
-        }
+        speech_config.update({"model": model, "display_name": display_name})
+        if api_key_env:
+            speech_config["api_key_env"] = api_key_env
+        else:
+            speech_config.pop("api_key_env", None)
+        speech_config.pop("api_key", None)
 
         base_url = self._base_url_edit.text().strip()
         if base_url:
             speech_config["base_url"] = base_url
+        else:
+            speech_config.pop("base_url", None)
 
         self._config_service.update_speech_model(speech_config, persist=False)
         self.mark_clean()
@@ -63,6 +63,7 @@ from modules.gui.shared.theme import (
     DIALOG_SHOW_DELAY_MS,
     DIALOG_STYLESHEET,
     ICON_BTN_STYLE,
+    MENU_ITEM_STYLE,
     MENU_STYLESHEET,
     MIN_DIALOG_SIZE,
     NOTIFICATION_BODY_STYLE,
@@ -87,6 +88,7 @@ from modules.gui.shared.theme import (
     create_singleton_dialog_manager,
     get_dialog_stylesheet,
     get_text_edit_content_height,
+    set_style_state,
 )
 
 # Image handler
@@ -159,6 +161,7 @@ __all__ = [
     "SPINBOX_STYLE",
     "DIALOG_STYLESHEET",
     "MENU_STYLESHEET",
+    "MENU_ITEM_STYLE",
     "CHIP_STYLE",
     "CHIP_HOVER_STYLE",
     "CHIP_DISABLED_STYLE",
@@ -181,6 +184,7 @@ __all__ = [
     "apply_wrap_state",
     "apply_section_size_policy",
     "create_singleton_dialog_manager",
+    "set_style_state",
     # Base dialog
     "BaseDialog",
     # Context widgets
@@ -5,7 +5,7 @@ import contextlib
 import logging
 from collections.abc import Callable
 
-from PySide6.QtCore import QBuffer, QByteArray, QPoint, QSize, Qt, Signal
+from PySide6.QtCore import QByteArray, QPoint, QSize, Qt, Signal
 from PySide6.QtGui import QImage
 from PySide6.QtWidgets import (
     QApplication,
@@ -28,6 +28,7 @@ from modules.gui.icons import (
     create_icon,
 )
 from modules.gui.shared.theme import TOOLTIP_STYLE
+from modules.gui.shared.thumbnails import ThumbnailTooltipMixin
 
 
 class IconButton(QPushButton):
@@ -233,7 +234,7 @@ class TextContextChip(ContextChipBase):
         clipboard.setText(self.full_text)
 
 
-class ImageContextChip(ContextChipBase):
+class ImageContextChip(ThumbnailTooltipMixin, ContextChipBase):
     """Chip widget for image context items."""
 
     def __init__(
@@ -253,55 +254,6 @@ class ImageContextChip(ContextChipBase):
         # Create tooltip with thumbnail preview
         self._setup_image_tooltip()
 
-    def _setup_image_tooltip(self):
-        """Set up tooltip with image thumbnail and metadata."""
-        try:
-            # Decode base64 image data
-            image_bytes = base64.b64decode(self.image_data)
-            image = QImage()
-            image.loadFromData(QByteArray(image_bytes))
-
-            if image.isNull():
-                self.setToolTip("Image preview unavailable")
-                return
-
-            # Get original dimensions
-            orig_width = image.width()
-            orig_height = image.height()
-
-            # Scale to thumbnail (max 300px)
-            thumbnail = image.scaled(
-                300,
-                300,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
-
-            # Convert to base64 PNG for HTML tooltip
-            buffer = QBuffer()
-            buffer.open(QBuffer.WriteOnly)
-            thumbnail.save(buffer, "PNG")
-            thumb_base64 = base64.b64encode(buffer.data()).decode("utf-8")
-            buffer.close()
-
-            # Get format from media type
-            format_name = self.media_type.split("/")[-1].upper()
-
-            # Create HTML tooltip
-            tooltip_html = f"""
-                <div style="text-align: center;">
-                    <img src="data:image/png;base64,{thumb_base64}" /><br/>
-                    <span style="color: #888888; font-size: 11px;">
-                        {orig_width} x {orig_height} ({format_name})
-                    </span>
-                </div>
-            """
-            self.setToolTip(tooltip_html)
-
-        except Exception as e:
-            logger.warning(f"Failed to create image tooltip: {e}")
-            self.setToolTip("Image preview unavailable")
-
     def copy_to_clipboard(self):
         """Copy image to clipboard."""
         try:
@@ -741,9 +693,14 @@ class ContextSectionWidget(QWidget):
     def _has_clipboard_content(self) -> bool:
         """Check if clipboard has any content (text or image).
 
-        Uses Qt clipboard directly to avoid X11 deadlock that occurs when
-        subprocess calls (xclip/xsel) are made while Qt owns the clipboard.
+        Uses the clipboard snapshot when available, otherwise Qt clipboard
+        directly to avoid X11 deadlock that occurs when subprocess calls
+        (xclip/xsel) are made while Qt owns the clipboard.
         """
+        snapshot = self.clipboard_manager.get_snapshot() if hasattr(self.clipboard_manager, "get_snapshot") else None
+        if snapshot is not None:
+            return snapshot.has_image or bool(snapshot.text.strip())
+
         try:
             from PySide6.QtWidgets import QApplication
 
@@ -286,6 +286,45 @@ MENU_STYLESHEET = f"""
     }}
 """
 
+# Context menu rows (ClickableMenuItem) and the type-ahead filter header. Parsed once with the menu stylesheet; rows switch
+# between styles through the "state" dynamic property (see set_style_state) instead of
+# setting their own stylesheets.
+MENU_ITEM_STYLE = f"""
+    QWidget#menuItem, QWidget#menuItem QWidget {{
+        background-color: transparent;
+        border-radius: 4px;
+        margin: 1px;
+    }}
+    QWidget#menuItem[state="hover"] {{
+        background-color: {COLOR_BUTTON_HOVER};
+    }}
+    QWidget#menuItem QLabel#menuItemLabel {{
+        color: {COLOR_TEXT};
+        font-size: 13px;
+    }}
+    QWidget#menuItem QLabel#menuItemLabel[state="hover"] {{
+        color: {COLOR_TEXT_WHITE};
+    }}
+    QWidget#menuItem QLabel#menuItemLabel[state="disabled"] {{
+        color: {COLOR_TEXT_HINT};
+    }}
+    QWidget#menuItem QPushButton#menuItemButton {{
+        background: transparent;
+        border: none;
+        padding: 2px;
+        min-width: 20px;
+        max-width: 20px;
+        min-height: 20px;
+        max-height: 20px;
+    }}
+    QLabel#menuFilter {{
+        background-color: transparent;
+        color: {COLOR_TEXT_HINT};
+        font-size: 12px;
+        padding: 6px 16px;
+    }}
+"""
+
 # Chip styles
 CHIP_STYLE = f"""
     QWidget#chip {{
@@ -460,6 +499,16 @@ def get_dialog_stylesheet() -> str:
     return DIALOG_STYLESHEET + TOOLTIP_STYLE
 
 
+def set_style_state(widget: QWidget, state: str) -> None:
+    """Set the "state" property matched by stylesheet selectors, re-polishing only on change."""
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
 def get_text_edit_content_height(text_edit, min_height: int = 100) -> int:
     """Calculate the height needed to display all content without scrolling.
 
@@ -0,0 +1,228 @@
+"""Asynchronous image thumbnail generation with memory and disk caches."""
+
+import base64
+import contextlib
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from PySide6.QtCore import QBuffer, QByteArray, QObject, QRunnable, Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage
+
+from modules.utils.paths import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SIZE = 300
+MEMORY_CACHE_SIZE = 64
+DISK_CACHE_MAX_FILES = 500
+MAX_WORKER_THREADS = 2
+
+_ORIGINAL_SIZE_KEY = "promptheus-original-size"
+
+
+@dataclass(frozen=True)
+class Thumbnail:
+    """Rendered thumbnail with the dimensions of its source image."""
+
+    png_base64: str
+    width: int
+    height: int
+
+
+def thumbnail_key(image_data: str, size: int = THUMBNAIL_SIZE) -> str:
+    """Cache key for a base64 image rendered at the given size."""
+    content_hash = hashlib.sha1(image_data.encode("ascii", "ignore")).hexdigest()
+    return f"{content_hash}_{size}"
+
+
+def build_thumbnail_tooltip(thumbnail: Thumbnail | None, media_type: str) -> str:
+    """Build HTML tooltip showing a thumbnail and image metadata."""
+    if thumbnail is None:
+        return "Image preview unavailable"
+
+    format_name = media_type.split("/")[-1].upper()
+    return f"""
+        <div style="text-align: center;">
+            <img src="data:image/png;base64,{thumbnail.png_base64}" /><br/>
+            <span style="color: #888888; font-size: 11px;">
+                {thumbnail.width} x {thumbnail.height} ({format_name})
+            </span>
+        </div>
+    """
+
+
+def _render_thumbnail(image_data: str, size: int) -> QImage | None:
+    """Decode a base64 image and scale it to fit within size x size."""
+    image = QImage()
+    image.loadFromData(QByteArray(base64.b64decode(image_data)))
+    if image.isNull():
+        return None
+
+    thumbnail = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    thumbnail.setText(_ORIGINAL_SIZE_KEY, f"{image.width()}x{image.height()}")
+    return thumbnail
+
+
+def _load_from_disk(key: str) -> Thumbnail | None:
+    """Load a cached thumbnail PNG from disk."""
+    path = get_cache_dir("thumbnails") / f"{key}.png"
+    if not path.exists():
+        return None
+
+    png_bytes = path.read_bytes()
+    image = QImage()
+    image.loadFromData(QByteArray(png_bytes))
+    original_size = image.text(_ORIGINAL_SIZE_KEY)
+    if image.isNull() or "x" not in original_size:
+        return None
+
+    width, height = (int(part) for part in original_size.split("x", 1))
+    with contextlib.suppress(OSError):
+        path.touch()
+    return Thumbnail(base64.b64encode(png_bytes).decode("utf-8"), width, height)
+
+
+def _save_to_disk(key: str, png_bytes: bytes) -> None:
+    """Write a thumbnail PNG to the disk cache."""
+    path = get_cache_dir("thumbnails") / f"{key}.png"
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(png_bytes)
+    tmp_path.replace(path)
+
+
+def _prune_disk_cache() -> None:
+    """Remove least recently used thumbnails beyond DISK_CACHE_MAX_FILES."""
+    files = sorted(get_cache_dir("thumbnails").glob("*.png"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for path in files[DISK_CACHE_MAX_FILES:]:
+        with contextlib.suppress(OSError):
+            path.unlink()
+
+
+class _ThumbnailJob(QRunnable):
+    """Worker that resolves one thumbnail from disk or by rendering it."""
+
+    def __init__(self, service: "ThumbnailService", key: str, image_data: str, size: int):
+        super().__init__()
+        self._service = service
+        self._key = key
+        self._image_data = image_data
+        self._size = size
+
+    def run(self):
+        thumbnail = None
+        try:
+            thumbnail = _load_from_disk(self._key)
+            if thumbnail is None:
+                image = _render_thumbnail(self._image_data, self._size)
+                if image is not None:
+                    buffer = QBuffer()
+                    buffer.open(QBuffer.WriteOnly)
+                    image.save(buffer, "PNG")
+                    png_bytes = bytes(buffer.data())
+                    buffer.close()
+
+                    original = image.text(_ORIGINAL_SIZE_KEY).split("x", 1)
+                    thumbnail = Thumbnail(
+                        base64.b64encode(png_bytes).decode("utf-8"),
+                        int(original[0]),
+                        int(original[1]),
+                    )
+                    try:
+                        _save_to_disk(self._key, png_bytes)
+                    except OSError as e:
+                        logger.debug(f"Failed to write thumbnail cache: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to create image thumbnail: {e}")
+            thumbnail = None
+
+        self._service._job_finished.emit(self._key, thumbnail)
+
+
+class ThumbnailService(QObject):
+    """Generates image thumbnails on a worker pool.
+
+    Results are cached in an in-memory LRU keyed by content hash and size,
+    and persisted as PNG files so they survive restarts. Consumers request
+    a thumbnail and receive it through ``thumbnail_ready``; cached results
+    are returned synchronously from ``request``.
+    """
+
+    thumbnail_ready = Signal(str, object)  # key, Thumbnail | None
+    _job_finished = Signal(str, object)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._memory_cache: OrderedDict[str, Thumbnail | None] = OrderedDict()
+        self._pending: set[str] = set()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(MAX_WORKER_THREADS)
+        self._job_finished.connect(self._on_job_finished, Qt.QueuedConnection)
+        self._pool.start(_prune_disk_cache)
+
+    def request(self, image_data: str, size: int = THUMBNAIL_SIZE) -> tuple[str, Thumbnail | None, bool]:
+        """Request a thumbnail for base64 image data.
+
+        Returns:
+            Tuple of (key, thumbnail, ready). When ready is False the result
+            will be delivered later via ``thumbnail_ready`` with the same key.
+        """
+        key = thumbnail_key(image_data, size)
+        if key in self._memory_cache:
+            self._memory_cache.move_to_end(key)
+            return key, self._memory_cache[key], True
+
+        if key not in self._pending:
+            self._pending.add(key)
+            self._pool.start(_ThumbnailJob(self, key, image_data, size))
+        return key, None, False
+
+    def _on_job_finished(self, key: str, thumbnail: Thumbnail | None) -> None:
+        """Store a finished thumbnail and notify listeners (GUI thread)."""
+        self._pending.discard(key)
+        self._memory_cache[key] = thumbnail
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+        self.thumbnail_ready.emit(key, thumbnail)
+
+
+_thumbnail_service: ThumbnailService | None = None
+
+
+def get_thumbnail_service() -> ThumbnailService:
+    """Get the shared ThumbnailService instance."""
+    global _thumbnail_service
+    if _thumbnail_service is None:
+        _thumbnail_service = ThumbnailService()
+    return _thumbnail_service
+
+
+class ThumbnailTooltipMixin:
+    """Mixin for image chip widgets that show a thumbnail tooltip.
+
+    Expects ``image_data`` and ``media_type`` attributes on the widget.
+    """
+
+    _thumbnail_key: str | None = None
+
+    def _setup_image_tooltip(self):
+        """Set up tooltip with image thumbnail, rendered off the GUI thread."""
+        service = get_thumbnail_service()
+        key, thumbnail, ready = service.request(self.image_data)
+        if ready:
+            self.setToolTip(build_thumbnail_tooltip(thumbnail, self.media_type))
+            return
+
+        self._thumbnail_key = key
+        self.setToolTip("Loading preview...")
+        service.thumbnail_ready.connect(self._on_thumbnail_ready)
+
+    def _on_thumbnail_ready(self, key: str, thumbnail: Thumbnail | None) -> None:
+        """Apply an asynchronously rendered thumbnail to the tooltip."""
+        if key != self._thumbnail_key:
+            return
+        self._thumbnail_key = None
+        get_thumbnail_service().thumbnail_ready.disconnect(self._on_thumbnail_ready)
+        self.setToolTip(build_thumbnail_tooltip(thumbnail, self.media_type))
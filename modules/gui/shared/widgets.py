@@ -5,7 +5,7 @@ import logging
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Generic, TypeVar
 
-from PySide6.QtCore import QBuffer, QByteArray, Qt, QTimer, Signal
+from PySide6.QtCore import QByteArray, Qt, QTimer, Signal
 
 if TYPE_CHECKING:
     from core.context_manager import ContextItem
@@ -34,6 +34,7 @@ from modules.gui.shared.theme import (
     SECTION_TITLE_STYLE,
     TOOLTIP_STYLE,
 )
+from modules.gui.shared.thumbnails import ThumbnailTooltipMixin
 from modules.gui.shared.undo_redo import TextEditUndoHelper
 from modules.utils.notification_config import is_notification_enabled
 
@@ -348,7 +349,7 @@ class CollapsibleSectionHeader(QWidget):
             self.regenerate_btn.setEnabled(enabled)
 
 
-class ImageChipWidget(QWidget):
+class ImageChipWidget(ThumbnailTooltipMixin, QWidget):
     """Chip widget for displaying an image in the editor."""
 
     delete_requested = Signal(int)
@@ -446,42 +447,6 @@ class ImageChipWidget(QWidget):
         # Setup tooltip with thumbnail
         self._setup_image_tooltip()
 
-    def _setup_image_tooltip(self):
-        """Set up tooltip with image thumbnail."""
-        try:
-            image_bytes = base64.b64decode(self.image_data)
-            image = QImage()
-            image.loadFromData(QByteArray(image_bytes))
-
-            if image.isNull():
-                self.setToolTip("Image preview unavailable")
-                return
-
-            orig_width = image.width()
-            orig_height = image.height()
-
-            thumbnail = image.scaled(300, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-            buffer = QBuffer()
-            buffer.open(QBuffer.WriteOnly)
-            thumbnail.save(buffer, "PNG")
-            thumb_base64 = base64.b64encode(buffer.data()).decode("utf-8")
-            buffer.close()
-
-            format_name = self.media_type.split("/")[-1].upper()
-            tooltip_html = f"""
-                <div style="text-align: center;">
-                    <img src="data:image/png;base64,{thumb_base64}" /><br/>
-                    <span style="color: #888888; font-size: 11px;">
-                        {orig_width} x {orig_height} ({format_name})
-                    </span>
-                </div>
-            """
-            self.setToolTip(tooltip_html)
-        except Exception as e:
-            logger.warning(f"Failed to create image tooltip: {e}")
-            self.setToolTip("Image preview unavailable")
-
     def _on_copy_clicked(self):
         self.copy_requested.emit(self.index)
 
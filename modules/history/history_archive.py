@@ -0,0 +1,311 @@
+"""Streaming JSONL export/import of history entries.
+
+Archive layout, one JSON object per line:
+
+    {"type": "header", "format": "promptheus-history", "version": 1}
+    {"type": "image", "hash": "...", "media_type": "image/png", "data": "<base64>"}
+    {"type": "entry", "entry": {...}}
+
+Image paths inside entries are replaced by ``{"hash", "media_type"}``
+references. Image payloads are either inlined as ``image`` records (written
+once per hash, before the first entry that uses them) or stored as files
+named ``<hash><ext>`` in a sidecar directory next to the archive. On import,
+images are only written for entries that history keeps.
+
+Both directions are generator pipelines that hold one entry at a time, so
+memory use does not depend on archive size.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from core.exceptions import DataError
+from core.models import HistoryEntry
+from modules.history import image_storage
+from modules.history.history_storage import entry_from_dict, entry_to_dict
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMAT = "promptheus-history"
+ARCHIVE_VERSION = 1
+DEFAULT_IMPORT_BATCH_SIZE = 100
+
+
+def get_images_dir(archive_path: Path) -> Path:
+    """Sidecar directory holding referenced (non-inlined) images."""
+    return archive_path.with_name(f"{archive_path.stem}_images")
+
+
+def _map_image_paths(entry_data: dict[str, Any], convert: Callable[[str], Any]) -> None:
+    """Apply convert to every image path/reference inside a serialized entry."""
+    conv = entry_data.get("conversation_data")
+    if not conv:
+        return
+    conv["context_image_paths"] = [convert(p) for p in conv.get("context_image_paths", [])]
+    for turn in conv.get("turns", []):
+        turn["message_image_paths"] = [convert(p) for p in turn.get("message_image_paths", [])]
+    for node in conv.get("nodes", []):
+        node["image_paths"] = [convert(p) for p in node.get("image_paths", [])]
+
+
+def _export_records(
+    entries: Iterable[HistoryEntry],
+    inline_images: bool,
+    images_dir: Path,
+) -> Iterator[dict[str, Any]]:
+    """Turn history entries into archive records."""
+    yield {"type": "header", "format": ARCHIVE_FORMAT, "version": ARCHIVE_VERSION}
+
+    written_hashes: set[str] = set()
+    for entry in entries:
+        pending_images: list[dict[str, Any]] = []
+
+        def to_reference(path: str, pending_images=pending_images) -> dict[str, str] | None:
+            image_path = Path(path)
+            if not image_path.exists():
+                logger.warning(f"Skipping missing history image: {path}")
+                return None
+            image_bytes = image_path.read_bytes()
+            content_hash = hashlib.sha256(image_bytes).hexdigest()
+            media_type = image_storage.get_media_type_for_extension(image_path.suffix)
+            if content_hash not in written_hashes:
+                written_hashes.add(content_hash)
+                if inline_images:
+                    pending_images.append(
+                        {
+                            "type": "image",
+                            "hash": content_hash,
+                            "media_type": media_type,
+                            "data": base64.b64encode(image_bytes).decode("ascii"),
+                        }
+                    )
+                else:
+                    extension = image_storage.get_extension_for_media_type(media_type)
+                    (images_dir / f"{content_hash}{extension}").write_bytes(image_bytes)
+            return {"hash": content_hash, "media_type": media_type}
+
+        entry_data = entry_to_dict(entry)
+        _map_image_paths(entry_data, to_reference)
+        _drop_missing_references(entry_data)
+
+        yield from pending_images
+        yield {"type": "entry", "entry": entry_data}
+
+
+def _drop_missing_references(entry_data: dict[str, Any]) -> None:
+    """Remove references to images that could not be read."""
+    conv = entry_data.get("conversation_data")
+    if not conv:
+        return
+    conv["context_image_paths"] = [r for r in conv["context_image_paths"] if r]
+    for turn in conv.get("turns", []):
+        turn["message_image_paths"] = [r for r in turn["message_image_paths"] if r]
+    for node in conv.get("nodes", []):
+        node["image_paths"] = [r for r in node["image_paths"] if r]
+
+
+def _read_records(archive_path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Lazily parse archive lines with their byte offsets, validating the header."""
+    with open(archive_path, "rb") as f:
+        header_seen = False
+        offset = 0
+        for line_number, raw_line in enumerate(f, start=1):
+            line_offset = offset
+            offset += len(raw_line)
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                raise DataError(f"Invalid JSON on line {line_number} of {archive_path}: {e}") from e
+
+            if not header_seen:
+                if record.get("type") != "header" or record.get("format") != ARCHIVE_FORMAT:
+                    raise DataError(f"Not a history archive: {archive_path}")
+                if record.get("version", 0) > ARCHIVE_VERSION:
+                    raise DataError(f"Unsupported history archive version: {record.get('version')}")
+                header_seen = True
+                continue
+
+            yield line_offset, record
+
+
+@dataclass
+class _ImageSource:
+    """Where to read an archived image once an entry using it is kept."""
+
+    media_type: str
+    offset: int | None = None  # Inline image record in the archive
+    sidecar_file: Path | None = None
+
+
+class _ImageRestorer:
+    """Assigns temp paths to archived images and writes only those of kept entries.
+
+    Inline image data is not held in memory: only its record offset is
+    remembered, and the record is read again when an entry needs it.
+    """
+
+    def __init__(self, archive_path: Path, images_dir: Path):
+        self._archive_path = archive_path
+        self._images_dir = images_dir
+        self._paths: dict[str, str] = {}  # hash -> assigned temp path
+        self._pending: dict[str, _ImageSource] = {}  # temp path -> source, until written
+
+    def add_inline(self, content_hash: str, media_type: str, offset: int) -> None:
+        if content_hash not in self._paths:
+            self._assign(content_hash, _ImageSource(media_type, offset=offset))
+
+    def to_path(self, reference: dict[str, str]) -> str | None:
+        """Temp path for an image reference, or None if the archive lacks the image."""
+        content_hash = reference.get("hash", "")
+        if content_hash in self._paths:
+            return self._paths[content_hash]
+
+        media_type = reference.get("media_type", "image/png")
+        extension = image_storage.get_extension_for_media_type(media_type)
+        image_file = self._images_dir / f"{content_hash}{extension}"
+        if not image_file.exists():
+            logger.warning(f"History archive image not found: {content_hash}")
+            return None
+        return self._assign(content_hash, _ImageSource(media_type, sidecar_file=image_file))
+
+    def restore(self, entries: Iterable[HistoryEntry]) -> None:
+        """Write the images referenced by entries that are not on disk yet."""
+        for entry in entries:
+            for path in _entry_image_paths(entry):
+                source = self._pending.pop(path, None)
+                if source is None:
+                    continue
+                try:
+                    image_bytes = self._read(source)
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning(f"Failed to restore history image {path}: {e}")
+                    continue
+                image_storage.save_image_bytes(image_bytes, source.media_type, path)
+
+    def _assign(self, content_hash: str, source: _ImageSource) -> str:
+        path = image_storage.get_image_path(content_hash, source.media_type)
+        self._paths[content_hash] = path
+        self._pending[path] = source
+        return path
+
+    def _read(self, source: _ImageSource) -> bytes:
+        if source.sidecar_file is not None:
+            return source.sidecar_file.read_bytes()
+        with open(self._archive_path, "rb") as f:
+            f.seek(source.offset)
+            record = json.loads(f.readline())
+        return base64.b64decode(record["data"])
+
+
+def _entry_image_paths(entry: HistoryEntry) -> list[str]:
+    """All image paths used by an entry."""
+    conv = entry.conversation_data
+    if not conv:
+        return []
+    paths = list(conv.context_image_paths)
+    for turn in conv.turns:
+        paths.extend(turn.message_image_paths)
+    for node in conv.nodes:
+        paths.extend(node.image_paths)
+    return paths
+
+
+def _import_entries(records: Iterable[tuple[int, dict[str, Any]]], images: _ImageRestorer) -> Iterator[HistoryEntry]:
+    """Yield entries with temp image paths assigned; images are written later by images.restore."""
+    for offset, record in records:
+        record_type = record.get("type")
+        if record_type == "image":
+            images.add_inline(record["hash"], record.get("media_type", "image/png"), offset)
+        elif record_type == "entry":
+            entry_data = record["entry"]
+            _map_image_paths(entry_data, images.to_path)
+            _drop_missing_references(entry_data)
+            yield entry_from_dict(entry_data)
+        else:
+            logger.debug(f"Skipping unknown history archive record: {record_type}")
+
+
+def _batched(items: Iterable[HistoryEntry], batch_size: int) -> Iterator[list[HistoryEntry]]:
+    """Group an iterable into lists of at most batch_size items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def export_history(
+    entries: Iterable[HistoryEntry],
+    archive_path: str | Path,
+    inline_images: bool = True,
+) -> int:
+    """Write history entries to a JSONL archive.
+
+    Args:
+        entries: Entries to export, oldest first
+        archive_path: Destination .jsonl file
+        inline_images: Embed images as base64 records instead of writing
+            them to the sidecar images directory
+
+    Returns:
+        Number of entries written
+    """
+    archive_path = Path(archive_path)
+    images_dir = get_images_dir(archive_path)
+    if not inline_images:
+        images_dir.mkdir(parents=True, exist_ok=True)
+
+    count = 0
+    with open(archive_path, "w", encoding="utf-8") as f:
+        for record in _export_records(entries, inline_images, images_dir):
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            if record["type"] == "entry":
+                count += 1
+
+    logger.info(f"Exported {count} history entries to {archive_path}")
+    return count
+
+
+def import_history(
+    archive_path: str | Path,
+    insert_batch: Callable[[list[HistoryEntry]], list[HistoryEntry]],
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+) -> int:
+    """Read a JSONL archive and insert its entries in batches.
+
+    Images are written after each batch is inserted, and only for the
+    entries insert_batch kept, so entries dropped by retention limits cost
+    no image writes.
+
+    Args:
+        archive_path: Source .jsonl file
+        insert_batch: Called with each batch of restored entries; returns
+            the entries that were stored
+        batch_size: Maximum entries per batch
+
+    Returns:
+        Number of entries read from the archive
+    """
+    archive_path = Path(archive_path)
+    if not archive_path.exists():
+        raise DataError(f"History archive not found: {archive_path}")
+
+    images = _ImageRestorer(archive_path, get_images_dir(archive_path))
+    entries = _import_entries(_read_records(archive_path), images)
+
+    count = 0
+    for batch in _batched(entries, batch_size):
+        images.restore(insert_batch(batch))
+        count += len(batch)
+
+    logger.info(f"Imported {count} history entries from {archive_path}")
+    return count
@@ -1,7 +1,9 @@
+import bisect
 import logging
 import time
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from pathlib import Path
 
 from core.context_manager import ContextItem, ContextItemType
 from core.models import (
@@ -11,17 +13,48 @@ from core.models import (
     SerializedConversationNode,
     SerializedConversationTurn,
 )
-from modules.history import image_storage
+from modules.history import history_archive, image_storage
+from modules.history.history_archive import DEFAULT_IMPORT_BATCH_SIZE
+from modules.history.history_storage import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    ColdHistoryEntry,
+    entry_sort_key,
+    estimate_entry_size,
+    freeze_entry,
+    thaw_entry,
+)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_HOT_ENTRIES = 10
+
 
 class HistoryService:
-    """Service for tracking execution history."""
+    """Service for tracking execution history.
+
+    Recent entries live in a hot in-memory tier as plain objects. Older
+    entries are moved to a cold tier where they are kept serialized and,
+    above ``compression_threshold`` bytes, compressed. Retention is bounded
+    both by entry count and by a total byte budget.
+    """
 
-    def __init__(self, max_entries: int = 100):
+    def __init__(
+        self,
+        max_entries: int = 100,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        hot_entries: int = DEFAULT_HOT_ENTRIES,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    ):
         self.max_entries = max_entries
-        self._history: deque = deque(maxlen=max_entries)
+        self.max_bytes = max_bytes
+        self.hot_entries = max(1, hot_entries)
+        self.compression_threshold = compression_threshold
+        self._hot: deque[HistoryEntry] = deque()
+        self._cold: deque[ColdHistoryEntry] = deque()
+        self._cold_bytes = 0
+        # Thawed copies of the cold tier, kept until the cold tier changes
+        self._cold_view: list[HistoryEntry] | None = None
         self._change_callbacks: list[Callable[[], None]] = []
 
     def add_entry(
@@ -49,7 +82,7 @@ class HistoryService:
             prompt_name=prompt_name,
             created_at=time.strftime("%Y-%m-%d %H:%M:%S"),
         )
-        self._history.append(entry)
+        self._append_entry(entry)
         self._notify_change()
 
     def add_change_callback(self, callback: Callable[[], None]) -> None:
@@ -71,29 +104,179 @@ class HistoryService:
                 logger.error(f"Error in history change callback: {e}")
 
     def get_history(self) -> list[HistoryEntry]:
-        """Get all history entries, sorted by most recently updated/created first."""
-        entries = list(self._history)
-        entries.sort(key=lambda e: e.updated_at or e.created_at or e.timestamp, reverse=True)
+        """Get all history entries, sorted by most recently updated/created first.
+
+        Cold entries are decompressed once and the copies reused until the
+        cold tier changes; use ``_promote_entry`` to modify one.
+        """
+        if self._cold_view is None:
+            self._cold_view = [thaw_entry(cold) for cold in self._cold]
+        entries = [*self._cold_view, *self._hot]
+        entries.sort(key=entry_sort_key, reverse=True)
         return entries
 
     def clear_history(self) -> None:
         """Clear all history entries."""
-        self._history.clear()
+        self._hot.clear()
+        self._cold.clear()
+        self._cold_bytes = 0
+        self._cold_view = None
 
     def get_entry_by_id(self, entry_id: str) -> HistoryEntry | None:
-        """Get a specific history entry by ID."""
-        for entry in self._history:
+        """Get a specific history entry by ID.
+
+        Cold entries are returned as decompressed copies; use
+        ``_promote_entry`` when the entry is going to be modified.
+        """
+        for entry in self._hot:
             if entry.id == entry_id:
                 return entry
+        for cold in self._cold:
+            if cold.id == entry_id:
+                return thaw_entry(cold)
         return None
 
     def get_last_item_by_type(self, entry_type: HistoryEntryType) -> HistoryEntry | None:
         """Get the most recent history entry of the specified type."""
-        for entry in reversed(self._history):
+        for entry in reversed(self._hot):
             if entry.entry_type == entry_type:
                 return entry
+        for cold in reversed(self._cold):
+            if cold.entry_type == entry_type:
+                return thaw_entry(cold)
         return None
 
+    def iter_entries(self) -> Iterator[HistoryEntry]:
+        """Iterate over all entries oldest first, decompressing cold entries one at a time."""
+        for cold in list(self._cold):
+            yield thaw_entry(cold)
+        yield from list(self._hot)
+
+    def add_entries(self, entries: list[HistoryEntry]) -> list[HistoryEntry]:
+        """Merge a batch of existing entries into history by timestamp.
+
+        Retention limits are enforced and callbacks notified once per batch,
+        so entries older than everything in a full history are dropped.
+
+        Returns:
+            The entries of the batch that are still stored
+        """
+        if not entries:
+            return []
+        for entry in sorted(entries, key=entry_sort_key):
+            self._insert_entry(entry)
+        self._enforce_limits()
+        self._notify_change()
+
+        stored_ids = {entry.id for entry in self._hot}
+        stored_ids.update(cold.id for cold in self._cold)
+        return [entry for entry in entries if entry.id in stored_ids]
+
+    def export_jsonl(self, archive_path: str | Path, inline_images: bool = True) -> int:
+        """Export all history entries to a JSONL archive.
+
+        Args:
+            archive_path: Destination .jsonl file
+            inline_images: Embed images in the archive instead of a sidecar directory
+
+        Returns:
+            Number of entries exported
+        """
+        return history_archive.export_history(self.iter_entries(), archive_path, inline_images)
+
+    def import_jsonl(self, archive_path: str | Path, batch_size: int = DEFAULT_IMPORT_BATCH_SIZE) -> int:
+        """Import history entries from a JSONL archive created by export_jsonl.
+
+        Entries whose IDs already exist in history are skipped, so importing
+        the same archive twice does not duplicate entries.
+
+        Returns:
+            Number of entries read from the archive
+        """
+        existing_ids = {entry.id for entry in self._hot}
+        existing_ids.update(cold.id for cold in self._cold)
+
+        def insert_batch(batch: list[HistoryEntry]) -> list[HistoryEntry]:
+            return self.add_entries([entry for entry in batch if entry.id not in existing_ids])
+
+        return history_archive.import_history(archive_path, insert_batch, batch_size)
+
+    def get_memory_usage(self) -> dict[str, int]:
+        """Get entry counts and approximate payload bytes per storage tier."""
+        hot_bytes = self._hot_bytes()
+        return {
+            "hot_entries": len(self._hot),
+            "cold_entries": len(self._cold),
+            "hot_bytes": hot_bytes,
+            "cold_bytes": self._cold_bytes,
+            "total_bytes": hot_bytes + self._cold_bytes,
+        }
+
+    def _append_entry(self, entry: HistoryEntry) -> None:
+        """Add an entry to the hot tier and enforce retention limits."""
+        self._hot.append(entry)
+        self._enforce_limits()
+
+    def _insert_entry(self, entry: HistoryEntry) -> None:
+        """Place an entry by timestamp; retention limits are left to the caller."""
+        key = entry_sort_key(entry)
+        if not self._cold or key >= self._cold[-1].sort_key:
+            self._hot.insert(bisect.bisect_right(self._hot, key, key=entry_sort_key), entry)
+            return
+        if len(self._hot) + len(self._cold) >= self.max_entries and key < self._cold[0].sort_key:
+            return  # Would be evicted right away, so skip freezing it
+        cold = freeze_entry(entry, self.compression_threshold)
+        self._cold.insert(bisect.bisect_right(self._cold, key, key=lambda c: c.sort_key), cold)
+        self._cold_bytes += cold.size
+        self._cold_view = None
+
+    def _promote_entry(self, entry_id: str) -> HistoryEntry | None:
+        """Return a mutable entry, moving it from the cold tier to the hot tier if needed."""
+        for entry in self._hot:
+            if entry.id == entry_id:
+                return entry
+        for cold in self._cold:
+            if cold.id == entry_id:
+                self._cold.remove(cold)
+                self._cold_bytes -= cold.size
+                self._cold_view = None
+                entry = thaw_entry(cold)
+                self._hot.append(entry)
+                return entry
+        return None
+
+    def _hot_bytes(self) -> int:
+        """Approximate payload size of the hot tier."""
+        return sum(estimate_entry_size(entry) for entry in self._hot)
+
+    def _enforce_limits(self) -> None:
+        """Demote old hot entries and evict the oldest entries over count or byte limits."""
+        while len(self._hot) > self.hot_entries:
+            cold = freeze_entry(self._hot.popleft(), self.compression_threshold)
+            self._cold.append(cold)
+            self._cold_bytes += cold.size
+            self._cold_view = None
+
+        while len(self._hot) + len(self._cold) > self.max_entries:
+            self._evict_oldest()
+
+        total_bytes = self._hot_bytes() + self._cold_bytes
+        while total_bytes > self.max_bytes and len(self._hot) + len(self._cold) > 1:
+            total_bytes -= self._evict_oldest()
+
+    def _evict_oldest(self) -> int:
+        """Drop the oldest entry. Returns the number of bytes released."""
+        if self._cold:
+            cold = self._cold.popleft()
+            self._cold_bytes -= cold.size
+            self._cold_view = None
+            logger.debug(f"Evicted history entry {cold.id} ({cold.size} bytes)")
+            return cold.size
+        entry = self._hot.popleft()
+        size = estimate_entry_size(entry)
+        logger.debug(f"Evicted history entry {entry.id} ({size} bytes)")
+        return size
+
     def initialize(self) -> None:
         """Initialize service - clear temp images on startup."""
         image_storage.initialize()
@@ -165,7 +348,7 @@ class HistoryService:
             conversation_data=conv_data,
             created_at=time.strftime("%Y-%m-%d %H:%M:%S"),
         )
-        self._history.append(entry)
+        self._append_entry(entry)
         self._notify_change()
 
         logger.debug(f"Added conversation entry {entry.id} with {len(turns)} turns")
@@ -191,7 +374,7 @@ class HistoryService:
         Returns:
             True if update successful, False if entry not found
         """
-        entry = self.get_entry_by_id(entry_id)
+        entry = self._promote_entry(entry_id)
         if not entry or not entry.conversation_data:
             logger.warning(f"Conversation entry {entry_id} not found for update")
             return False
@@ -214,6 +397,7 @@ class HistoryService:
         entry.timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         entry.updated_at = time.strftime("%Y-%m-%d %H:%M:%S")
 
+        self._enforce_limits()
         self._notify_change()
         logger.debug(f"Updated conversation entry {entry_id} to {len(turns)} turns")
         return True
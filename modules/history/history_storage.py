@@ -0,0 +1,141 @@
+"""Compressed cold-tier storage for history entries."""
+
+import json
+import logging
+import zlib
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from core.models import (
+    ConversationHistoryData,
+    HistoryEntry,
+    HistoryEntryType,
+    SerializedConversationNode,
+    SerializedConversationTurn,
+)
+
+try:
+    from compression import zstd
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPRESSION_THRESHOLD = 4 * 1024
+ZLIB_LEVEL = 6
+
+CODEC_RAW = "raw"
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+
+
+@dataclass
+class ColdHistoryEntry:
+    """History entry kept as a serialized (optionally compressed) blob."""
+
+    id: str
+    entry_type: HistoryEntryType
+    sort_key: str
+    blob: bytes
+    codec: str
+
+    @property
+    def size(self) -> int:
+        """Bytes held by this entry."""
+        return len(self.blob)
+
+
+def entry_to_dict(entry: HistoryEntry) -> dict[str, Any]:
+    """Convert a HistoryEntry to a JSON-serializable dict."""
+    data = asdict(entry)
+    data["entry_type"] = entry.entry_type.value
+    return data
+
+
+def entry_from_dict(data: dict[str, Any]) -> HistoryEntry:
+    """Build a HistoryEntry from a dict produced by entry_to_dict."""
+    conv = data.get("conversation_data")
+    conversation_data = None
+    if conv:
+        conversation_data = ConversationHistoryData(
+            context_text=conv.get("context_text", ""),
+            context_image_paths=list(conv.get("context_image_paths", [])),
+            turns=[SerializedConversationTurn(**turn) for turn in conv.get("turns", [])],
+            prompt_id=conv.get("prompt_id"),
+            prompt_name=conv.get("prompt_name"),
+            nodes=[SerializedConversationNode(**node) for node in conv.get("nodes", [])],
+            root_node_id=conv.get("root_node_id"),
+            current_path=list(conv.get("current_path", [])),
+        )
+
+    return HistoryEntry(
+        id=data["id"],
+        timestamp=data["timestamp"],
+        input_content=data.get("input_content", ""),
+        entry_type=HistoryEntryType(data["entry_type"]),
+        output_content=data.get("output_content"),
+        prompt_id=data.get("prompt_id"),
+        success=data.get("success", True),
+        error=data.get("error"),
+        is_conversation=data.get("is_conversation", False),
+        prompt_name=data.get("prompt_name"),
+        conversation_data=conversation_data,
+        created_at=data.get("created_at"),
+        updated_at=data.get("updated_at"),
+    )
+
+
+def entry_sort_key(entry: HistoryEntry) -> str:
+    """Recency key: last update, falling back to creation time."""
+    return entry.updated_at or entry.created_at or entry.timestamp
+
+
+def estimate_entry_size(entry: HistoryEntry) -> int:
+    """Estimate the in-memory payload size of an entry in bytes.
+
+    Counts the text payloads that dominate memory use (input/output content,
+    context text, turn texts and node contents); metadata is ignored.
+    """
+    size = len(entry.input_content or "") + len(entry.output_content or "")
+    conv = entry.conversation_data
+    if conv:
+        size += len(conv.context_text or "")
+        for turn in conv.turns:
+            size += len(turn.message_text or "") + len(turn.output_text or "")
+            size += sum(len(version) for version in turn.output_versions)
+        for node in conv.nodes:
+            size += len(node.content or "")
+    return size
+
+
+def freeze_entry(entry: HistoryEntry, threshold: int = DEFAULT_COMPRESSION_THRESHOLD) -> ColdHistoryEntry:
+    """Serialize an entry for the cold tier, compressing payloads above threshold."""
+    raw = json.dumps(entry_to_dict(entry), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    if len(raw) < threshold:
+        blob, codec = raw, CODEC_RAW
+    elif ZSTD_AVAILABLE:
+        blob, codec = zstd.compress(raw), CODEC_ZSTD
+    else:
+        blob, codec = zlib.compress(raw, ZLIB_LEVEL), CODEC_ZLIB
+
+    return ColdHistoryEntry(
+        id=entry.id,
+        entry_type=entry.entry_type,
+        sort_key=entry_sort_key(entry),
+        blob=blob,
+        codec=codec,
+    )
+
+
+def thaw_entry(cold: ColdHistoryEntry) -> HistoryEntry:
+    """Restore a HistoryEntry from its cold-tier representation."""
+    if cold.codec == CODEC_ZSTD:
+        raw = zstd.decompress(cold.blob)
+    elif cold.codec == CODEC_ZLIB:
+        raw = zlib.decompress(cold.blob)
+    else:
+        raw = cold.blob
+    return entry_from_dict(json.loads(raw))
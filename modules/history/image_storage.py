@@ -31,6 +31,32 @@ def save_image(base64_data: str, media_type: str) -> str | None:
         base64_data: Base64-encoded image data
         media_type: MIME type (e.g., "image/png", "image/jpeg")
 
+    Returns:
+        File path to saved image, or None on failure
+    """
+    try:
+        image_bytes = base64.b64decode(base64_data)
+    except Exception as e:
+        logger.error(f"Failed to decode temp image: {e}")
+        return None
+    return save_image_bytes(image_bytes, media_type)
+
+
+def get_image_path(content_hash: str, media_type: str) -> str:
+    """Temp storage path for an image, named from a hash of its contents."""
+    extension = get_extension_for_media_type(media_type)
+    timestamp = int(time.time() * 1000)
+    return str(get_temp_images_dir() / f"img_{timestamp}_{content_hash[:12]}{extension}")
+
+
+def save_image_bytes(image_bytes: bytes, media_type: str, filepath: str | None = None) -> str | None:
+    """Save raw image bytes to temp storage.
+
+    Args:
+        image_bytes: Encoded image file contents
+        media_type: MIME type (e.g., "image/png", "image/jpeg")
+        filepath: Path from get_image_path to write to, when it was chosen in advance
+
     Returns:
         File path to saved image, or None on failure
     """
@@ -38,13 +64,9 @@ def save_image(base64_data: str, media_type: str) -> str | None:
         temp_dir = get_temp_images_dir()
         temp_dir.mkdir(parents=True, exist_ok=True)
 
-        extension = _get_extension_for_media_type(media_type)
-        content_hash = hashlib.md5(base64_data.encode()).hexdigest()[:12]
-        timestamp = int(time.time() * 1000)
-        filename = f"img_{timestamp}_{content_hash}{extension}"
-
-        filepath = temp_dir / filename
-        image_bytes = base64.b64decode(base64_data)
+        if filepath is None:
+            filepath = get_image_path(hashlib.md5(image_bytes).hexdigest(), media_type)
+        filepath = Path(filepath)
         filepath.write_bytes(image_bytes)
 
         logger.debug(f"Saved temp image: {filepath}")
@@ -71,7 +93,7 @@ def load_image(filepath: str) -> tuple[str, str] | None:
 
         image_bytes = path.read_bytes()
         base64_data = base64.b64encode(image_bytes).decode("utf-8")
-        media_type = _get_media_type_for_extension(path.suffix)
+        media_type = get_media_type_for_extension(path.suffix)
 
         return base64_data, media_type
     except Exception as e:
@@ -91,7 +113,7 @@ def cleanup() -> None:
             logger.warning(f"Failed to cleanup temp images: {e}")
 
 
-def _get_extension_for_media_type(media_type: str) -> str:
+def get_extension_for_media_type(media_type: str) -> str:
     """Get file extension for a MIME type."""
     extensions = {
         "image/png": ".png",
@@ -104,7 +126,7 @@ def _get_extension_for_media_type(media_type: str) -> str:
     return extensions.get(media_type.lower(), ".png")
 
 
-def _get_media_type_for_extension(extension: str) -> str:
+def get_media_type_for_extension(extension: str) -> str:
     """Get MIME type for a file extension."""
     media_types = {
         ".png": "image/png",
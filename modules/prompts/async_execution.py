@@ -62,11 +62,51 @@ from core.interfaces import ClipboardManager
 from core.models import ErrorCode, ExecutionResult, MenuItem
 from core.openai_service import OpenAiService, truncate_base64_for_logging
 from core.placeholder_service import PlaceholderService
+from modules.prompts.map_reduce import (
+    MapReduceSettings,
+    estimate_tokens,
+    format_reduce_prompt,
+    group_partials,
+    run_concurrently,
+    split_text,
+)
+from modules.utils.config import ConfigService
 from modules.utils.notification_config import is_notification_enabled
 from modules.utils.notifications import PyQtNotificationManager, format_execution_time
 
 logger = logging.getLogger(__name__)
 
+_CHUNK_TOKEN = "\x00promptheus-chunk\x00"
+
+
+def _message_text(message: dict) -> str:
+    content = message.get("content")
+    if isinstance(content, list):
+        return "\n".join(part.get("text", "") for part in content if part.get("type") == "text")
+    return content if isinstance(content, str) else ""
+
+
+def _chunk_instructions(messages: list[dict]) -> str:
+    """Text of the user messages around the chunk marker, with the marker removed."""
+    texts = [_message_text(m) for m in messages if m.get("role") == "user" and _CHUNK_TOKEN in _message_text(m)]
+    return "\n\n".join(text.replace(_CHUNK_TOKEN, "").strip() for text in texts).strip()
+
+
+def _substitute_chunk(messages: list[dict], chunk: str) -> list[dict]:
+    """Copy processed messages, replacing the chunk marker with chunk text."""
+    substituted = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            content = content.replace(_CHUNK_TOKEN, chunk)
+        elif isinstance(content, list):
+            content = [
+                {**part, "text": part["text"].replace(_CHUNK_TOKEN, chunk)} if part.get("type") == "text" else part
+                for part in content
+            ]
+        substituted.append({**message, "content": content})
+    return substituted
+
 
 @dataclass
 class ExecutionContext:
@@ -255,6 +295,11 @@ class PromptExecutionWorker(QThread):
             # Check for multi-turn conversation data
             conversation_data = self.item.data.get("conversation_data")
 
+            if not conversation_data:
+                plan = self._plan_map_reduce(messages)
+                if plan:
+                    return self._execute_map_reduce(model_name, messages, plan, streaming=False)
+
             try:
                 if conversation_data:
                     # Multi-turn conversation mode
@@ -409,6 +454,141 @@ class PromptExecutionWorker(QThread):
 
         return processed
 
+    def _plan_map_reduce(self, messages: list) -> tuple[str, str, MapReduceSettings] | None:
+        """Decide whether the prompt input is large enough for chunked execution.
+
+        Returns:
+            Tuple of (placeholder_name, input_text, settings), or None to run normally
+        """
+        try:
+            settings = MapReduceSettings.from_dict(ConfigService().get_settings_data().get("map_reduce"))
+        except Exception:
+            settings = MapReduceSettings()
+        if not settings.enabled or self.item.data.get("working_images"):
+            return None
+
+        template = "\n".join(m.get("content", "") for m in messages if isinstance(m.get("content"), str))
+        candidates = []
+        if "{{clipboard}}" in template:
+            text = self.context
+            if text is None:
+                try:
+                    text = self.clipboard_manager.get_content()
+                except Exception:
+                    text = ""
+            candidates.append(("clipboard", text or ""))
+        if "{{context}}" in template:
+            candidates.append(("context", self.context_manager.get_context_or_default("")))
+        if not candidates:
+            return None
+
+        placeholder, text = max(candidates, key=lambda candidate: len(candidate[1]))
+        if estimate_tokens(text) <= settings.threshold_tokens:
+            return None
+        return placeholder, text, settings
+
+    def _emit_map_progress(self, completed: int, total: int) -> None:
+        """Report chunk progress through the streaming signal."""
+        progress = f"Processing large input: {completed}/{total} sections done..."
+        self.chunk_received.emit("", progress, False, self.execution_id)
+
+    def _execute_map_reduce(
+        self,
+        model_name: str,
+        messages: list,
+        plan: tuple[str, str, MapReduceSettings],
+        streaming: bool,
+    ) -> ExecutionResult:
+        """Run the prompt over input chunks concurrently and combine the partial results."""
+        start_time = time.time()
+        placeholder, text, settings = plan
+        metadata = {"action": "execute_prompt", "map_reduce": True}
+        if streaming:
+            metadata["streaming"] = True
+
+        marked_messages = [
+            {**m, "content": m["content"].replace(f"{{{{{placeholder}}}}}", _CHUNK_TOKEN)}
+            if isinstance(m.get("content"), str)
+            else m
+            for m in messages
+        ]
+        try:
+            base_messages = self.placeholder_service.process_messages(marked_messages, self.context)
+        except ClipboardUnavailableError as e:
+            return ExecutionResult(
+                success=False,
+                error=str(e),
+                error_code=ErrorCode.CLIPBOARD_ERROR,
+                execution_time=time.time() - start_time,
+                metadata=metadata,
+            )
+
+        try:
+            chunks = split_text(text, settings.chunk_tokens)
+            metadata["chunks"] = len(chunks)
+            logger.info(
+                f"Map-reduce execution: {len(chunks)} chunks from {placeholder}, concurrency {settings.max_concurrency}"
+            )
+            self._emit_map_progress(0, len(chunks))
+
+            partials = run_concurrently(
+                lambda chunk: self.openai_service.complete(
+                    model_key=model_name, messages=_substitute_chunk(base_messages, chunk)
+                ),
+                chunks,
+                settings.max_concurrency,
+                on_done=self._emit_map_progress,
+            )
+
+            if len(partials) == 1:
+                content = partials[0]
+                if streaming:
+                    self.chunk_received.emit("", content, True, self.execution_id)
+                return ExecutionResult(
+                    success=True, content=content, execution_time=time.time() - start_time, metadata=metadata
+                )
+
+            # The reduce requests keep the system prompt and the instructions that surrounded the input
+            system_messages = [m for m in _substitute_chunk(base_messages, "") if m.get("role") == "system"]
+            instructions = _chunk_instructions(base_messages)
+
+            def reduce_messages(group: list[str]) -> list[dict]:
+                prompt = format_reduce_prompt(settings.reduce_prompt, instructions, group)
+                return [*system_messages, {"role": "user", "content": prompt}]
+
+            # Reduce in groups until the remaining partials fit in one request
+            groups = group_partials(partials, settings.chunk_tokens)
+            while 1 < len(groups) < len(partials):
+                partials = run_concurrently(
+                    lambda group: self.openai_service.complete(model_key=model_name, messages=reduce_messages(group)),
+                    groups,
+                    settings.max_concurrency,
+                )
+                groups = group_partials(partials, settings.chunk_tokens)
+
+            final_messages = reduce_messages(partials)
+            if streaming:
+                content = ""
+                for chunk_text, content in self.openai_service.complete_stream(
+                    model_key=model_name, messages=final_messages
+                ):
+                    self.chunk_received.emit(chunk_text, content, False, self.execution_id)
+                self.chunk_received.emit("", content, True, self.execution_id)
+            else:
+                content = self.openai_service.complete(model_key=model_name, messages=final_messages)
+
+            return ExecutionResult(
+                success=True, content=content, execution_time=time.time() - start_time, metadata=metadata
+            )
+
+        except Exception as e:
+            return ExecutionResult(
+                success=False,
+                error=f"Failed to execute prompt: {str(e)}",
+                execution_time=time.time() - start_time,
+                metadata=metadata,
+            )
+
     def _execute_prompt_streaming(self) -> ExecutionResult:
         """Execute the prompt with streaming (runs in worker thread).
 
@@ -495,6 +675,11 @@ class PromptExecutionWorker(QThread):
 
             conversation_data = self.item.data.get("conversation_data")
 
+            if not conversation_data:
+                plan = self._plan_map_reduce(messages)
+                if plan:
+                    return self._execute_map_reduce(model_name, messages, plan, streaming=True)
+
             try:
                 if conversation_data:
                     processed_messages = self._build_conversation_messages(prompt_id, messages, conversation_data)
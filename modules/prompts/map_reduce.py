@@ -0,0 +1,175 @@
+"""Chunked (map-reduce) execution helpers for very large prompt inputs.
+
+Large ``{{clipboard}}``/``{{context}}`` inputs are split on paragraph
+boundaries into chunks that fit a token budget. The prompt runs over every
+chunk concurrently (map), and the partial results are combined with a
+reduce prompt. When the partials are themselves too large, they are reduced
+in groups first, so no single request exceeds the chunk budget.
+"""
+
+import logging
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+CHARS_PER_TOKEN = 4
+
+DEFAULT_REDUCE_PROMPT = (
+    "The input was too long to process at once, so it was split into sections and the "
+    "instructions below were applied to each section separately. Combine the section results "
+    "into a single coherent response that follows the instructions, removing repetition and "
+    "keeping their format.\n\n"
+    "{{instructions}}\n\n"
+    "{{partials}}"
+)
+
+
+@dataclass
+class MapReduceSettings:
+    """Settings for chunked execution, from the "map_reduce" settings section.
+
+    Off by default: chunked results differ from a single request, so it is opt-in.
+    """
+
+    enabled: bool = False
+    threshold_tokens: int = 24000
+    chunk_tokens: int = 6000
+    max_concurrency: int = 4
+    reduce_prompt: str = DEFAULT_REDUCE_PROMPT
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "MapReduceSettings":
+        data = data or {}
+        defaults = cls()
+        return cls(
+            enabled=data.get("enabled", defaults.enabled),
+            threshold_tokens=max(1, int(data.get("threshold_tokens", defaults.threshold_tokens))),
+            chunk_tokens=max(1, int(data.get("chunk_tokens", defaults.chunk_tokens))),
+            max_concurrency=max(1, int(data.get("max_concurrency", defaults.max_concurrency))),
+            reduce_prompt=data.get("reduce_prompt") or defaults.reduce_prompt,
+        )
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count; good enough to decide where to split."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def _hard_split(text: str, max_chars: int) -> list[str]:
+    """Split on whitespace near max_chars, or mid-word if there is none."""
+    pieces = []
+    while len(text) > max_chars:
+        cut = text.rfind(" ", 0, max_chars)
+        if cut <= 0:
+            cut = max_chars
+        pieces.append(text[:cut])
+        text = text[cut:].lstrip()
+    if text:
+        pieces.append(text)
+    return pieces
+
+
+def _split_units(text: str, max_chars: int) -> list[str]:
+    """Break text into paragraphs, falling back to lines, sentences and words for oversized ones."""
+    units = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        if len(paragraph) <= max_chars:
+            units.append(paragraph)
+            continue
+        for line in paragraph.split("\n"):
+            if len(line) <= max_chars:
+                units.append(line)
+                continue
+            for sentence in re.split(r"(?<=[.!?])\s+", line):
+                units.extend(_hard_split(sentence, max_chars) if len(sentence) > max_chars else [sentence])
+    return [unit for unit in units if unit.strip()]
+
+
+def split_text(text: str, chunk_tokens: int) -> list[str]:
+    """Split text into chunks of at most chunk_tokens, packing whole paragraphs where possible."""
+    max_chars = chunk_tokens * CHARS_PER_TOKEN
+    chunks: list[str] = []
+    current: list[str] = []
+    current_len = 0
+
+    for unit in _split_units(text, max_chars):
+        added_len = len(unit) + (2 if current else 0)
+        if current and current_len + added_len > max_chars:
+            chunks.append("\n\n".join(current))
+            current, current_len = [], 0
+            added_len = len(unit)
+        current.append(unit)
+        current_len += added_len
+
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def run_concurrently(
+    func: Callable[[S], T],
+    items: list[S],
+    max_concurrency: int,
+    on_done: Callable[[int, int], None] | None = None,
+) -> list[T]:
+    """Apply func to every item with bounded parallelism, preserving order.
+
+    on_done(completed, total) is called from worker threads as items finish.
+    The first exception raised by func is re-raised after cancelling pending work.
+    """
+    results: list[T | None] = [None] * len(items)
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items)) or 1) as executor:
+        futures = {executor.submit(func, item): index for index, item in enumerate(items)}
+        try:
+            for completed, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                if on_done:
+                    on_done(completed, len(items))
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+    return results
+
+
+def format_partials(partials: list[str]) -> str:
+    """Number partial results so the reduce step can keep their order."""
+    return "\n\n".join(f'<section index="{i}">\n{partial.strip()}\n</section>' for i, partial in enumerate(partials, 1))
+
+
+def format_reduce_prompt(reduce_prompt: str, instructions: str, partials: list[str]) -> str:
+    """Fill a reduce prompt with the original instructions and the numbered partial results.
+
+    Instructions are prepended when the prompt has no ``{{instructions}}`` placeholder,
+    so custom reduce prompts still see what the sections were asked to do.
+    """
+    instructions_block = f"<instructions>\n{instructions.strip()}\n</instructions>" if instructions.strip() else ""
+    if "{{instructions}}" in reduce_prompt:
+        prompt = reduce_prompt.replace("{{instructions}}", instructions_block)
+    else:
+        prompt = f"{instructions_block}\n\n{reduce_prompt}" if instructions_block else reduce_prompt
+    return prompt.replace("{{partials}}", format_partials(partials)).strip()
+
+
+def group_partials(partials: list[str], chunk_tokens: int) -> list[list[str]]:
+    """Group consecutive partials so that each group fits within chunk_tokens."""
+    groups: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+    for partial in partials:
+        tokens = estimate_tokens(partial)
+        if current and current_tokens + tokens > chunk_tokens:
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(partial)
+        current_tokens += tokens
+    if current:
+        groups.append(current)
+    return groups
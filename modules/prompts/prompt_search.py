@@ -0,0 +1,157 @@
+"""Fuzzy search over the prompt catalog for type-ahead filtering in the menu.
+
+The index is built once per catalog version: names, tags and descriptions
+are lowercased up front and their trigrams go into an inverted index. A
+query matches a prompt, from best to weakest, when it is a substring of
+the name, when every query word occurs in the name, tags or description,
+when its characters appear in order in the name ("smry" finds "Summary"),
+or when each query word shares most of its trigrams with the prompt's text
+(tolerating typos). The first three criteria only get stricter as a query
+grows, so a query that extends the previous one only re-checks the
+previous matches plus the prompts sharing its trigrams.
+"""
+
+import re
+from collections import Counter
+from typing import NamedTuple
+
+from core.models import PromptData
+
+MIN_TRIGRAM_OVERLAP = 0.6
+
+_SCORE_NAME_PREFIX = 4.0
+_SCORE_NAME_WORD_START = 3.5
+_SCORE_NAME_SUBSTRING = 3.0
+_SCORE_ALL_WORDS = 2.0
+_SCORE_SUBSEQUENCE = 1.0
+
+
+class SearchMatch(NamedTuple):
+    """A prompt matching a query; higher scores are better matches."""
+
+    prompt_id: str
+    score: float
+
+
+def normalize_query(text: str) -> str:
+    """Lowercase text and collapse whitespace, as queries and entries are compared."""
+    return " ".join(text.lower().split())
+
+
+def trigrams(text: str) -> set[str]:
+    """Character trigrams of each word in text, padded so short words still yield one."""
+    grams = set()
+    for word in text.split():
+        padded = f" {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class PromptSearchIndex:
+    """Precomputed search data for one version of the prompt catalog.
+
+    Entries are kept in parallel lists so each matching tier is a single
+    comprehension over plain strings rather than a function call per prompt.
+    """
+
+    def __init__(self, prompts: list[PromptData], version: int = 0):
+        self.version = version
+        self._ids: list[str] = []
+        self._names: list[str] = []
+        self._texts: list[str] = []
+        self._word_starts: list[frozenset[int]] = []
+        self._postings: dict[str, list[int]] = {}
+        self._last_query = ""
+        self._last_matches: list[int] = []
+
+        for index, prompt in enumerate(prompts):
+            name = normalize_query(prompt.name or "")
+            text = normalize_query(" ".join([prompt.name or "", *(prompt.tags or []), prompt.description or ""]))
+            self._ids.append(prompt.id)
+            self._names.append(name)
+            self._texts.append(text)
+            self._word_starts.append(frozenset(match.start() for match in re.finditer(r"\b\w", name)))
+            for gram in trigrams(text):
+                self._postings.setdefault(gram, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def search(self, query: str) -> list[SearchMatch]:
+        """Return the prompts matching query, best first; an empty query matches nothing."""
+        query = normalize_query(query)
+        if not query:
+            self._last_query = ""
+            self._last_matches = []
+            return []
+
+        words = query.split()
+        word_grams = [trigrams(word) for word in words if len(word) >= 3]
+        if self._last_query and query.startswith(self._last_query):
+            candidates = set(self._last_matches)
+            for grams in word_grams:
+                for gram in grams:
+                    candidates.update(self._postings.get(gram, ()))
+            remaining = sorted(candidates)
+        else:
+            remaining = range(len(self._ids))
+
+        names = self._names
+        texts = self._texts
+        # (-score, index) pairs, so a plain sort puts the best matches first and keeps catalog order on ties
+        ranked: list[tuple[float, int]] = []
+
+        in_name = [i for i in remaining if query in names[i]]
+        for i in in_name:
+            position = names[i].find(query)
+            if position == 0:
+                ranked.append((-_SCORE_NAME_PREFIX, i))
+            elif position in self._word_starts[i]:
+                ranked.append((-_SCORE_NAME_WORD_START, i))
+            else:
+                ranked.append((-_SCORE_NAME_SUBSTRING, i))
+        matched = set(in_name)
+        remaining = [i for i in remaining if i not in matched]
+
+        all_words = remaining
+        for word in words:
+            all_words = [i for i in all_words if word in texts[i]]
+        ranked.extend((-_SCORE_ALL_WORDS, i) for i in all_words)
+        matched = set(all_words)
+        remaining = [i for i in remaining if i not in matched]
+
+        # Tighter in-order matches rank higher: "smry" in "summary" beats it spread across a long name
+        subsequence = re.compile(".*?".join(re.escape(char) for char in query.replace(" ", ""))).search
+        length = len(query)
+        for i in remaining:
+            match = subsequence(names[i])
+            if match:
+                ranked.append((-_SCORE_SUBSEQUENCE - length / (match.end() - match.start() + 1), i))
+                matched.add(i)
+
+        if word_grams:
+            remaining = [i for i in remaining if i not in matched]
+            ranked.extend((-overlap, i) for overlap, i in self._fuzzy_matches(words, remaining))
+
+        self._last_query = query
+        self._last_matches = [i for _, i in ranked]
+        ranked.sort()
+        ids = self._ids
+        return [SearchMatch(ids[i], -score) for score, i in ranked]
+
+    def _fuzzy_matches(self, words: list[str], remaining: list[int]) -> list[tuple[float, int]]:
+        """Score prompts where every word occurs in the text or shares most of its trigrams with it."""
+        overlaps = dict.fromkeys(remaining, 1.0)
+        for word in words:
+            grams = trigrams(word) if len(word) >= 3 else set()
+            counts: Counter[int] = Counter()
+            for gram in grams:
+                counts.update(self._postings.get(gram, ()))
+            for i in list(overlaps):
+                if word in self._texts[i]:
+                    continue
+                if grams and counts[i] >= MIN_TRIGRAM_OVERLAP * len(grams):
+                    overlaps[i] = min(overlaps[i], counts[i] / len(grams))
+                else:
+                    del overlaps[i]
+        return [(overlap, i) for i, overlap in overlaps.items()]
@@ -13,6 +13,7 @@ from core.models import (
 from core.openai_service import OpenAiService
 from core.services import ExecutionService
 from modules.history.history_service import HistoryService
+from modules.prompts.prompt_search import PromptSearchIndex
 from modules.utils.notification_config import is_notification_enabled
 from modules.utils.notifications import PyQtNotificationManager
 from modules.utils.speech_to_text import SpeechToTextService
@@ -46,6 +47,8 @@ class PromptStoreService(PromptStoreServiceProtocol):
         self.history_service = history_service or HistoryService()
         self.active_prompt_service = ActivePromptService()
         self._prompts_cache = None
+        self._catalog_version = 0
+        self._search_index: PromptSearchIndex | None = None
 
     def get_prompts(self) -> list[PromptData]:
         """Get prompts with caching."""
@@ -68,10 +71,18 @@ class PromptStoreService(PromptStoreServiceProtocol):
                         print(f"Warning: Failed to get prompts from provider {type(provider).__name__}: {e}")
 
             self._prompts_cache = all_prompts
+            self._catalog_version += 1
             return self._prompts_cache
         except Exception as e:
             raise DataError(f"Failed to refresh prompts: {str(e)}") from e
 
+    def get_search_index(self) -> PromptSearchIndex:
+        """Get the search index for the current prompts, building it once per catalog version."""
+        prompts = self.get_prompts()
+        if self._search_index is None or self._search_index.version != self._catalog_version:
+            self._search_index = PromptSearchIndex(prompts, self._catalog_version)
+        return self._search_index
+
     def invalidate_cache(self):
         """Invalidate prompt cache and refresh from providers."""
         self._prompts_cache = None
@@ -0,0 +1,180 @@
+"""Capture of the foreground window, so focus can return to it after the menu closes.
+
+Capture runs before every menu is shown, so it must not delay the menu. On
+X11 the _NET_ACTIVE_WINDOW root property is read over a persistent
+python-xlib connection; on macOS the frontmost application comes from
+NSWorkspace. Without those, the xdotool/xprop or osascript fallbacks run in
+a background thread while the menu is built, and the result is only waited
+for when focus is restored.
+"""
+
+import logging
+import os
+import re
+import subprocess
+import threading
+from typing import Any
+
+from modules.utils.system import is_linux, is_macos, is_wayland_session
+
+try:
+    from Xlib import X
+    from Xlib import display as xdisplay
+    from Xlib.error import DisplayError
+
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_TIMEOUT = 1.0
+
+_MACOS_FRONT_APP_SCRIPT = """
+tell application "System Events"
+    set frontApp to name of first application process whose frontmost is true
+    set frontAppPath to POSIX path of (file of first application process whose frontmost is true)
+end tell
+return frontApp & "|||" & frontAppPath
+"""
+
+
+class X11ActiveWindowReader:
+    """Reads _NET_ACTIVE_WINDOW from the root window over a persistent X connection."""
+
+    def __init__(self, display_name: str | None = None):
+        self._lock = threading.Lock()
+        self._display = xdisplay.Display(display_name)
+        self._root = self._display.screen().root
+        self._active_window = self._display.intern_atom("_NET_ACTIVE_WINDOW")
+
+    def get_active_window_id(self) -> str | None:
+        """Return the active window id in xdotool's decimal form, or None (one round-trip)."""
+        with self._lock:
+            prop = self._root.get_full_property(self._active_window, X.AnyPropertyType)
+        if prop is None or not prop.value or not prop.value[0]:
+            return None
+        return str(prop.value[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._display.close()
+
+
+_x11_reader: X11ActiveWindowReader | None = None
+_x11_reader_failed = False
+
+
+def get_x11_active_window_reader() -> X11ActiveWindowReader | None:
+    """Get the shared X11 reader, or None if python-xlib or an X display is unavailable."""
+    global _x11_reader, _x11_reader_failed
+    if _x11_reader is not None or _x11_reader_failed:
+        return _x11_reader
+    if not XLIB_AVAILABLE or not os.environ.get("DISPLAY"):
+        _x11_reader_failed = True
+        return None
+    try:
+        _x11_reader = X11ActiveWindowReader()
+    except (DisplayError, OSError) as e:
+        logger.debug(f"Native X11 active window lookup unavailable: {e}")
+        _x11_reader_failed = True
+    return _x11_reader
+
+
+class ActiveWindowCapture:
+    """The foreground window at capture time, possibly still being looked up in the background.
+
+    result() returns a dict with "window_id" on X11 or "name" and "path" on
+    macOS, or None if the window could not be determined.
+    """
+
+    def __init__(self, info: dict[str, Any] | None = None):
+        self._info = info
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def in_background(cls, lookup) -> "ActiveWindowCapture":
+        capture = cls()
+
+        def run():
+            try:
+                capture._info = lookup()
+            except Exception as e:
+                logger.debug(f"Active window lookup failed: {e}")
+
+        capture._thread = threading.Thread(target=run, name="active-window", daemon=True)
+        capture._thread.start()
+        return capture
+
+    def result(self, timeout: float = CAPTURE_TIMEOUT) -> dict[str, Any] | None:
+        """Wait for a background lookup if needed and return the window info."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self._info
+
+
+def capture_active_window() -> ActiveWindowCapture:
+    """Capture the foreground window without blocking on subprocesses."""
+    if is_macos():
+        info = _frontmost_macos_app()
+        if info is not None:
+            return ActiveWindowCapture(info)
+        return ActiveWindowCapture.in_background(_frontmost_macos_app_osascript)
+
+    if is_linux() and not is_wayland_session():
+        reader = get_x11_active_window_reader()
+        if reader is not None:
+            try:
+                window_id = reader.get_active_window_id()
+                return ActiveWindowCapture({"window_id": window_id} if window_id else None)
+            except Exception as e:
+                logger.debug(f"Reading _NET_ACTIVE_WINDOW failed, falling back to xdotool: {e}")
+        return ActiveWindowCapture.in_background(_active_x11_window_subprocess)
+
+    return ActiveWindowCapture()
+
+
+def _frontmost_macos_app() -> dict[str, Any] | None:
+    try:
+        from AppKit import NSWorkspace
+
+        app = NSWorkspace.sharedWorkspace().frontmostApplication()
+    except Exception:
+        return None
+    if app is None:
+        return None
+    bundle_url = app.bundleURL()
+    return {"name": app.localizedName(), "path": bundle_url.path() if bundle_url else None}
+
+
+def _frontmost_macos_app_osascript() -> dict[str, Any] | None:
+    result = subprocess.run(
+        ["osascript", "-e", _MACOS_FRONT_APP_SCRIPT],
+        capture_output=True,
+        text=True,
+        timeout=1.0,
+    )
+    if result.returncode != 0:
+        return None
+    app_info = result.stdout.strip().split("|||")
+    return {"name": app_info[0], "path": app_info[1] if len(app_info) > 1 else None}
+
+
+def _active_x11_window_subprocess() -> dict[str, Any] | None:
+    try:
+        result = subprocess.run(["xdotool", "getactivewindow"], capture_output=True, text=True, timeout=1)
+        if result.returncode == 0:
+            return {"window_id": result.stdout.strip()}
+        return None
+    except FileNotFoundError:
+        result = subprocess.run(
+            ["xprop", "-root", "_NET_ACTIVE_WINDOW"],
+            capture_output=True,
+            text=True,
+            timeout=1,
+        )
+        if result.returncode == 0:
+            match = re.search(r"0x[0-9a-fA-F]+", result.stdout)
+            if match:
+                return {"window_id": match.group()}
+        return None
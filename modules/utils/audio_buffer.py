@@ -0,0 +1,147 @@
+"""Recording buffers that keep memory bounded for long recordings.
+
+The audio callback copies each block into a preallocated ring buffer in
+place. A consumer thread drains the ring: either the segmented transcriber,
+or a spooler that appends the audio to a WAV as it arrives. The spooled WAV
+stays in memory and only spills to a temporary file once it grows past
+SPILL_BYTES, so memory use is bounded for long recordings.
+"""
+
+import contextlib
+import logging
+import tempfile
+import threading
+import wave
+from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+RING_BUFFER_SECONDS = 10
+SPOOL_INTERVAL = 0.1
+SPILL_BYTES = 16 * 1024 * 1024
+
+
+class PcmRingBuffer:
+    """Fixed-size byte ring with a single writer (the audio callback) and a single reader.
+
+    write() copies into the preallocated buffer without allocating per
+    block. If the reader falls behind by more than the capacity, the
+    oldest unread audio is overwritten and counted in dropped_bytes.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._lock = threading.Lock()
+        self._write_pos = 0
+        self._read_pos = 0
+        self.dropped_bytes = 0
+
+    @classmethod
+    def for_stream(cls, rate: int, channels: int, seconds: float = RING_BUFFER_SECONDS) -> "PcmRingBuffer":
+        """Ring sized for seconds of int16 audio."""
+        return cls(int(rate * seconds) * channels * 2)
+
+    def write(self, data) -> None:
+        """Copy one block (any buffer-protocol object) into the ring."""
+        size = len(data)
+        if size > self.capacity:
+            data = memoryview(data)[size - self.capacity :]
+            self.dropped_bytes += size - self.capacity
+            size = self.capacity
+        with self._lock:
+            start = self._write_pos % self.capacity
+            first = min(size, self.capacity - start)
+            if first == size:
+                self._view[start : start + size] = data
+            else:
+                source = memoryview(data)
+                self._view[start:] = source[:first]
+                self._view[: size - first] = source[first:]
+            self._write_pos += size
+            overrun = self._write_pos - self._read_pos - self.capacity
+            if overrun > 0:
+                self._read_pos += overrun
+                self.dropped_bytes += overrun
+
+    def read(self) -> bytes:
+        """Return and consume all unread audio."""
+        with self._lock:
+            size = self._write_pos - self._read_pos
+            start = self._read_pos % self.capacity
+            first = min(size, self.capacity - start)
+            data = bytes(self._view[start : start + first])
+            if first < size:
+                data += self._view[: size - first]
+            self._read_pos = self._write_pos
+        return data
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes written since the buffer was created."""
+        return self._write_pos
+
+
+def spooled_file() -> BinaryIO:
+    """In-memory file that moves to disk once it exceeds SPILL_BYTES."""
+    return tempfile.SpooledTemporaryFile(max_size=SPILL_BYTES)
+
+
+class RecordingSpooler:
+    """Drains a ring buffer into a spooled WAV file while recording."""
+
+    def __init__(self, ring: PcmRingBuffer, rate: int, channels: int):
+        self._ring = ring
+        self.file = spooled_file()
+        self._wave_file = wave.Wave_write(self.file)
+        self._wave_file.setnchannels(channels)
+        self._wave_file.setsampwidth(2)
+        self._wave_file.setframerate(rate)
+        self._stop_event = threading.Event()
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def finish(self) -> BinaryIO:
+        """Write the remaining audio and return the WAV file, rewound to its start.
+
+        Call after the stream has stopped. The caller owns and must close the file.
+        """
+        self._stop_event.set()
+        self._thread.join()
+        try:
+            if self._error is not None:
+                raise self._error
+            self._drain()
+            self._wave_file.close()
+            self.file.seek(0)
+        except Exception:
+            self.discard()
+            raise
+        if self._ring.dropped_bytes:
+            logger.warning(f"Recording lost {self._ring.dropped_bytes} bytes of audio: spooling fell behind")
+        return self.file
+
+    def discard(self) -> None:
+        """Stop and release the spooled audio."""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        with contextlib.suppress(Exception):
+            self._wave_file.close()
+        self.file.close()
+
+    def _run(self) -> None:
+        try:
+            while not self._stop_event.wait(SPOOL_INTERVAL):
+                self._drain()
+        except Exception as e:
+            self._error = e
+
+    def _drain(self) -> None:
+        data = self._ring.read()
+        if data:
+            self._wave_file.writeframes(data)
@@ -0,0 +1,197 @@
+"""Encoding of recorded speech for upload: downsampling and compression.
+
+Speech models do not use content above 8 kHz, so recordings are resampled
+to 16 kHz before upload. When the optional soundfile package is installed,
+the audio can also be compressed to FLAC or Ogg Opus; otherwise, or for
+formats a provider does not accept, it is sent as WAV.
+"""
+
+import io
+import logging
+import wave
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+import numpy as np
+
+from modules.utils.audio_processing import pcm_to_samples
+
+try:
+    import soundfile as sf
+
+    SOUNDFILE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDFILE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+TARGET_SAMPLE_RATE = 16000
+LOWPASS_TAPS = 63
+
+# format name -> (soundfile format, soundfile subtype, file extension)
+COMPRESSED_FORMATS = {
+    "flac": ("FLAC", "PCM_16", "flac"),
+    "opus": ("OGG", "OPUS", "ogg"),
+}
+
+
+@dataclass
+class AudioEncodingSettings:
+    """Upload encoding, from the "audio_format" and "sample_rate" keys of speech_to_text_model."""
+
+    audio_format: str = "flac"
+    sample_rate: int = TARGET_SAMPLE_RATE
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "AudioEncodingSettings":
+        data = data or {}
+        defaults = cls()
+        return cls(
+            audio_format=str(data.get("audio_format", defaults.audio_format)).lower(),
+            sample_rate=max(8000, int(data.get("sample_rate", defaults.sample_rate))),
+        )
+
+
+def _lowpass_kernel(cutoff: float) -> np.ndarray:
+    """Windowed-sinc low-pass FIR kernel; cutoff is a fraction of the source sample rate."""
+    n = np.arange(LOWPASS_TAPS) - (LOWPASS_TAPS - 1) / 2
+    kernel = np.sinc(2 * cutoff * n) * np.hamming(LOWPASS_TAPS)
+    return kernel / kernel.sum()
+
+
+class Resampler:
+    """Streaming resampler for interleaved int16 audio.
+
+    Blocks can be fed one at a time; filter and interpolation state is
+    carried across blocks so the output matches resampling the whole
+    recording at once. Call flush() after the last block.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int, channels: int = 1):
+        self.src_rate = src_rate
+        self.dst_rate = dst_rate
+        self.channels = channels
+        self._kernel = _lowpass_kernel(0.45 * dst_rate / src_rate) if dst_rate < src_rate else None
+        self._history = np.zeros((LOWPASS_TAPS - 1, channels), dtype=np.float32)
+        self._delay = (LOWPASS_TAPS - 1) // 2 if self._kernel is not None else 0
+        self._src_pos = 0
+        self._dst_pos = 0
+        self._last: np.ndarray | None = None
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample one block and return the output samples that are complete so far."""
+        if self.src_rate == self.dst_rate or len(samples) == 0:
+            return samples
+        data = samples.reshape(-1, self.channels).astype(np.float32)
+        if self._kernel is not None:
+            padded = np.concatenate((self._history, data))
+            self._history = padded[len(padded) - (LOWPASS_TAPS - 1) :]
+            data = np.stack(
+                [np.convolve(padded[:, ch], self._kernel, mode="valid") for ch in range(self.channels)], axis=1
+            )
+            # Drop the filter's group delay so output stays aligned with the input
+            drop = min(self._delay, len(data))
+            data = data[drop:]
+            self._delay -= drop
+        return self._interpolate(data)
+
+    def flush(self) -> np.ndarray:
+        """Return the output still held back by the low-pass filter."""
+        if self._kernel is None or self.src_rate == self.dst_rate:
+            return np.zeros(0, dtype=np.int16)
+        return self.process(np.zeros((LOWPASS_TAPS - 1) // 2 * self.channels, dtype=np.int16))
+
+    def _interpolate(self, data: np.ndarray) -> np.ndarray:
+        start = self._src_pos
+        self._src_pos += len(data)
+        if self._last is not None:
+            data = np.concatenate((self._last[np.newaxis], data))
+            start -= 1
+        if len(data) == 0:
+            return np.zeros(0, dtype=np.int16)
+        self._last = data[-1]
+
+        # Output sample k lies at input position k * src_rate / dst_rate
+        last_k = (start + len(data) - 1) * self.dst_rate // self.src_rate
+        positions = np.arange(self._dst_pos, last_k + 1) * self.src_rate / self.dst_rate - start
+        self._dst_pos = max(self._dst_pos, last_k + 1)
+        index = np.arange(len(data))
+        resampled = np.stack([np.interp(positions, index, data[:, ch]) for ch in range(self.channels)], axis=1)
+        return np.clip(np.rint(resampled), -32768, 32767).astype(np.int16).reshape(-1)
+
+
+def resample(samples: np.ndarray, src_rate: int, dst_rate: int, channels: int = 1) -> np.ndarray:
+    """Resample a complete recording of interleaved int16 audio."""
+    resampler = Resampler(src_rate, dst_rate, channels)
+    return np.concatenate((resampler.process(samples), resampler.flush()))
+
+
+class AudioEncoder:
+    """Streams int16 PCM into a file object in the upload format, resampling on the way.
+
+    The output format follows the settings, falling back to WAV when
+    soundfile is unavailable or cannot encode it; extension reports the
+    format actually written.
+    """
+
+    def __init__(self, target: BinaryIO, rate: int, channels: int, settings: AudioEncodingSettings):
+        self.channels = channels
+        self.rate = min(rate, settings.sample_rate)
+        self._resampler = Resampler(rate, self.rate, channels)
+        self._sound_file = None
+        self._wave_file = None
+
+        compressed = COMPRESSED_FORMATS.get(settings.audio_format)
+        if compressed is not None and SOUNDFILE_AVAILABLE:
+            file_format, subtype, self.extension = compressed
+            try:
+                self._sound_file = sf.SoundFile(
+                    target, "w", samplerate=self.rate, channels=channels, format=file_format, subtype=subtype
+                )
+                return
+            except (sf.LibsndfileError, ValueError, TypeError) as e:
+                logger.warning(f"Could not encode audio as {settings.audio_format}, using WAV: {e}")
+                target.seek(0)
+                target.truncate()
+        elif compressed is not None:
+            logger.debug(f"soundfile is not installed, sending WAV instead of {settings.audio_format}")
+
+        self.extension = "wav"
+        self._wave_file = wave.Wave_write(target)
+        self._wave_file.setnchannels(channels)
+        self._wave_file.setsampwidth(2)
+        self._wave_file.setframerate(self.rate)
+
+    def write(self, pcm: bytes | bytearray | memoryview | np.ndarray) -> None:
+        samples = pcm if isinstance(pcm, np.ndarray) else pcm_to_samples(pcm)
+        self._write_samples(self._resampler.process(samples))
+
+    def close(self) -> None:
+        """Flush buffered output and finalize the container; the target stays open."""
+        self._write_samples(self._resampler.flush())
+        if self._sound_file is not None:
+            self._sound_file.close()
+        if self._wave_file is not None:
+            self._wave_file.close()
+
+    def _write_samples(self, samples: np.ndarray) -> None:
+        if len(samples) == 0:
+            return
+        if self._sound_file is not None:
+            self._sound_file.write(samples.reshape(-1, self.channels))
+        else:
+            self._wave_file.writeframes(samples.tobytes())
+
+
+def encode_audio(
+    pcm: bytes | bytearray | memoryview,
+    rate: int,
+    channels: int,
+    settings: AudioEncodingSettings,
+) -> tuple[bytes, str]:
+    """Encode int16 PCM for upload and return (encoded_bytes, file_extension)."""
+    buffer = io.BytesIO()
+    encoder = AudioEncoder(buffer, rate, channels, settings)
+    encoder.write(pcm)
+    encoder.close()
+    return buffer.getvalue(), encoder.extension
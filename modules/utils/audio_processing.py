@@ -0,0 +1,144 @@
+"""NumPy helpers for recorded 16-bit PCM audio: voice activity detection and WAV encoding."""
+
+import io
+import wave
+
+import numpy as np
+
+VAD_FRAME_MS = 30
+SPEECH_MIN_RMS = 200.0
+UNVOICED_MIN_RMS = 100.0
+NOISE_FLOOR_PERCENTILE = 10
+NOISE_FLOOR_FACTOR = 2.5
+UNVOICED_FLOOR_FACTOR = 1.5
+LOUD_PERCENTILE = 90
+LOUD_FRACTION = 0.25
+UNVOICED_MIN_ZCR = 0.3
+MIN_SPEECH_FRAMES = 3
+
+
+def pcm_to_samples(pcm: bytes | bytearray | memoryview) -> np.ndarray:
+    """View raw little-endian int16 PCM as a sample array (no copy)."""
+    return np.frombuffer(pcm, dtype=np.int16)
+
+
+def frame_length(rate: int) -> int:
+    """Number of samples in one VAD frame."""
+    return max(1, rate * VAD_FRAME_MS // 1000)
+
+
+def _split_frames(samples: np.ndarray, rate: int) -> np.ndarray:
+    """Complete VAD frames as a 2-D array; a trailing partial frame is ignored."""
+    length = frame_length(rate)
+    count = len(samples) // length
+    return samples[: count * length].reshape(count, length)
+
+
+def frame_rms(samples: np.ndarray, rate: int) -> np.ndarray:
+    """RMS energy of each complete VAD frame."""
+    frames = _split_frames(samples, rate).astype(np.float64)
+    if len(frames) == 0:
+        return np.zeros(0, dtype=np.float64)
+    return np.sqrt(np.mean(frames * frames, axis=1))
+
+
+def frame_zcr(samples: np.ndarray, rate: int) -> np.ndarray:
+    """Zero-crossing rate (crossings per sample) of each complete VAD frame."""
+    signs = np.signbit(_split_frames(samples, rate))
+    if signs.shape[0] == 0 or signs.shape[1] < 2:
+        return np.zeros(signs.shape[0], dtype=np.float64)
+    return np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+
+def speech_threshold(rms: np.ndarray) -> float:
+    """RMS level above which a frame counts as voiced speech.
+
+    The threshold adapts to the background level: speech must be well above
+    the quietest frames of the buffer, and never below an absolute minimum
+    so that silence is not mistaken for speech. It is capped relative to the
+    loudest frames so that a buffer with little silence still finds its pauses.
+    """
+    if len(rms) == 0:
+        return SPEECH_MIN_RMS
+    noise_floor, loud = np.percentile(rms, [NOISE_FLOOR_PERCENTILE, LOUD_PERCENTILE])
+    return max(SPEECH_MIN_RMS, min(float(noise_floor) * NOISE_FLOOR_FACTOR, float(loud) * LOUD_FRACTION))
+
+
+def classify_frames(rms: np.ndarray, zcr: np.ndarray) -> np.ndarray:
+    """Mark speech frames from per-frame energy and zero-crossing rate.
+
+    Voiced sounds are loud. Unvoiced consonants (s, f, sh) are quieter but
+    cross zero often, so frames somewhat above the noise floor with a high
+    zero-crossing rate count as speech too.
+    """
+    if len(rms) == 0:
+        return np.zeros(0, dtype=bool)
+    voiced = speech_threshold(rms)
+    noise_floor = float(np.percentile(rms, NOISE_FLOOR_PERCENTILE))
+    unvoiced = min(voiced, max(UNVOICED_MIN_RMS, noise_floor * UNVOICED_FLOOR_FACTOR))
+    return (rms > voiced) | ((rms > unvoiced) & (zcr > UNVOICED_MIN_ZCR))
+
+
+def speech_mask(samples: np.ndarray, rate: int) -> np.ndarray:
+    """Mark VAD frames that contain speech."""
+    return classify_frames(frame_rms(samples, rate), frame_zcr(samples, rate))
+
+
+def trim_silence(samples: np.ndarray, rate: int, max_pause_ms: int, padding_ms: int) -> np.ndarray | None:
+    """Drop leading and trailing silence and shorten pauses longer than max_pause_ms.
+
+    padding_ms of audio is kept around speech so word edges are not clipped.
+    Returns None when the audio contains no speech.
+    """
+    mask = speech_mask(samples, rate)
+    if int(mask.sum()) < MIN_SPEECH_FRAMES:
+        return None
+
+    padding = padding_ms // VAD_FRAME_MS
+    keep = np.convolve(mask, np.ones(2 * padding + 1), mode="same") > 0 if padding else mask.copy()
+
+    # Internal pauses are kept up to max_pause frames, taken from their start and end
+    max_pause = max(1, max_pause_ms // VAD_FRAME_MS)
+    head = max_pause // 2
+    edges = np.diff(np.concatenate(([1], keep.astype(np.int8), [1])))
+    pause_starts = np.flatnonzero(edges == -1)
+    pause_ends = np.flatnonzero(edges == 1)
+    for start, end in zip(pause_starts, pause_ends, strict=True):
+        if start == 0 or end == len(keep):
+            continue
+        if end - start <= max_pause:
+            keep[start:end] = True
+        else:
+            keep[start : start + head] = True
+            keep[end - (max_pause - head) : end] = True
+
+    length = frame_length(rate)
+    sample_keep = np.zeros(len(samples), dtype=bool)
+    sample_keep[: len(keep) * length] = np.repeat(keep, length)
+    sample_keep[len(keep) * length :] = keep[-1]
+    return samples[sample_keep]
+
+
+def find_pause(mask: np.ndarray, min_pause_frames: int, start_frame: int = 0) -> tuple[int, int] | None:
+    """Return (start, end) frame indices of the first run of at least min_pause_frames non-speech frames."""
+    run_start = None
+    for index in range(start_frame, len(mask)):
+        if not mask[index]:
+            if run_start is None:
+                run_start = index
+            if index + 1 - run_start >= min_pause_frames and (index + 1 == len(mask) or mask[index + 1]):
+                return run_start, index + 1
+        else:
+            run_start = None
+    return None
+
+
+def pcm_to_wav_bytes(pcm: bytes | bytearray | memoryview, rate: int, channels: int = 1) -> bytes:
+    """Wrap raw int16 PCM in a WAV container."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(pcm)
+    return buffer.getvalue()
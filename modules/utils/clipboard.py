@@ -5,9 +5,15 @@ import io
 import logging
 import platform
 import subprocess
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 from core.exceptions import ClipboardError
 from core.interfaces import ClipboardManager
+from modules.utils.x11_clipboard import get_x11_clipboard_reader
+
+if TYPE_CHECKING:
+    from modules.utils.clipboard_monitor import ClipboardMonitor, ClipboardSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +31,17 @@ class SystemClipboardManager(ClipboardManager):
 
     def __init__(self):
         self.platform = platform.system()
+        self._monitor: ClipboardMonitor | None = None
+
+    def set_monitor(self, monitor: "ClipboardMonitor | None") -> None:
+        """Serve Linux clipboard reads from a ClipboardMonitor snapshot."""
+        self._monitor = monitor
+
+    def get_snapshot(self) -> "ClipboardSnapshot | None":
+        """Get the current clipboard snapshot, or None if no monitor can serve it."""
+        if self._monitor is None:
+            return None
+        return self._monitor.get_snapshot()
 
     def get_content(self) -> str:
         """Get the current clipboard content."""
@@ -42,6 +59,8 @@ class SystemClipboardManager(ClipboardManager):
 
     def set_content(self, content: str) -> bool:
         """Set the clipboard content. Returns True if successful."""
+        if self._monitor is not None:
+            self._monitor.invalidate()
         try:
             if self.platform == "Darwin":
                 return self._set_content_macos(content)
@@ -170,24 +189,40 @@ class SystemClipboardManager(ClipboardManager):
         """Check if clipboard contains an image on Linux."""
         logger.debug("Checking Linux clipboard for images")
 
+        snapshot = self.get_snapshot()
+        if snapshot is not None:
+            return snapshot.has_image
+
         # Try Qt's clipboard first - trust it if available
         # This avoids X11 clipboard deadlock when Qt owns the clipboard
         # (calling xclip from Qt's event loop while Qt owns clipboard causes timeout)
         try:
             from PySide6.QtWidgets import QApplication
 
+            from modules.utils.clipboard_image import has_image_data
+
             app = QApplication.instance()
             if app:
                 clipboard = app.clipboard()
                 mime_data = clipboard.mimeData()
                 if mime_data:
                     # Qt has valid clipboard access - trust its result
-                    has_image = mime_data.hasImage()
+                    has_image = has_image_data(mime_data)
                     logger.debug(f"Qt clipboard hasImage: {has_image}")
                     return has_image
         except Exception as e:
             logger.debug(f"Qt clipboard check failed: {e}")
 
+        # Native X11: a single TARGETS request over a persistent connection
+        reader = get_x11_clipboard_reader()
+        if reader is not None:
+            try:
+                has_image = reader.has_image()
+                logger.debug(f"X11 image detection result: {has_image}")
+                return has_image
+            except ClipboardError as e:
+                logger.debug(f"X11 clipboard check failed: {e}")
+
         # Try xclip as it has reliable TARGETS support
         try:
             result = subprocess.run(
@@ -233,28 +268,45 @@ class SystemClipboardManager(ClipboardManager):
         """Get image data from clipboard on Linux."""
         logger.debug("Attempting to get image data from Linux clipboard")
 
+        if self._monitor is not None:
+            snapshot = self._monitor.get_snapshot()
+            if snapshot is not None and not snapshot.has_image:
+                return None
+            image_data = self._monitor.get_image()
+            if image_data:
+                return image_data
+
         # Try Qt's clipboard first (handles Qt-set images)
         try:
-            from PySide6.QtCore import QBuffer, QIODevice
-            from PySide6.QtGui import QPixmap
             from PySide6.QtWidgets import QApplication
 
+            from modules.utils.clipboard_image import has_image_data, read_clipboard_image
+
             app = QApplication.instance()
             if app:
                 clipboard = app.clipboard()
                 mime_data = clipboard.mimeData()
-                if mime_data.hasImage():
-                    pixmap = QPixmap(clipboard.pixmap())
-                    if not pixmap.isNull():
-                        buffer = QBuffer()
-                        buffer.open(QIODevice.WriteOnly)
-                        pixmap.save(buffer, "PNG")
-                        image_data = base64.b64encode(buffer.data()).decode("utf-8")
-                        logger.debug(f"Got image from Qt clipboard, size: {len(image_data)}")
-                        return (image_data, "image/png")
+                if has_image_data(mime_data):
+                    image_data = read_clipboard_image(clipboard)
+                    if image_data:
+                        logger.debug(f"Got {image_data[1]} from Qt clipboard, size: {len(image_data[0])}")
+                        return image_data
         except Exception as e:
             logger.debug(f"Qt clipboard get image failed: {e}")
 
+        reader = get_x11_clipboard_reader()
+        if reader is not None:
+            try:
+                image = reader.get_image()
+                if image is None:
+                    logger.debug("X11 clipboard offers no image data")
+                    return None
+                image_bytes, mime_type = image
+                logger.debug(f"Retrieved image data over X11, size: {len(image_bytes)} bytes")
+                return (base64.b64encode(image_bytes).decode("utf-8"), mime_type)
+            except ClipboardError as e:
+                logger.debug(f"X11 clipboard get image failed: {e}")
+
         image_formats = [
             ("image/png", "png"),
             ("image/jpeg", "jpeg"),
@@ -315,6 +367,8 @@ class SystemClipboardManager(ClipboardManager):
         try:
             from PySide6.QtWidgets import QApplication
 
+            from modules.utils.clipboard_image import has_image_data
+
             app = QApplication.instance()
             if app is None:
                 app = QApplication([])
@@ -322,17 +376,17 @@ class SystemClipboardManager(ClipboardManager):
             clipboard = app.clipboard()
             mime_data = clipboard.mimeData()
 
-            return mime_data.hasImage()
+            return has_image_data(mime_data)
         except Exception:
             return False
 
     def _get_image_data_windows(self) -> tuple[str, str] | None:
         """Get image data from clipboard on Windows."""
         try:
-            from PySide6.QtCore import QBuffer, QIODevice
-            from PySide6.QtGui import QPixmap
             from PySide6.QtWidgets import QApplication
 
+            from modules.utils.clipboard_image import has_image_data, read_clipboard_image
+
             app = QApplication.instance()
             if app is None:
                 app = QApplication([])
@@ -340,20 +394,33 @@ class SystemClipboardManager(ClipboardManager):
             clipboard = app.clipboard()
             mime_data = clipboard.mimeData()
 
-            if mime_data.hasImage():
-                pixmap = QPixmap(clipboard.pixmap())
-                if not pixmap.isNull():
-                    buffer = QBuffer()
-                    buffer.open(QIODevice.WriteOnly)
-                    pixmap.save(buffer, "PNG")
-                    image_data = base64.b64encode(buffer.data()).decode("utf-8")
-                    return (image_data, "image/png")
+            if has_image_data(mime_data):
+                return read_clipboard_image(clipboard)
 
         except Exception:
             pass
 
         return None
 
+    def capture_image(self, callback: Callable[[tuple[str, str] | None], None]) -> bool:
+        """Capture the clipboard image without blocking on re-encoding.
+
+        Uses Qt when an application is running: encoded clipboard bytes are
+        delivered immediately, bitmaps are encoded to PNG on a worker.
+        """
+        if self.platform != "Darwin":
+            try:
+                from PySide6.QtWidgets import QApplication
+
+                from modules.utils.clipboard_image import get_clipboard_image_encoder
+
+                app = QApplication.instance()
+                if app:
+                    return get_clipboard_image_encoder().capture(app.clipboard(), callback)
+            except Exception as e:
+                logger.debug(f"Qt clipboard image capture failed: {e}")
+        return super().capture_image(callback)
+
     def get_image_data(self) -> tuple[str, str] | None:
         """Get image data from clipboard as (base64_data, media_type) tuple."""
         try:
@@ -391,6 +458,10 @@ class SystemClipboardManager(ClipboardManager):
 
     def _get_content_linux(self) -> str:
         """Get clipboard content on Linux."""
+        snapshot = self.get_snapshot()
+        if snapshot is not None:
+            return snapshot.text
+
         # Try Qt's clipboard first - trust it if available
         # This avoids X11 clipboard deadlock when Qt owns the clipboard
         # (calling xclip from Qt's event loop while Qt owns clipboard causes timeout)
@@ -408,6 +479,15 @@ class SystemClipboardManager(ClipboardManager):
         except Exception as e:
             logger.debug(f"Qt clipboard check failed: {e}")
 
+        reader = get_x11_clipboard_reader()
+        if reader is not None:
+            try:
+                text = reader.get_text()
+                if text is not None:
+                    return text
+            except ClipboardError as e:
+                logger.debug(f"X11 clipboard get text failed: {e}")
+
         # Fallback to xclip/xsel for non-Qt contexts
         xclip_error = None
         try:
@@ -0,0 +1,139 @@
+"""Bounded in-memory history of recent clipboard clips."""
+
+import base64
+import hashlib
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CLIPS = 20
+DEFAULT_MAX_CLIP_BYTES = 16 * 1024 * 1024
+INTERN_MAX_LENGTH = 64
+
+# Formats that password managers and other apps set to keep a copy out of clipboard history
+CONCEALED_MIME_HINTS = (
+    "x-kde-passwordManagerHint",  # KDE / KeePassXC
+    "application/x-nspasteboard-concealed-type",  # macOS
+    "ExcludeClipboardContentFromMonitorProcessing",  # Windows
+)
+
+
+def is_concealed(mime_types: tuple[str, ...]) -> bool:
+    """Check whether the clipboard content is marked as secret by its source app."""
+    return any(hint in mime_type for mime_type in mime_types for hint in CONCEALED_MIME_HINTS)
+
+
+@dataclass(slots=True)
+class Clip:
+    """One clipboard clip: either text or encoded image bytes."""
+
+    key: str
+    captured_at: float
+    text: str | None = None
+    image: bytes | None = None
+    media_type: str | None = None
+
+    @property
+    def is_image(self) -> bool:
+        return self.image is not None
+
+    @property
+    def size(self) -> int:
+        if self.image is not None:
+            return len(self.image)
+        return len(self.text.encode("utf-8")) if self.text else 0
+
+    def image_base64(self) -> str | None:
+        """Image bytes as base64, the format used by the rest of the pipeline."""
+        if self.image is None:
+            return None
+        return base64.b64encode(self.image).decode("utf-8")
+
+
+def _clip_key(kind: bytes, payload: bytes) -> str:
+    return hashlib.blake2b(kind + payload, digest_size=8).hexdigest()
+
+
+class ClipboardHistory:
+    """Ring of recent clips with content-hash dedup and a byte budget.
+
+    Re-copying a known clip moves it to the front instead of storing it
+    again. The oldest clips are evicted once either the clip count or the
+    total byte size exceeds its limit; the newest clip is always kept.
+    """
+
+    def __init__(self, max_clips: int = DEFAULT_MAX_CLIPS, max_bytes: int = DEFAULT_MAX_CLIP_BYTES):
+        self.max_clips = max_clips
+        self.max_bytes = max_bytes
+        self._clips: OrderedDict[str, Clip] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def add_text(self, text: str) -> Clip | None:
+        """Record a text clip. Blank text is ignored."""
+        if not text or not text.strip():
+            return None
+        if len(text) <= INTERN_MAX_LENGTH:
+            text = sys.intern(text)
+        key = _clip_key(b"t", text.encode("utf-8"))
+        return self._add(Clip(key=key, captured_at=time.time(), text=text))
+
+    def add_image(self, image_bytes: bytes, media_type: str) -> Clip | None:
+        """Record an image clip from encoded image bytes."""
+        if not image_bytes:
+            return None
+        key = _clip_key(b"i", image_bytes)
+        return self._add(Clip(key=key, captured_at=time.time(), image=image_bytes, media_type=media_type))
+
+    def _add(self, clip: Clip) -> Clip:
+        with self._lock:
+            existing = self._clips.get(clip.key)
+            if existing is not None:
+                existing.captured_at = clip.captured_at
+                self._clips.move_to_end(clip.key)
+                return existing
+
+            self._clips[clip.key] = clip
+            self._total_bytes += clip.size
+            self._evict()
+            return clip
+
+    def _evict(self) -> None:
+        while len(self._clips) > 1 and (len(self._clips) > self.max_clips or self._total_bytes > self.max_bytes):
+            _, oldest = self._clips.popitem(last=False)
+            self._total_bytes -= oldest.size
+
+    def get_clips(self) -> list[Clip]:
+        """Clips ordered newest first."""
+        with self._lock:
+            return list(reversed(self._clips.values()))
+
+    def get_clip(self, key: str) -> Clip | None:
+        with self._lock:
+            return self._clips.get(key)
+
+    def remove(self, key: str) -> bool:
+        with self._lock:
+            clip = self._clips.pop(key, None)
+            if clip is None:
+                return False
+            self._total_bytes -= clip.size
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clips.clear()
+            self._total_bytes = 0
+
+    def get_memory_usage(self) -> dict[str, int]:
+        """Clip count and payload bytes held."""
+        with self._lock:
+            return {"clips": len(self._clips), "bytes": self._total_bytes}
+
+    def __len__(self) -> int:
+        return len(self._clips)
@@ -0,0 +1,183 @@
+"""Clipboard image capture without unnecessary re-encoding.
+
+When the clipboard already holds encoded image bytes (PNG, JPEG, ...), they
+are read directly from the MIME data and only base64-encoded. Only bitmap
+clipboard contents are converted to PNG, and that work runs on a worker
+thread so a large screenshot does not block the GUI.
+"""
+
+import base64
+import logging
+from collections.abc import Callable
+
+from PySide6.QtCore import (
+    QBuffer,
+    QCoreApplication,
+    QIODevice,
+    QMimeData,
+    QObject,
+    QRunnable,
+    Qt,
+    QThread,
+    QThreadPool,
+    Signal,
+)
+from PySide6.QtGui import QClipboard, QImage
+
+logger = logging.getLogger(__name__)
+
+RAW_IMAGE_MIME_TYPES = ("image/png", "image/jpeg", "image/gif", "image/webp", "image/bmp")
+
+ImageCallback = Callable[[tuple[str, str] | None], None]
+ImageBytesCallback = Callable[[tuple[bytes, str] | None], None]
+
+
+def has_image_data(mime_data: QMimeData | None) -> bool:
+    """Check for a bitmap or any encoded image format (Qt's hasImage misses the latter)."""
+    if mime_data is None:
+        return False
+    return mime_data.hasImage() or any(mime_type in RAW_IMAGE_MIME_TYPES for mime_type in mime_data.formats())
+
+
+def read_raw_image(mime_data: QMimeData | None) -> tuple[bytes, str] | None:
+    """Return (image_bytes, media_type) if the clipboard offers an encoded image format."""
+    if mime_data is None:
+        return None
+    formats = set(mime_data.formats())
+    for mime_type in RAW_IMAGE_MIME_TYPES:
+        if mime_type in formats:
+            raw = bytes(mime_data.data(mime_type))
+            if raw:
+                return raw, mime_type
+    return None
+
+
+def encode_png(image: QImage) -> bytes | None:
+    """Encode a QImage as PNG. Safe to call from worker threads."""
+    if image.isNull():
+        return None
+    buffer = QBuffer()
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(buffer.data())
+
+
+def read_clipboard_image(clipboard: QClipboard) -> tuple[str, str] | None:
+    """Read clipboard image synchronously as (base64_data, media_type)."""
+    raw = read_raw_image(clipboard.mimeData())
+    if raw is None:
+        png_bytes = encode_png(clipboard.image())
+        if png_bytes is None:
+            return None
+        raw = (png_bytes, "image/png")
+    image_bytes, media_type = raw
+    return base64.b64encode(image_bytes).decode("utf-8"), media_type
+
+
+def _deliverable(image_bytes: bytes, media_type: str, as_base64: bool) -> tuple[str, str] | tuple[bytes, str]:
+    if as_base64:
+        return base64.b64encode(image_bytes).decode("utf-8"), media_type
+    return image_bytes, media_type
+
+
+class _EncodeJob(QRunnable):
+    """Worker that encodes one QImage to PNG, as base64 unless raw bytes were requested."""
+
+    def __init__(self, encoder: "ClipboardImageEncoder", image: QImage, callback: Callable, as_base64: bool):
+        super().__init__()
+        self._encoder = encoder
+        self._image = image
+        self._callback = callback
+        self._as_base64 = as_base64
+
+    def run(self):
+        result = None
+        try:
+            png_bytes = encode_png(self._image)
+            if png_bytes is not None:
+                result = _deliverable(png_bytes, "image/png", self._as_base64)
+        except Exception as e:
+            logger.warning(f"Failed to encode clipboard image: {e}")
+        self._encoder._job_finished.emit(self._callback, result)
+
+
+class ClipboardImageEncoder(QObject):
+    """Captures clipboard images, re-encoding on a worker only when needed.
+
+    Callbacks are delivered through queued signals to this object, so it
+    always lives on the GUI thread, even when first created from a hotkey
+    or worker thread that has no event loop.
+    """
+
+    _job_finished = Signal(object, object)  # callback, (base64_data or bytes, media_type) | None
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._job_finished.connect(self._on_job_finished, Qt.QueuedConnection)
+
+        app = QCoreApplication.instance()
+        if parent is None and app is not None and self.thread() != app.thread():
+            self.moveToThread(app.thread())
+
+    def capture(self, clipboard: QClipboard, callback: ImageCallback) -> bool:
+        """Capture the clipboard image and pass it to callback on the GUI thread.
+
+        Encoded images are delivered immediately when called on the GUI
+        thread; bitmaps are encoded to PNG on a worker first. Returns False
+        if the clipboard holds no image.
+        """
+        return self._capture(clipboard, callback, as_base64=True)
+
+    def capture_bytes(self, clipboard: QClipboard, callback: ImageBytesCallback) -> bool:
+        """Like capture, but pass (image_bytes, media_type) for callers that store bytes."""
+        return self._capture(clipboard, callback, as_base64=False)
+
+    def _capture(self, clipboard: QClipboard, callback: Callable, as_base64: bool) -> bool:
+        mime_data = clipboard.mimeData()
+        raw = read_raw_image(mime_data)
+        if raw is not None:
+            image_bytes, media_type = raw
+            logger.debug(f"Using raw clipboard {media_type} bytes, size: {len(image_bytes)}")
+            result = _deliverable(image_bytes, media_type, as_base64)
+            if QThread.currentThread() == self.thread():
+                callback(result)
+            else:
+                self._job_finished.emit(callback, result)
+            return True
+
+        if not has_image_data(mime_data):
+            return False
+
+        image = clipboard.image()
+        if image.isNull():
+            return False
+        self._pool.start(_EncodeJob(self, image, callback, as_base64))
+        return True
+
+    def _on_job_finished(self, callback: Callable, result: tuple | None) -> None:
+        callback(result)
+
+
+_encoder: ClipboardImageEncoder | None = None
+
+
+def get_clipboard_image_encoder() -> ClipboardImageEncoder:
+    """Get the shared ClipboardImageEncoder instance (create it on the GUI thread at startup)."""
+    global _encoder
+    if _encoder is None:
+        _encoder = ClipboardImageEncoder()
+    return _encoder
+
+
+def write_clipboard_image(clipboard: QClipboard, image_bytes: bytes, media_type: str) -> bool:
+    """Put encoded image bytes on the clipboard, plus a decoded bitmap for apps that need one."""
+    image = QImage()
+    if not image.loadFromData(image_bytes):
+        return False
+    mime_data = QMimeData()
+    mime_data.setData(media_type, image_bytes)
+    mime_data.setImageData(image)
+    clipboard.setMimeData(mime_data)
+    return True
@@ -0,0 +1,171 @@
+"""Event-driven clipboard snapshot cache.
+
+Reading the clipboard on Linux used to spawn xclip/xsel for every call.
+ClipboardMonitor listens to QClipboard change notifications (backed by X11
+selection-owner events) and keeps a versioned snapshot of the clipboard
+text, its MIME targets and, lazily, its image bytes. Reads are then served
+from memory. A fallback poller can be enabled for sessions where change
+events are unreliable (e.g. Wayland without focus).
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+from PySide6.QtCore import QObject, QThread, QTimer, Signal
+from PySide6.QtGui import QClipboard
+
+from modules.utils.clipboard_image import has_image_data, read_clipboard_image
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WAYLAND_POLL_INTERVAL_MS = 500
+
+
+@dataclass
+class ClipboardSnapshot:
+    """Clipboard state captured at one point in time."""
+
+    version: int
+    text: str
+    mime_types: tuple[str, ...]
+    has_image: bool
+    captured_at: float
+    image: tuple[str, str] | None = None  # (base64_data, media_type), loaded lazily
+    image_loaded: bool = False
+
+
+def get_default_poll_interval_ms() -> int:
+    """Default poll interval: off on X11, enabled on Wayland where events need focus."""
+    if os.environ.get("XDG_SESSION_TYPE", "").lower() == "wayland":
+        return DEFAULT_WAYLAND_POLL_INTERVAL_MS
+    return 0
+
+
+class ClipboardMonitor(QObject):
+    """Keeps an in-memory snapshot of the system clipboard up to date."""
+
+    snapshot_changed = Signal(int)  # snapshot version
+
+    def __init__(self, clipboard: QClipboard, poll_interval_ms: int = 0, parent: QObject | None = None):
+        super().__init__(parent)
+        self._clipboard = clipboard
+        self._lock = threading.Lock()
+        self._version = 0
+        self._stale = True
+        self._snapshot: ClipboardSnapshot | None = None
+        self._fingerprint: tuple | None = None
+
+        self._clipboard.dataChanged.connect(self._on_data_changed)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.timeout.connect(self._poll)
+        self.set_poll_interval(poll_interval_ms)
+
+        self._refresh()
+
+    def set_poll_interval(self, interval_ms: int) -> None:
+        """Enable the fallback poller, or disable it with 0."""
+        if interval_ms and interval_ms > 0:
+            self._poll_timer.start(interval_ms)
+            logger.debug(f"Clipboard fallback poller enabled ({interval_ms} ms)")
+        else:
+            self._poll_timer.stop()
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale, e.g. after writing the clipboard externally."""
+        with self._lock:
+            self._stale = True
+
+    def get_snapshot(self) -> ClipboardSnapshot | None:
+        """Return the current snapshot.
+
+        Refreshes synchronously when stale and called on the GUI thread.
+        Returns None when the snapshot is stale and cannot be refreshed from
+        this thread; callers should then fall back to a direct read.
+        """
+        with self._lock:
+            stale = self._stale
+            snapshot = self._snapshot
+        if not stale:
+            return snapshot
+        if self._on_gui_thread():
+            self._refresh()
+            return self._snapshot
+        return None
+
+    def get_image(self) -> tuple[str, str] | None:
+        """Return clipboard image as (base64_data, media_type), cached per version.
+
+        Raw bytes are used when the clipboard offers an encoded image format;
+        otherwise the image is encoded to PNG once.
+        """
+        snapshot = self.get_snapshot()
+        if snapshot is None or not snapshot.has_image:
+            return None
+        if snapshot.image_loaded:
+            return snapshot.image
+        if not self._on_gui_thread():
+            return None
+
+        image = self._read_image()
+        with self._lock:
+            if self._snapshot is snapshot:
+                snapshot.image = image
+                snapshot.image_loaded = True
+        return image
+
+    def _on_gui_thread(self) -> bool:
+        return QThread.currentThread() == self.thread()
+
+    def _on_data_changed(self) -> None:
+        self._refresh()
+
+    def _poll(self) -> None:
+        """Fallback: refresh only if the clipboard fingerprint changed."""
+        if self._read_fingerprint() != self._fingerprint:
+            self._refresh()
+
+    def _read_fingerprint(self) -> tuple:
+        mime_data = self._clipboard.mimeData()
+        if not mime_data:
+            return ()
+        formats = tuple(mime_data.formats())
+        text = mime_data.text() if mime_data.hasText() else ""
+        return formats, hash(text)
+
+    def _refresh(self) -> None:
+        """Capture a new snapshot from the Qt clipboard (GUI thread only)."""
+        try:
+            mime_data = self._clipboard.mimeData()
+            if mime_data:
+                mime_types = tuple(mime_data.formats())
+                text = mime_data.text() if mime_data.hasText() else ""
+                has_image = has_image_data(mime_data)
+            else:
+                mime_types, text, has_image = (), "", False
+        except Exception as e:
+            logger.debug(f"Clipboard snapshot refresh failed: {e}")
+            return
+
+        with self._lock:
+            self._version += 1
+            self._snapshot = ClipboardSnapshot(
+                version=self._version,
+                text=text,
+                mime_types=mime_types,
+                has_image=has_image,
+                captured_at=time.monotonic(),
+            )
+            self._fingerprint = (mime_types, hash(text))
+            self._stale = False
+            version = self._version
+
+        logger.debug(f"Clipboard snapshot v{version}: {len(text)} chars, image={has_image}")
+        self.snapshot_changed.emit(version)
+
+    def _read_image(self) -> tuple[str, str] | None:
+        """Read image data from the Qt clipboard."""
+        return read_clipboard_image(self._clipboard)
@@ -11,6 +11,7 @@ import json5
 from dotenv import load_dotenv
 
 from core.exceptions import ConfigurationError
+from core.speech_backends import LOCAL_BACKEND
 
 from .keymap import KeymapManager
 from .paths import get_env_file, get_settings_file
@@ -18,6 +19,7 @@ from .paths import get_env_file, get_settings_file
 DEFAULT_MENU_SECTION_ORDER = [
     "ContextMenuProvider",
     "LastInteractionMenuProvider",
+    "ClipboardHistoryMenuProvider",
     "prompts",
     "SpeechMenuProvider",
     "settings",
@@ -465,7 +467,10 @@ class ConfigService:
         if self._settings_data is None:
             raise ConfigurationError("ConfigService not initialized. Call initialize() first.")
 
-        return self._settings_data.get("menu_section_order", DEFAULT_MENU_SECTION_ORDER.copy())
+        order = list(self._settings_data.get("menu_section_order", DEFAULT_MENU_SECTION_ORDER))
+        # Sections added after the order was saved go at the end
+        order.extend(section for section in DEFAULT_MENU_SECTION_ORDER if section not in order)
+        return order
 
     def update_menu_section_order(self, order: list[str], persist: bool = True) -> None:
         """Update the menu section order.
@@ -650,8 +655,10 @@ def validate_config(config: AppConfig) -> None:
         if not isinstance(config.speech_to_text_model, dict):
             raise ConfigurationError("speech_to_text_model must be a dictionary")
 
-        # Required fields for speech_to_text_model
-        required_fields = ["model", "display_name", "api_key_env"]
+        # Required fields for speech_to_text_model; the local backend needs no API key
+        required_fields = ["model", "display_name"]
+        if config.speech_to_text_model.get("backend", "openai") != LOCAL_BACKEND:
+            required_fields.append("api_key_env")
         for field in required_fields:
             if field not in config.speech_to_text_model:
                 raise ConfigurationError(f"speech_to_text_model missing required field: {field}")
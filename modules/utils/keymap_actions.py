@@ -136,19 +136,10 @@ class SetContextValueAction(KeymapAction):
         """Set context value from clipboard (handles both text and images)."""
         try:
             if self.clipboard_manager.has_image():
-                image_data = self.clipboard_manager.get_image_data()
-                if image_data:
-                    base64_data, media_type = image_data
-                    self.context_manager.set_context_image(base64_data, media_type)
-                    logger.info("Context image set from clipboard")
-
-                    if self.notification_manager and is_notification_enabled("context_set"):
-                        self.notification_manager.show_success_notification("Context image set")
-
+                if self.clipboard_manager.capture_image(self._on_image_captured):
                     return True
-                else:
-                    logger.warning("Failed to get image data from clipboard")
-                    return False
+                logger.warning("Failed to get image data from clipboard")
+                return False
             else:
                 clipboard_content = self.clipboard_manager.get_content()
                 self.context_manager.set_context(clipboard_content)
@@ -162,6 +153,19 @@ class SetContextValueAction(KeymapAction):
             logger.error(f"Failed to set context value: {e}")
             return False
 
+    def _on_image_captured(self, image_data: tuple[str, str] | None) -> None:
+        """Set the captured clipboard image as context."""
+        if not image_data:
+            logger.warning("Failed to get image data from clipboard")
+            return
+
+        base64_data, media_type = image_data
+        self.context_manager.set_context_image(base64_data, media_type)
+        logger.info("Context image set from clipboard")
+
+        if self.notification_manager and is_notification_enabled("context_set"):
+            self.notification_manager.show_success_notification("Context image set")
+
 
 class AppendContextValueAction(KeymapAction):
     """Action to append context value from clipboard (supports both text and images)."""
@@ -188,19 +192,10 @@ class AppendContextValueAction(KeymapAction):
         """Append clipboard content to context value (handles both text and images)."""
         try:
             if self.clipboard_manager.has_image():
-                image_data = self.clipboard_manager.get_image_data()
-                if image_data:
-                    base64_data, media_type = image_data
-                    self.context_manager.append_context_image(base64_data, media_type)
-                    logger.info("Context image appended from clipboard")
-
-                    if self.notification_manager and is_notification_enabled("context_append"):
-                        self.notification_manager.show_success_notification("Context image appended")
-
+                if self.clipboard_manager.capture_image(self._on_image_captured):
                     return True
-                else:
-                    logger.warning("Failed to get image data from clipboard")
-                    return False
+                logger.warning("Failed to get image data from clipboard")
+                return False
             else:
                 clipboard_content = self.clipboard_manager.get_content()
                 self.context_manager.append_context(clipboard_content)
@@ -214,6 +209,19 @@ class AppendContextValueAction(KeymapAction):
             logger.error(f"Failed to append context value: {e}")
             return False
 
+    def _on_image_captured(self, image_data: tuple[str, str] | None) -> None:
+        """Append the captured clipboard image to context."""
+        if not image_data:
+            logger.warning("Failed to get image data from clipboard")
+            return
+
+        base64_data, media_type = image_data
+        self.context_manager.append_context_image(base64_data, media_type)
+        logger.info("Context image appended from clipboard")
+
+        if self.notification_manager and is_notification_enabled("context_append"):
+            self.notification_manager.show_success_notification("Context image appended")
+
 
 class ClearContextAction(KeymapAction):
     """Action to clear context value."""
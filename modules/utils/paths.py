@@ -138,6 +138,20 @@ def get_temp_images_dir() -> Path:
     return temp_dir
 
 
+def get_cache_dir(name: str) -> Path:
+    """Get a persistent cache subdirectory.
+
+    Unlike temp images, cached files survive restarts and may be
+    deleted at any time without losing user data.
+
+    Args:
+        name: Cache subdirectory name (e.g., 'thumbnails')
+    """
+    cache_dir = get_user_config_dir() / "cache" / name
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 def _initialize_user_settings(config_dir: Path) -> None:
     """Copy settings_example to user config directory on first run.
 
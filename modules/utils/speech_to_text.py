@@ -1,38 +1,152 @@
-"""Minimal speech-to-text service without numpy/scipy dependencies."""
-
-import os
-import tempfile
+"""Speech-to-text service: microphone recording and transcription.
+
+Long dictations are transcribed while recording: the audio is split at
+pauses into segments that are uploaded in the background, so only the last
+short segment is still pending when recording stops. Without segmentation,
+the recording is spooled as it is captured and processed block by block.
+Audio is uploaded from memory; only large recordings spill to temporary
+files.
+"""
+
+import io
+import logging
 import threading
 import time
 import uuid
 import wave
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, BinaryIO
 
 try:
     import sounddevice as sd
 
     SOUNDDEVICE_AVAILABLE = True
-except ImportError:
+except (ImportError, OSError):  # sounddevice raises OSError when PortAudio is missing
     SOUNDDEVICE_AVAILABLE = False
 
-import contextlib
-
+from core.exceptions import ConfigurationError
 from core.openai_service import OpenAiService
+from modules.utils.audio_buffer import PcmRingBuffer, RecordingSpooler, spooled_file
+from modules.utils.audio_encoding import AudioEncoder, AudioEncodingSettings, encode_audio
+from modules.utils.audio_processing import (
+    MIN_SPEECH_FRAMES,
+    VAD_FRAME_MS,
+    classify_frames,
+    find_pause,
+    frame_length,
+    frame_rms,
+    frame_zcr,
+    pcm_to_samples,
+    speech_mask,
+    trim_silence,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SilenceTrimSettings:
+    """Settings for dropping silence before upload, from speech_to_text_model["silence_trimming"]."""
+
+    enabled: bool = True
+    max_pause_ms: int = 800
+    padding_ms: int = 200
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "SilenceTrimSettings":
+        data = data or {}
+        defaults = cls()
+        return cls(
+            enabled=data.get("enabled", defaults.enabled),
+            max_pause_ms=max(VAD_FRAME_MS, int(data.get("max_pause_ms", defaults.max_pause_ms))),
+            padding_ms=max(0, int(data.get("padding_ms", defaults.padding_ms))),
+        )
+
+
+def prepare_speech(pcm: bytes, sample_rate: int, trimming: SilenceTrimSettings) -> bytes | None:
+    """Apply silence trimming to int16 PCM; None if it contains no speech and need not be uploaded."""
+    samples = pcm_to_samples(pcm)
+    if trimming.enabled:
+        trimmed = trim_silence(samples, sample_rate, trimming.max_pause_ms, trimming.padding_ms)
+        return None if trimmed is None else trimmed.tobytes()
+    if int(speech_mask(samples, sample_rate).sum()) < MIN_SPEECH_FRAMES:
+        return None
+    return pcm
+
+
+TRANSCODE_BLOCK_SECONDS = 15
+
+
+def transcode_recording(
+    source: BinaryIO,
+    encoding: AudioEncodingSettings,
+    trimming: SilenceTrimSettings | None = None,
+) -> tuple[BinaryIO, str] | None:
+    """Trim and encode a spooled WAV recording for upload.
+
+    The recording is processed in blocks so memory use does not depend on
+    its length. Returns (file, extension) with the file rewound, in memory
+    unless it is large. Returns None if trimming is given and finds no speech.
+    """
+    output = spooled_file()
+    encoder = None
+    try:
+        with wave.open(source, "rb") as wav:
+            rate, channels = wav.getframerate(), wav.getnchannels()
+            while block := wav.readframes(rate * TRANSCODE_BLOCK_SECONDS):
+                if trimming is not None:
+                    block = prepare_speech(block, rate * channels, trimming)
+                    if block is None:
+                        continue
+                if encoder is None:
+                    encoder = AudioEncoder(output, rate, channels, encoding)
+                encoder.write(block)
+        if encoder is None:
+            output.close()
+            return None
+        encoder.close()
+        output.seek(0)
+        return output, encoder.extension
+    except Exception:
+        output.close()
+        raise
 
 
 class AudioRecorder:
-    """Audio recorder for capturing microphone input."""
+    """Audio recorder for capturing microphone input.
+
+    The input device and sample rate are probed once and reused until the
+    default input device changes, which is checked whenever the input stream
+    is opened. When armed, the input stream stays open between recordings,
+    keeping its device until it is disarmed, and keeps the last moments of
+    audio in a pre-roll buffer, so recording starts instantly and includes
+    what was said just before the hotkey was pressed.
+    """
+
+    RATES_TO_TRY = (44100, 48000, 16000, 8000)
 
     def __init__(self):
         self.channels = 1
         self.rate = 44100
         self.recording = False
-        self.frames = []
+        self.buffer: PcmRingBuffer | None = None
         self.stream = None
         self.input_device_index = None
+        self._spooler: RecordingSpooler | None = None
+        self._preroll: PcmRingBuffer | None = None
+        self._preroll_seconds = 0.0
+        self._probe_signature: str | None = None
+        self._callback_lock = threading.Lock()
+
+    def start_recording(self, spool: bool = True) -> None:
+        """Start audio recording.
 
-    def start_recording(self) -> None:
-        """Start audio recording."""
+        Args:
+            spool: Write the recording to a temporary file as it is captured. Without
+                spooling, the caller must drain self.buffer while recording.
+        """
         if self.recording:
             return
 
@@ -40,36 +154,21 @@ class AudioRecorder:
             raise Exception("sounddevice is not available. Please install it with: pip install sounddevice")
 
         try:
-            if self.input_device_index is None:
-                self.input_device_index = self._find_working_input_device()
-
-            rates_to_try = [44100, 48000, 16000, 8000]
-
-            for rate in rates_to_try:
-                try:
-                    sd.check_input_settings(
-                        device=self.input_device_index,
-                        channels=self.channels,
-                        samplerate=rate,
-                    )
-                    self.rate = rate
-                    break
-                except Exception as e:
-                    if rate == rates_to_try[-1]:
-                        raise Exception(f"Could not find working audio configuration: {e}") from e
-                    continue
-
-            self.recording = True
-            self.frames = []
-
-            self.stream = sd.RawInputStream(
-                device=self.input_device_index,
-                channels=self.channels,
-                samplerate=self.rate,
-                callback=self._audio_callback,
-                dtype="int16",
-            )
-            self.stream.start()
+            if self.stream is not None and self._probe_signature != self._device_signature():
+                logger.info("Default audio input device changed, reopening input stream")
+                self._close_stream()
+            if self.stream is None:
+                self._open_stream()
+
+            buffer = PcmRingBuffer.for_stream(self.rate, self.channels)
+            if spool:
+                self._spooler = RecordingSpooler(buffer, self.rate, self.channels)
+                self._spooler.start()
+            with self._callback_lock:
+                if self._preroll is not None:
+                    buffer.write(self._preroll.read())
+                self.buffer = buffer
+                self.recording = True
 
         except Exception as e:
             self._cleanup()
@@ -84,53 +183,128 @@ class AudioRecorder:
                 error_msg += "4. Try PulseAudio: pulseaudio --start"
             raise Exception(error_msg) from e
 
-    def stop_recording(self) -> str:
-        """Stop recording and return path to recorded audio file."""
+    def arm(self, preroll_seconds: float) -> None:
+        """Keep the input stream open between recordings with a pre-roll of preroll_seconds."""
+        if not SOUNDDEVICE_AVAILABLE:
+            raise Exception("sounddevice is not available. Please install it with: pip install sounddevice")
+        self._preroll_seconds = preroll_seconds
+        if self.stream is None:
+            self._open_stream()
+        elif self._preroll is None:
+            with self._callback_lock:
+                self._preroll = PcmRingBuffer.for_stream(self.rate, self.channels, preroll_seconds)
+
+    def disarm(self) -> None:
+        """Close the standing input stream; it is opened again for each recording."""
+        self._preroll_seconds = 0.0
+        with self._callback_lock:
+            self._preroll = None
+        if not self.recording:
+            self._close_stream()
+
+    def is_armed(self) -> bool:
+        return self._preroll_seconds > 0
+
+    def stop_stream(self) -> None:
+        """Stop capturing audio, keeping the buffered audio for its consumer."""
         if not self.recording:
             raise Exception("Recording is not active")
 
-        self.recording = False
+        with self._callback_lock:
+            self.recording = False
 
-        if self.stream:
-            self.stream.stop()
-            self.stream.close()
-            self.stream = None
+        if not self.is_armed():
+            self._close_stream()
 
-        try:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = temp_file.name
+    def stop_recording(
+        self,
+        encoding: AudioEncodingSettings | None = None,
+        trimming: SilenceTrimSettings | None = None,
+    ) -> tuple[BinaryIO, str] | None:
+        """Stop recording and return the recorded audio as (file, extension).
 
-            with wave.open(temp_path, "wb") as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(2)
-                wf.setframerate(self.rate)
+        The file is in memory unless the recording is large; the caller must close it.
 
-                if self.frames:
-                    audio_data = b"".join(self.frames)
-                    wf.writeframes(audio_data)
+        Args:
+            encoding: Upload encoding to apply; the spooled WAV is returned as is if omitted
+            trimming: Silence trimming to apply; if given, None is returned when there is no speech
+        """
+        self.stop_stream()
 
+        spooler, self._spooler = self._spooler, None
+        try:
+            if spooler is None:
+                raise Exception("Recording was not spooled")
+            recording = spooler.finish()
+        finally:
             self._cleanup()
-            return temp_path
 
-        except Exception:
-            self._cleanup()
-            raise
+        if encoding is None and trimming is None:
+            return recording, "wav"
+        try:
+            return transcode_recording(
+                recording, encoding or AudioEncodingSettings(audio_format="wav", sample_rate=self.rate), trimming
+            )
+        finally:
+            recording.close()
 
     def is_recording(self) -> bool:
         """Check if currently recording."""
         return self.recording
 
+    def invalidate_device_cache(self) -> None:
+        """Forget the probed device and sample rate, e.g. after audio devices changed."""
+        self._probe_signature = None
+        self.input_device_index = None
+
     def _audio_callback(self, indata, _frame_count, _time_info, status):
         """Callback function for continuous audio input stream."""
         if status:
             print(f"Audio input status: {status}")
 
-        if self.recording:
-            self.frames.append(bytes(indata))
+        with self._callback_lock:
+            if self.recording:
+                self.buffer.write(indata)
+            elif self._preroll is not None:
+                self._preroll.write(indata)
+
+    def _open_stream(self) -> None:
+        """Open and start the input stream, re-probing once if the cached configuration fails."""
+        # Rescan first so a hot-plugged or newly chosen default device changes the signature
+        self._refresh_device_list()
+        had_cached_probe = self._probe_signature is not None
+        try:
+            self._probe()
+            self._start_stream()
+        except Exception as e:
+            if not had_cached_probe:
+                raise
+            logger.info(f"Cached audio input configuration failed, probing again: {e}")
+            self.invalidate_device_cache()
+            self._probe()
+            self._start_stream()
+
+    def _start_stream(self) -> None:
+        with self._callback_lock:
+            self._preroll = (
+                PcmRingBuffer.for_stream(self.rate, self.channels, self._preroll_seconds)
+                if self._preroll_seconds > 0
+                else None
+            )
+        self.stream = sd.RawInputStream(
+            device=self.input_device_index,
+            channels=self.channels,
+            samplerate=self.rate,
+            callback=self._audio_callback,
+            dtype="int16",
+        )
+        try:
+            self.stream.start()
+        except Exception:
+            self._close_stream()
+            raise
 
-    def _cleanup(self) -> None:
-        """Clean up audio resources."""
-        self.recording = False
+    def _close_stream(self) -> None:
         if self.stream:
             try:
                 self.stream.stop()
@@ -138,7 +312,54 @@ class AudioRecorder:
             except Exception:
                 pass
             self.stream = None
-        self.frames = []
+        with self._callback_lock:
+            self._preroll = None
+
+    def _probe(self) -> None:
+        """Select the input device and sample rate, reusing the last result while the default device is unchanged."""
+        signature = self._device_signature()
+        if self._probe_signature is not None and self._probe_signature == signature:
+            return
+
+        self.input_device_index = self._find_working_input_device()
+        for rate in self.RATES_TO_TRY:
+            try:
+                sd.check_input_settings(device=self.input_device_index, channels=self.channels, samplerate=rate)
+                self.rate = rate
+                break
+            except Exception as e:
+                if rate == self.RATES_TO_TRY[-1]:
+                    raise Exception(f"Could not find working audio configuration: {e}") from e
+        self._probe_signature = signature
+
+    def _device_signature(self) -> str:
+        """Identify the default input device, to notice when it changes."""
+        try:
+            info = sd.query_devices(kind="input")
+            return f"{sd.default.device[0]}:{info['name']}:{info['hostapi']}"
+        except Exception:
+            return ""
+
+    def _refresh_device_list(self) -> None:
+        """Make PortAudio rescan devices; it only enumerates them on initialization."""
+        if self.stream is not None:
+            return
+        try:
+            sd._terminate()
+            sd._initialize()
+        except Exception as e:
+            logger.debug(f"Could not refresh audio device list: {e}")
+
+    def _cleanup(self) -> None:
+        """Clean up audio resources."""
+        with self._callback_lock:
+            self.recording = False
+        if not self.is_armed():
+            self._close_stream()
+        if self._spooler is not None:
+            self._spooler.discard()
+            self._spooler = None
+        self.buffer = None
 
     def _find_working_input_device(self) -> int | None:
         """Find a working audio input device."""
@@ -168,8 +389,138 @@ class AudioRecorder:
             return None
 
 
+@dataclass
+class SegmentationSettings:
+    """Settings for transcribing while recording, from speech_to_text_model["segmentation"]."""
+
+    enabled: bool = True
+    min_segment_seconds: float = 8.0
+    max_segment_seconds: float = 30.0
+    min_pause_ms: int = 600
+    max_concurrency: int = 2
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "SegmentationSettings":
+        data = data or {}
+        defaults = cls()
+        min_segment = max(1.0, float(data.get("min_segment_seconds", defaults.min_segment_seconds)))
+        return cls(
+            enabled=data.get("enabled", defaults.enabled),
+            min_segment_seconds=min_segment,
+            max_segment_seconds=max(min_segment, float(data.get("max_segment_seconds", defaults.max_segment_seconds))),
+            min_pause_ms=max(1, int(data.get("min_pause_ms", defaults.min_pause_ms))),
+            max_concurrency=max(1, int(data.get("max_concurrency", defaults.max_concurrency))),
+        )
+
+
+class SegmentedTranscriber:
+    """Transcribes a recording in segments while it is still in progress.
+
+    A poller collects new audio from the recorder and cuts a segment at the
+    middle of the first pause once at least min_segment_seconds are buffered,
+    or at the quietest moment once max_segment_seconds are reached. Segments
+    are trimmed of silence and dropped if they contain no speech; the rest
+    are transcribed in the background and stitched in order by finish().
+    """
+
+    POLL_INTERVAL = 0.25
+
+    def __init__(
+        self,
+        recorder: AudioRecorder,
+        transcribe: Callable[[BinaryIO, str], str],
+        settings: SegmentationSettings,
+        encoding: AudioEncodingSettings,
+        trimming: SilenceTrimSettings,
+    ):
+        self._ring = recorder.buffer
+        self._rate = recorder.rate
+        self._channels = recorder.channels
+        self._sample_rate = recorder.rate * recorder.channels
+        self._transcribe = transcribe
+        self._settings = settings
+        self._encoding = encoding
+        self._trimming = trimming
+        self._pending = bytearray()
+        self._futures: list[Future] = []
+        self._executor = ThreadPoolExecutor(max_workers=settings.max_concurrency)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def finish(self) -> str:
+        """Transcribe the remaining audio and return the full transcription.
+
+        Call after the recorder's stream has stopped. Raises the first
+        segment transcription error.
+        """
+        self._stop_poller()
+        self._collect()
+        self._submit(len(self._pending))
+        try:
+            texts = [future.result() for future in self._futures]
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        return " ".join(text.strip() for text in texts if text and text.strip())
+
+    def cancel(self) -> None:
+        """Stop without transcribing the remaining audio."""
+        self._stop_poller()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _stop_poller(self) -> None:
+        self._stop_event.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.POLL_INTERVAL):
+            self._collect()
+            self._cut_segments()
+
+    def _collect(self) -> None:
+        """Move audio captured by the stream callback into the pending buffer."""
+        self._pending += self._ring.read()
+
+    def _cut_segments(self) -> None:
+        frame_bytes = frame_length(self._sample_rate) * 2
+        cut_frame = self._find_cut()
+        while cut_frame is not None:
+            self._submit(cut_frame * frame_bytes)
+            cut_frame = self._find_cut()
+
+    def _find_cut(self) -> int | None:
+        """Return the VAD frame at which to end the next segment, or None to keep buffering."""
+        min_frames = int(self._settings.min_segment_seconds * 1000) // VAD_FRAME_MS
+        max_frames = int(self._settings.max_segment_seconds * 1000) // VAD_FRAME_MS
+        pause_frames = max(1, self._settings.min_pause_ms // VAD_FRAME_MS)
+
+        samples = pcm_to_samples(self._pending)
+        rms = frame_rms(samples, self._sample_rate)
+        if len(rms) < min_frames:
+            return None
+        mask = classify_frames(rms, frame_zcr(samples, self._sample_rate))
+        pause = find_pause(mask, pause_frames, start_frame=min_frames)
+        if pause is not None:
+            return (pause[0] + pause[1]) // 2
+        if len(rms) >= max_frames:
+            return min_frames + int(rms[min_frames:max_frames].argmin())
+        return None
+
+    def _submit(self, length: int) -> None:
+        """Submit the first length bytes of pending audio for transcription and drop them."""
+        segment = prepare_speech(bytes(self._pending[:length]), self._sample_rate, self._trimming)
+        del self._pending[:length]
+        if segment is None:
+            return
+        encoded, extension = encode_audio(segment, self._rate, self._channels, self._encoding)
+        self._futures.append(self._executor.submit(self._transcribe, io.BytesIO(encoded), f"segment.{extension}"))
+
+
 class SpeechToTextService:
-    """Minimal speech-to-text service without numpy/scipy dependencies."""
+    """Speech-to-text service that records the microphone and transcribes it."""
 
     def __init__(self, openai_service: OpenAiService):
         self.openai_service = openai_service
@@ -179,6 +530,8 @@ class SpeechToTextService:
         self.transcription_callbacks: dict[str, dict] = {}
         self.error_callback: Callable[[str], None] | None = None
         self.current_handler_name: str | None = None
+        self._segmenter: SegmentedTranscriber | None = None
+        self._arm_recorder()
 
     def set_recording_started_callback(self, callback: Callable[[], None]) -> None:
         """Set callback for when recording starts."""
@@ -241,7 +594,11 @@ class SpeechToTextService:
         """
         try:
             self.current_handler_name = handler_name
-            self.recorder.start_recording()
+            segmentation = self._get_segmentation_settings()
+            self.recorder.start_recording(spool=not segmentation.enabled)
+            self._start_segmenter(segmentation)
+            # A local model loads while the user speaks instead of after the recording stops
+            self.openai_service.prepare_transcription("speech_to_text")
             if self.recording_started_callback:
                 self.recording_started_callback()
         except Exception as e:
@@ -257,14 +614,28 @@ class SpeechToTextService:
             if not self.recorder.is_recording():
                 return
 
-            audio_file_path = self.recorder.stop_recording()
+            segmenter, self._segmenter = self._segmenter, None
+            if segmenter is not None:
+                self.recorder.stop_stream()
+
+                if self.recording_stopped_callback:
+                    self.recording_stopped_callback()
+
+                threading.Thread(
+                    target=self._finish_segmented_async,
+                    args=(segmenter, self.current_handler_name),
+                    daemon=True,
+                ).start()
+                return
+
+            recording, _ = self.recorder.stop_recording()
 
             if self.recording_stopped_callback:
                 self.recording_stopped_callback()
 
             threading.Thread(
-                target=self._transcribe_async,
-                args=(audio_file_path, self.current_handler_name),
+                target=self._transcribe_recording_async,
+                args=(recording, self.current_handler_name),
                 daemon=True,
             ).start()
 
@@ -279,26 +650,94 @@ class SpeechToTextService:
         """Check if currently recording."""
         return self.recorder.is_recording()
 
-    def _transcribe_async(self, audio_file_path: str, handler_name: str | None = None) -> None:
-        """Transcribe audio file asynchronously."""
+    def _get_speech_model_config(self) -> dict[str, Any]:
+        try:
+            return self.openai_service.get_model_config("speech_to_text")
+        except ConfigurationError:
+            return {}
+
+    def _get_segmentation_settings(self) -> SegmentationSettings:
+        return SegmentationSettings.from_dict(self._get_speech_model_config().get("segmentation"))
+
+    def _get_encoding_settings(self) -> AudioEncodingSettings:
+        return AudioEncodingSettings.from_dict(self._get_speech_model_config())
+
+    def _get_trimming_settings(self) -> SilenceTrimSettings:
+        return SilenceTrimSettings.from_dict(self._get_speech_model_config().get("silence_trimming"))
+
+    def _arm_recorder(self) -> None:
+        """Keep the microphone open with a pre-roll buffer if speech_to_text_model["preroll_ms"] is set."""
+        preroll_ms = int(self._get_speech_model_config().get("preroll_ms") or 0)
+        if preroll_ms <= 0 or not SOUNDDEVICE_AVAILABLE:
+            return
+        try:
+            self.recorder.arm(preroll_ms / 1000)
+        except Exception as e:
+            logger.warning(f"Could not keep audio input open for pre-roll: {e}")
+
+    def _start_segmenter(self, settings: SegmentationSettings) -> None:
+        """Begin transcribing segments in the background while recording, if enabled."""
+        if not settings.enabled:
+            self._segmenter = None
+            return
+        self._segmenter = SegmentedTranscriber(
+            self.recorder,
+            lambda audio_file, filename: self.openai_service.transcribe_audio(
+                audio_file, "speech_to_text", filename=filename
+            ),
+            settings,
+            self._get_encoding_settings(),
+            self._get_trimming_settings(),
+        )
+        self._segmenter.start()
+
+    def _finish_segmented_async(self, segmenter: SegmentedTranscriber, handler_name: str | None = None) -> None:
+        """Wait for the remaining segments and deliver the stitched transcription."""
         try:
             start_time = time.time()
-            transcription = self.openai_service.transcribe_audio_file(audio_file_path, "speech_to_text")
+            transcription = segmenter.finish()
             transcription_duration = time.time() - start_time
 
-            with contextlib.suppress(Exception):
-                os.unlink(audio_file_path)
+            self._execute_transcription_callbacks(transcription, transcription_duration, handler_name)
 
-            if transcription:
-                self._execute_transcription_callbacks(transcription, transcription_duration, handler_name)
+        except Exception as e:
+            error_msg = f"Transcription failed: {e}"
+            if self.error_callback:
+                self.error_callback(error_msg)
 
+    def _transcribe_recording_async(self, recording: BinaryIO, handler_name: str | None = None) -> None:
+        """Prepare a whole recording for upload and transcribe it, skipping the request if there is no speech."""
+        try:
+            prepared = transcode_recording(recording, self._get_encoding_settings(), self._get_trimming_settings())
         except Exception as e:
-            with contextlib.suppress(Exception):
-                os.unlink(audio_file_path)
+            if self.error_callback:
+                self.error_callback(f"Failed to process recording: {e}")
+            return
+        finally:
+            recording.close()
+
+        if prepared is None:
+            self._execute_transcription_callbacks("", 0.0, handler_name)
+            return
+
+        audio_file, extension = prepared
+        self._transcribe_async(audio_file, f"recording.{extension}", handler_name)
 
+    def _transcribe_async(self, audio_file: BinaryIO, filename: str, handler_name: str | None = None) -> None:
+        """Upload an in-memory (or spilled) audio file and deliver the transcription."""
+        try:
+            start_time = time.time()
+            transcription = self.openai_service.transcribe_audio(audio_file, "speech_to_text", filename=filename)
+            transcription_duration = time.time() - start_time
+
+            self._execute_transcription_callbacks(transcription, transcription_duration, handler_name)
+
+        except Exception as e:
             error_msg = f"Transcription failed: {e}"
             if self.error_callback:
                 self.error_callback(error_msg)
+        finally:
+            audio_file.close()
 
     def _execute_transcription_callbacks(
         self,
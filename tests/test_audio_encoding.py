@@ -0,0 +1,43 @@
+import numpy as np
+
+from modules.utils.audio_encoding import Resampler, resample
+
+
+def _tone(rate: int, seconds: float, frequency: float) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return (8000 * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+
+
+def _rms(samples: np.ndarray) -> float:
+    # Skip the filter's edge transients
+    return float(np.sqrt(np.mean(samples[200:-200].astype(np.float64) ** 2)))
+
+
+def test_resample_to_16k_keeps_duration():
+    resampled = resample(_tone(48000, 1.0, 440), 48000, 16000)
+
+    assert abs(len(resampled) - 16000) <= 1
+
+
+def test_streaming_resampler_matches_whole_recording():
+    samples = _tone(44100, 0.5, 300)
+    resampler = Resampler(44100, 16000)
+
+    blocks = [resampler.process(block) for block in np.array_split(samples, 7)]
+    streamed = np.concatenate([*blocks, resampler.flush()])
+
+    assert np.array_equal(streamed, resample(samples, 44100, 16000))
+
+
+def test_resampling_removes_content_above_target_nyquist():
+    speech_band = resample(_tone(48000, 1.0, 440), 48000, 16000)
+    above_nyquist = resample(_tone(48000, 1.0, 12000), 48000, 16000)
+
+    assert _rms(speech_band) > 5000
+    assert _rms(above_nyquist) < 500
+
+
+def test_same_rate_is_passed_through():
+    samples = _tone(16000, 0.1, 440)
+
+    assert np.array_equal(resample(samples, 16000, 16000), samples)
@@ -0,0 +1,72 @@
+import numpy as np
+
+from modules.utils.audio_processing import classify_frames, frame_length, trim_silence
+
+RATE = 16000
+FRAME = frame_length(RATE)
+
+
+def _tone(frames: int) -> np.ndarray:
+    t = np.arange(frames * FRAME) / RATE
+    return (5000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+
+
+def _silence(frames: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0, 20, frames * FRAME).astype(np.int16)
+
+
+def test_silence_only_is_dropped():
+    assert trim_silence(_silence(100), RATE, max_pause_ms=600, padding_ms=0) is None
+
+
+def test_too_little_speech_is_dropped():
+    samples = np.concatenate([_silence(50), _tone(2), _silence(50, seed=1)])
+
+    assert trim_silence(samples, RATE, max_pause_ms=600, padding_ms=0) is None
+
+
+def test_leading_and_trailing_silence_are_trimmed():
+    speech = _tone(30)
+    samples = np.concatenate([_silence(40), speech, _silence(40, seed=1)])
+
+    trimmed = trim_silence(samples, RATE, max_pause_ms=600, padding_ms=0)
+
+    assert np.array_equal(trimmed, speech)
+
+
+def test_padding_is_kept_around_speech():
+    samples = np.concatenate([_silence(40), _tone(30), _silence(40, seed=1)])
+
+    trimmed = trim_silence(samples, RATE, max_pause_ms=600, padding_ms=90)
+
+    assert len(trimmed) == (30 + 2 * 3) * FRAME
+
+
+def test_long_pause_is_shortened_to_max_pause():
+    first, second = _tone(20), _tone(20)
+    samples = np.concatenate([first, _silence(100), second])
+
+    trimmed = trim_silence(samples, RATE, max_pause_ms=600, padding_ms=0)
+
+    assert len(trimmed) == (20 + 20 + 20) * FRAME
+    assert np.array_equal(trimmed[: 20 * FRAME], first)
+    assert np.array_equal(trimmed[-20 * FRAME :], second)
+
+
+def test_short_pause_is_kept_intact():
+    samples = np.concatenate([_tone(20), _silence(10), _tone(20)])
+
+    trimmed = trim_silence(samples, RATE, max_pause_ms=600, padding_ms=0)
+
+    assert np.array_equal(trimmed, samples)
+
+
+def test_quiet_frames_with_many_zero_crossings_count_as_speech():
+    rms = np.array([20.0] * 10 + [3000.0] * 10 + [150.0, 150.0])
+    zcr = np.array([0.5] * 10 + [0.05] * 10 + [0.6, 0.05])
+
+    mask = classify_frames(rms, zcr)
+
+    assert not mask[:10].any()
+    assert mask[10:20].all()
+    assert mask[20] and not mask[21]
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from modules.utils import speech_to_text
+from modules.utils.speech_to_text import AudioRecorder
+
+
+class FakeSoundDevice:
+    """PortAudio stand-in that, like the real one, only sees device changes after reinitializing."""
+
+    def __init__(self):
+        self.connected = [{"name": "Built-in Microphone", "hostapi": 0, "max_input_channels": 1}]
+        self.devices = list(self.connected)
+        self.default = SimpleNamespace(device=[0, None])
+        self.RawInputStream = Mock()
+
+    def plug_in(self, name: str) -> None:
+        self.connected.append({"name": name, "hostapi": 0, "max_input_channels": 1})
+
+    def _terminate(self):
+        self.devices = []
+
+    def _initialize(self):
+        # A newly connected device becomes the default input
+        self.devices = list(self.connected)
+        self.default.device = [len(self.devices) - 1, None]
+
+    def query_devices(self, device=None, kind=None):
+        if kind == "input":
+            device = self.default.device[0]
+        return self.devices if device is None else self.devices[device]
+
+    def check_input_settings(self, **kwargs):
+        pass
+
+
+@pytest.fixture
+def sd(monkeypatch):
+    fake = FakeSoundDevice()
+    monkeypatch.setattr(speech_to_text, "sd", fake, raising=False)
+    monkeypatch.setattr(speech_to_text, "SOUNDDEVICE_AVAILABLE", True)
+    return fake
+
+
+def test_device_plugged_in_between_recordings_is_used(sd):
+    recorder = AudioRecorder()
+    recorder.start_recording(spool=False)
+    recorder.stop_stream()
+
+    sd.plug_in("USB Headset")
+    recorder.start_recording(spool=False)
+
+    assert recorder.input_device_index == 1
+    assert sd.RawInputStream.call_args.kwargs["device"] == 1
+
+
+def test_device_plugged_in_while_armed_is_used_after_disarm(sd):
+    recorder = AudioRecorder()
+    recorder.arm(0.5)
+
+    sd.plug_in("USB Headset")
+    recorder.start_recording(spool=False)
+    recorder.stop_stream()
+    assert recorder.input_device_index == 0
+
+    recorder.disarm()
+    recorder.start_recording(spool=False)
+
+    assert recorder.input_device_index == 1
@@ -0,0 +1,59 @@
+from unittest.mock import Mock
+
+import pytest
+from PySide6.QtCore import QMimeData
+
+from app.application import PromtheusApp
+from modules.utils.clipboard_history import ClipboardHistory, is_concealed
+from modules.utils.clipboard_image import ClipboardImageEncoder
+from modules.utils.clipboard_monitor import ClipboardSnapshot
+
+
+def _snapshot(mime_types: tuple[str, ...], text: str = "secret", has_image: bool = False) -> ClipboardSnapshot:
+    return ClipboardSnapshot(version=1, text=text, mime_types=mime_types, has_image=has_image, captured_at=0.0)
+
+
+def _fake_app(snapshot: ClipboardSnapshot) -> Mock:
+    app = Mock()
+    app.clipboard_monitor.get_snapshot.return_value = snapshot
+    app.clipboard_history = ClipboardHistory()
+    return app
+
+
+@pytest.mark.parametrize(
+    "mime_types",
+    [
+        ("text/plain", "x-kde-passwordManagerHint"),
+        ("text/plain", "application/x-nspasteboard-concealed-type"),
+        ("text/plain", 'application/x-qt-windows-mime;value="ExcludeClipboardContentFromMonitorProcessing"'),
+    ],
+)
+def test_concealed_clipboard_content_is_not_recorded(mime_types):
+    app = _fake_app(_snapshot(mime_types))
+
+    assert is_concealed(mime_types)
+    PromtheusApp._record_clipboard_clip(app)
+
+    assert len(app.clipboard_history) == 0
+
+
+def test_plain_text_clipboard_content_is_recorded():
+    app = _fake_app(_snapshot(("text/plain",), text="hello"))
+
+    assert not is_concealed(("text/plain",))
+    PromtheusApp._record_clipboard_clip(app)
+
+    assert [clip.text for clip in app.clipboard_history.get_clips()] == ["hello"]
+
+
+def test_captured_image_bytes_are_stored_without_base64(qapp):
+    mime_data = QMimeData()
+    mime_data.setData("image/png", b"\x89PNG raw bytes")
+    qapp.clipboard().setMimeData(mime_data)
+    history = ClipboardHistory()
+
+    assert ClipboardImageEncoder().capture_bytes(qapp.clipboard(), lambda data: history.add_image(*data))
+
+    (clip,) = history.get_clips()
+    assert clip.image == b"\x89PNG raw bytes"
+    assert clip.media_type == "image/png"
@@ -0,0 +1,74 @@
+import threading
+import time
+
+from PySide6.QtCore import QMimeData, QThread
+from PySide6.QtGui import QImage
+
+from modules.utils import clipboard_image
+from modules.utils.clipboard_image import ClipboardImageEncoder, get_clipboard_image_encoder
+
+
+def _wait_for(qapp, predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+    return predicate()
+
+
+def _capture_from_thread(qapp, make_encoder) -> tuple[list, list]:
+    results = []
+    callback_threads = []
+    encoders = []
+
+    def callback(result):
+        results.append(result)
+        callback_threads.append(QThread.currentThread())
+
+    def run():
+        encoders.append(make_encoder())
+        encoders[0].capture(qapp.clipboard(), callback)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    worker.join()
+    assert _wait_for(qapp, lambda: bool(results))
+    return results, callback_threads
+
+
+def test_bitmap_capture_from_plain_thread_is_delivered_on_gui_thread(qapp, monkeypatch):
+    monkeypatch.setattr(clipboard_image, "_encoder", None)
+    image = QImage(8, 8, QImage.Format_RGB32)
+    image.fill(0xFF0000)
+    qapp.clipboard().setImage(image)
+
+    # The shared encoder is created lazily by the first caller, here a thread without an event loop
+    results, callback_threads = _capture_from_thread(qapp, get_clipboard_image_encoder)
+
+    assert clipboard_image._encoder.thread() == qapp.thread()
+    data, media_type = results[0]
+    assert media_type == "image/png"
+    assert data
+    assert callback_threads[0] == qapp.thread()
+
+
+def test_raw_capture_from_plain_thread_is_delivered_on_gui_thread(qapp):
+    mime_data = QMimeData()
+    mime_data.setData("image/png", b"\x89PNG raw bytes")
+    qapp.clipboard().setMimeData(mime_data)
+
+    results, callback_threads = _capture_from_thread(qapp, ClipboardImageEncoder)
+
+    assert results[0][1] == "image/png"
+    assert callback_threads[0] == qapp.thread()
+
+
+def test_raw_capture_on_gui_thread_is_delivered_immediately(qapp):
+    mime_data = QMimeData()
+    mime_data.setData("image/jpeg", b"jpeg bytes")
+    qapp.clipboard().setMimeData(mime_data)
+    results = []
+
+    assert ClipboardImageEncoder().capture(qapp.clipboard(), results.append)
+
+    assert results and results[0][1] == "image/jpeg"
@@ -0,0 +1,75 @@
+import pytest
+
+from core.exceptions import ConfigurationError
+from modules.utils.config import DEFAULT_MENU_SECTION_ORDER, AppConfig, ConfigService, validate_config
+
+
+def _make_config(speech_to_text_model: dict) -> AppConfig:
+    models = [
+        {
+            "id": "gpt-4o",
+            "model": "gpt-4o",
+            "display_name": "GPT-4o",
+            "api_key_env": "OPENAI_API_KEY",
+        }
+    ]
+    return AppConfig(models=models, speech_to_text_model=speech_to_text_model)
+
+
+def test_openai_speech_model_is_valid():
+    config = _make_config(
+        {
+            "model": "gpt-4o-transcribe",
+            "display_name": "gpt-4o-transcribe",
+            "api_key_env": "OPENAI_API_KEY",
+            "base_url": "https://api.openai.com/v1",
+        }
+    )
+
+    validate_config(config)
+
+
+def test_openai_speech_model_requires_api_key_env():
+    config = _make_config({"model": "gpt-4o-transcribe", "display_name": "gpt-4o-transcribe"})
+
+    with pytest.raises(ConfigurationError, match="api_key_env"):
+        validate_config(config)
+
+
+def test_explicit_openai_backend_requires_api_key_env():
+    config = _make_config({"backend": "openai", "model": "whisper-1", "display_name": "Whisper"})
+
+    with pytest.raises(ConfigurationError, match="api_key_env"):
+        validate_config(config)
+
+
+def test_local_speech_model_from_readme_is_valid():
+    config = _make_config(
+        {
+            "backend": "local",
+            "model": "base.en",
+            "display_name": "Whisper base (local)",
+            "compute_type": "int8",
+            "cpu_threads": 4,
+            "language": "en",
+        }
+    )
+
+    validate_config(config)
+
+
+def test_local_speech_model_still_requires_model():
+    config = _make_config({"backend": "local", "display_name": "Whisper base (local)"})
+
+    with pytest.raises(ConfigurationError, match="model"):
+        validate_config(config)
+
+
+def test_saved_menu_order_gets_new_sections_appended(monkeypatch):
+    service = ConfigService()
+    saved_order = [section for section in DEFAULT_MENU_SECTION_ORDER if section != "ClipboardHistoryMenuProvider"]
+    monkeypatch.setattr(service, "_settings_data", {"menu_section_order": saved_order[::-1]})
+
+    order = service.get_menu_section_order()
+
+    assert order == [*saved_order[::-1], "ClipboardHistoryMenuProvider"]
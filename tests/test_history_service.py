@@ -0,0 +1,99 @@
+import pytest
+
+from core.models import ConversationHistoryData, HistoryEntry, HistoryEntryType
+from modules.history import image_storage
+from modules.history.history_service import HistoryService
+
+
+@pytest.fixture
+def temp_images_dir(tmp_path, monkeypatch):
+    images_dir = tmp_path / "temp_images"
+    monkeypatch.setattr(image_storage, "get_temp_images_dir", lambda: images_dir)
+    return images_dir
+
+
+def _make_entry(entry_id: str, timestamp: str, image_path: str | None = None) -> HistoryEntry:
+    conversation_data = None
+    if image_path:
+        conversation_data = ConversationHistoryData(context_text="", context_image_paths=[image_path])
+    return HistoryEntry(
+        id=entry_id,
+        timestamp=timestamp,
+        input_content=f"input {entry_id}",
+        entry_type=HistoryEntryType.TEXT,
+        output_content=f"output {entry_id}",
+        conversation_data=conversation_data,
+        created_at=timestamp,
+    )
+
+
+def _export_archive(tmp_path, entries: list[HistoryEntry], inline_images: bool = True):
+    archive_path = tmp_path / "history.jsonl"
+    source = HistoryService()
+    source.add_entries(entries)
+    source.export_jsonl(archive_path, inline_images)
+    return archive_path
+
+
+def _make_image(tmp_path, name: str) -> str:
+    path = tmp_path / f"{name}.png"
+    path.write_bytes(b"\x89PNG" + name.encode())
+    return str(path)
+
+
+def _full_store() -> HistoryService:
+    service = HistoryService(max_entries=4, hot_entries=2)
+    service.add_entries([_make_entry(f"new{i}", f"2025-01-01 10:00:0{i}") for i in range(4)])
+    return service
+
+
+def test_add_entries_merges_older_entries_by_timestamp():
+    service = HistoryService(max_entries=10, hot_entries=2)
+    service.add_entries([_make_entry("b", "2025-01-01 10:00:02"), _make_entry("d", "2025-01-01 10:00:04")])
+
+    service.add_entries([_make_entry("c", "2025-01-01 10:00:03"), _make_entry("a", "2025-01-01 10:00:01")])
+
+    assert [entry.id for entry in service.iter_entries()] == ["a", "b", "c", "d"]
+    assert service.get_last_item_by_type(HistoryEntryType.TEXT).id == "d"
+
+
+def test_import_older_entries_into_full_store_keeps_newest(tmp_path, temp_images_dir):
+    old_entries = [_make_entry(f"old{i}", f"2024-01-01 10:00:0{i}", _make_image(tmp_path, f"old{i}")) for i in range(3)]
+    archive_path = _export_archive(tmp_path, old_entries)
+    service = _full_store()
+
+    assert service.import_jsonl(archive_path) == 3
+
+    assert [entry.id for entry in service.iter_entries()] == ["new0", "new1", "new2", "new3"]
+    assert service.get_last_item_by_type(HistoryEntryType.TEXT).id == "new3"
+    # Images of entries evicted in the same batch are never written
+    assert not temp_images_dir.exists() or not any(temp_images_dir.iterdir())
+
+
+@pytest.mark.parametrize("inline_images", [True, False])
+def test_import_into_full_store_writes_images_of_kept_entries_only(tmp_path, temp_images_dir, inline_images):
+    entries = [
+        _make_entry("old", "2024-01-01 10:00:00", _make_image(tmp_path, "old")),
+        _make_entry("newest", "2026-01-01 10:00:00", _make_image(tmp_path, "newest")),
+    ]
+    archive_path = _export_archive(tmp_path, entries, inline_images)
+    service = _full_store()
+
+    service.import_jsonl(archive_path)
+
+    assert [entry.id for entry in service.iter_entries()] == ["new1", "new2", "new3", "newest"]
+    newest = service.get_last_item_by_type(HistoryEntryType.TEXT)
+    assert newest.id == "newest"
+    (image_path,) = newest.conversation_data.context_image_paths
+    assert image_storage.load_image(image_path) is not None
+    assert list(temp_images_dir.iterdir()) == [temp_images_dir / image_path.rsplit("/", 1)[-1]]
+
+
+def test_import_twice_does_not_duplicate_entries(tmp_path, temp_images_dir):
+    archive_path = _export_archive(tmp_path, [_make_entry("a", "2025-01-01 10:00:00")])
+    service = HistoryService()
+
+    service.import_jsonl(archive_path)
+    service.import_jsonl(archive_path)
+
+    assert [entry.id for entry in service.iter_entries()] == ["a"]
@@ -0,0 +1,151 @@
+import random
+
+import pytest
+
+from core.models import ConversationHistoryData, HistoryEntry, HistoryEntryType, SerializedConversationTurn
+from modules.history import history_service, history_storage
+from modules.history.history_service import HistoryService
+from modules.history.history_storage import (
+    CODEC_RAW,
+    CODEC_ZLIB,
+    CODEC_ZSTD,
+    estimate_entry_size,
+    freeze_entry,
+    thaw_entry,
+)
+
+
+def _make_entry(entry_id: str, text: str = "text", seconds: int = 0) -> HistoryEntry:
+    timestamp = f"2025-01-01 10:{seconds // 60:02d}:{seconds % 60:02d}"
+    return HistoryEntry(
+        id=entry_id,
+        timestamp=timestamp,
+        input_content=text,
+        entry_type=HistoryEntryType.TEXT,
+        output_content=text,
+        created_at=timestamp,
+    )
+
+
+def _make_conversation_entry() -> HistoryEntry:
+    entry = _make_entry("conv", "summary")
+    entry.is_conversation = True
+    entry.conversation_data = ConversationHistoryData(
+        context_text="context " * 1000,
+        context_image_paths=["/tmp/a.png"],
+        turns=[
+            SerializedConversationTurn(
+                turn_number=1,
+                message_text="question",
+                message_image_paths=[],
+                output_text="answer",
+                is_complete=True,
+                output_versions=["first answer", "answer"],
+                current_version_index=1,
+            )
+        ],
+        prompt_id="prompt",
+    )
+    return entry
+
+
+def test_small_entry_is_frozen_uncompressed():
+    entry = _make_entry("a", "short")
+
+    cold = freeze_entry(entry, threshold=4096)
+
+    assert cold.codec == CODEC_RAW
+    assert thaw_entry(cold) == entry
+
+
+def test_large_entry_is_compressed_and_round_trips():
+    entry = _make_conversation_entry()
+
+    cold = freeze_entry(entry, threshold=1024)
+
+    assert cold.codec in (CODEC_ZLIB, CODEC_ZSTD)
+    assert cold.size < estimate_entry_size(entry)
+    assert thaw_entry(cold) == entry
+
+
+def test_zlib_is_used_without_zstd(monkeypatch):
+    monkeypatch.setattr(history_storage, "ZSTD_AVAILABLE", False)
+    entry = _make_conversation_entry()
+
+    cold = freeze_entry(entry, threshold=1024)
+
+    assert cold.codec == CODEC_ZLIB
+    assert thaw_entry(cold) == entry
+
+
+def test_only_recent_entries_stay_hot():
+    service = HistoryService(max_entries=10, hot_entries=2)
+    service.add_entries([_make_entry(str(i), seconds=i) for i in range(5)])
+
+    usage = service.get_memory_usage()
+
+    assert usage["hot_entries"] == 2
+    assert usage["cold_entries"] == 3
+    assert [entry.id for entry in service.get_history()] == ["4", "3", "2", "1", "0"]
+    assert service.get_entry_by_id("0") == _make_entry("0", seconds=0)
+
+
+def test_promoted_cold_entry_becomes_hot_and_mutable():
+    service = HistoryService(max_entries=10, hot_entries=2)
+    service.add_entries([_make_entry(str(i), seconds=i) for i in range(5)])
+
+    entry = service._promote_entry("1")
+    entry.output_content = "edited"
+
+    assert service.get_entry_by_id("1").output_content == "edited"
+    assert service.get_memory_usage()["cold_entries"] == 2
+
+
+def test_count_limit_evicts_oldest_entries():
+    service = HistoryService(max_entries=3, hot_entries=1)
+
+    service.add_entries([_make_entry(str(i), seconds=i) for i in range(5)])
+
+    assert [entry.id for entry in service.iter_entries()] == ["2", "3", "4"]
+
+
+@pytest.mark.parametrize("compression_threshold", [10**9, 0])
+def test_byte_budget_evicts_oldest_entries(compression_threshold):
+    service = HistoryService(
+        max_entries=100, max_bytes=3000, hot_entries=1, compression_threshold=compression_threshold
+    )
+    # Random text so the budget is exceeded even when cold entries are compressed
+    entries = [_make_entry(str(i), text=random.Random(i).randbytes(400).hex(), seconds=i) for i in range(10)]
+
+    service.add_entries(entries)
+
+    usage = service.get_memory_usage()
+    assert usage["total_bytes"] <= 3000
+    ids = [entry.id for entry in service.iter_entries()]
+    assert 1 <= len(ids) < 10
+    assert ids == [str(i) for i in range(10 - len(ids), 10)]
+
+
+def test_byte_budget_always_keeps_newest_entry():
+    service = HistoryService(max_bytes=10, hot_entries=1)
+
+    service.add_entries([_make_entry("old", "x" * 100), _make_entry("new", "y" * 100, seconds=1)])
+
+    assert [entry.id for entry in service.iter_entries()] == ["new"]
+
+
+def test_cold_entries_are_thawed_once_until_the_cold_tier_changes(monkeypatch):
+    service = HistoryService(max_entries=10, hot_entries=2)
+    service.add_entries([_make_entry(str(i), seconds=i) for i in range(5)])
+    thawed = []
+    monkeypatch.setattr(history_service, "thaw_entry", lambda cold: thawed.append(cold.id) or thaw_entry(cold))
+
+    service.get_history()
+    service.get_history()
+    assert sorted(thawed) == ["0", "1", "2"]
+
+    thawed.clear()
+    service.add_entries([_make_entry("5", seconds=5)])
+
+    assert [entry.id for entry in service.get_history()] == ["5", "4", "3", "2", "1", "0"]
+    assert sorted(thawed) == ["0", "1", "2", "3"]
@@ -0,0 +1,156 @@
+from unittest.mock import Mock
+
+import pytest
+
+from modules.prompts import async_execution
+from modules.prompts.async_execution import _CHUNK_TOKEN, PromptExecutionWorker, _chunk_instructions
+from modules.prompts.map_reduce import (
+    CHARS_PER_TOKEN,
+    DEFAULT_REDUCE_PROMPT,
+    MapReduceSettings,
+    format_reduce_prompt,
+    group_partials,
+    split_text,
+)
+
+
+def _make_worker(monkeypatch, map_reduce_settings: dict | None, clipboard: str = "", context: str = ""):
+    config_service = Mock()
+    config_service.get_settings_data.return_value = {"map_reduce": map_reduce_settings}
+    monkeypatch.setattr(async_execution, "ConfigService", lambda: config_service)
+
+    clipboard_manager = Mock()
+    clipboard_manager.get_content.return_value = clipboard
+    context_manager = Mock()
+    context_manager.get_context_or_default.return_value = context
+    worker = PromptExecutionWorker(Mock(), clipboard_manager, Mock(), Mock(), Mock(), context_manager)
+    worker.item = Mock(data={})
+    return worker
+
+
+def _words(tokens: int) -> str:
+    return ("word " * (tokens * CHARS_PER_TOKEN // 5)).strip()
+
+
+def test_split_text_packs_whole_paragraphs():
+    paragraphs = [_words(30) for _ in range(6)]
+
+    chunks = split_text("\n\n".join(paragraphs), chunk_tokens=70)
+
+    assert len(chunks) == 3
+    assert all(chunk == "\n\n".join(paragraphs[:2]) for chunk in chunks)
+
+
+def test_split_text_breaks_oversized_paragraphs_within_budget():
+    text = "First sentence here. " * 200
+
+    chunks = split_text(text, chunk_tokens=50)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 50 * CHARS_PER_TOKEN for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_split_text_hard_splits_text_without_spaces():
+    chunks = split_text("x" * 1000, chunk_tokens=100)
+
+    assert [len(chunk) for chunk in chunks] == [400, 400, 200]
+
+
+def test_split_text_keeps_small_input_in_one_chunk():
+    assert split_text("one\n\ntwo", chunk_tokens=100) == ["one\n\ntwo"]
+
+
+def test_group_partials_keeps_order_within_budget():
+    partials = ["a" * 40, "b" * 40, "c" * 40, "d" * 80]
+
+    groups = group_partials(partials, chunk_tokens=20)
+
+    assert groups == [["a" * 40, "b" * 40], ["c" * 40], ["d" * 80]]
+
+
+def test_group_partials_puts_oversized_partial_in_its_own_group():
+    groups = group_partials(["a" * 400, "b" * 4], chunk_tokens=10)
+
+    assert groups == [["a" * 400], ["b" * 4]]
+
+
+def test_map_reduce_is_disabled_by_default():
+    assert MapReduceSettings().enabled is False
+    assert MapReduceSettings.from_dict(None).enabled is False
+
+
+@pytest.mark.parametrize(
+    ("tokens", "expected"),
+    [(100, False), (101, True)],
+)
+def test_plan_map_reduce_threshold(monkeypatch, tokens, expected):
+    text = "x" * (tokens * CHARS_PER_TOKEN)
+    worker = _make_worker(monkeypatch, {"enabled": True, "threshold_tokens": 100}, clipboard=text)
+
+    plan = worker._plan_map_reduce([{"role": "user", "content": "Summarize {{clipboard}}"}])
+
+    assert (plan is not None) is expected
+    if expected:
+        assert plan[:2] == ("clipboard", text)
+
+
+def test_plan_map_reduce_picks_largest_placeholder(monkeypatch):
+    worker = _make_worker(monkeypatch, {"enabled": True, "threshold_tokens": 10}, clipboard="c" * 80, context="x" * 200)
+
+    plan = worker._plan_map_reduce([{"role": "user", "content": "{{clipboard}} and {{context}}"}])
+
+    assert plan[:2] == ("context", "x" * 200)
+
+
+def test_plan_map_reduce_needs_opt_in_and_placeholder(monkeypatch):
+    large = "x" * 100_000
+    messages = [{"role": "user", "content": "Summarize {{clipboard}}"}]
+
+    assert _make_worker(monkeypatch, None, clipboard=large)._plan_map_reduce(messages) is None
+    worker = _make_worker(monkeypatch, {"enabled": True, "threshold_tokens": 10}, clipboard=large)
+    assert worker._plan_map_reduce([{"role": "user", "content": "No input here"}]) is None
+
+
+def test_chunk_instructions_keep_user_text_around_the_input():
+    messages = [
+        {"role": "system", "content": "You are a translator."},
+        {"role": "user", "content": f"Translate to French, keep the markdown:\n\n{_CHUNK_TOKEN}\n\nNo notes."},
+    ]
+
+    instructions = _chunk_instructions(messages)
+
+    assert instructions == "Translate to French, keep the markdown:\n\n\n\nNo notes."
+    assert _CHUNK_TOKEN not in instructions
+
+
+def test_chunk_instructions_ignore_messages_without_the_input():
+    messages = [
+        {"role": "user", "content": "Earlier question"},
+        {"role": "assistant", "content": f"Quoted {_CHUNK_TOKEN}"},
+        {"role": "user", "content": [{"type": "text", "text": f"Summarize: {_CHUNK_TOKEN}"}]},
+    ]
+
+    assert _chunk_instructions(messages) == "Summarize:"
+
+
+def test_default_reduce_prompt_includes_instructions_and_partials():
+    prompt = format_reduce_prompt(DEFAULT_REDUCE_PROMPT, "Translate to French.", ["un", "deux"])
+
+    assert "<instructions>\nTranslate to French.\n</instructions>" in prompt
+    assert prompt.index("</instructions>") < prompt.index('<section index="1">\nun\n</section>')
+    assert '<section index="2">\ndeux\n</section>' in prompt
+    assert "{{" not in prompt
+
+
+def test_custom_reduce_prompt_without_placeholder_gets_instructions_prepended():
+    prompt = format_reduce_prompt("Merge these:\n{{partials}}", "Summarize.", ["a"])
+
+    assert prompt.startswith("<instructions>\nSummarize.\n</instructions>\n\nMerge these:")
+
+
+def test_reduce_prompt_without_instructions_has_no_empty_block():
+    prompt = format_reduce_prompt(DEFAULT_REDUCE_PROMPT, "", ["a"])
+
+    assert "<instructions>" not in prompt
+    assert "{{instructions}}" not in prompt
@@ -0,0 +1,89 @@
+import pytest
+
+from core.models import PromptData
+from modules.prompts.prompt_search import PromptSearchIndex
+
+PROMPTS = [
+    PromptData(id="summary", name="Summarize Text", content="", tags=["writing"], description="Short summary"),
+    PromptData(id="translate", name="Translate to French", content="", tags=["language"]),
+    PromptData(id="review", name="Code Review", content="", tags=["code"], description="Review a diff"),
+    PromptData(id="explain", name="Explain Code", content="", tags=["code"], description="Step by step"),
+    PromptData(id="fix", name="Fix Grammar", content="", tags=["writing"], description="Spelling and grammar"),
+    PromptData(id="summary-long", name="Long Summary of Meetings", content="", tags=["notes"]),
+    PromptData(id="sql", name="Write SQL Query", content="", tags=["code", "database"]),
+]
+
+
+def _ids(matches) -> list[str]:
+    return [match.prompt_id for match in matches]
+
+
+def test_name_prefix_ranks_above_word_start_and_other_tiers():
+    index = PromptSearchIndex(PROMPTS)
+
+    matches = index.search("sum")
+
+    assert _ids(matches)[:2] == ["summary", "summary-long"]
+    assert matches[0].score > matches[1].score
+
+
+def test_all_words_match_across_name_tags_and_description():
+    index = PromptSearchIndex(PROMPTS)
+
+    assert _ids(index.search("code diff")) == ["review"]
+
+
+def test_subsequence_matches_abbreviations():
+    index = PromptSearchIndex(PROMPTS)
+
+    assert _ids(index.search("smry")) == ["summary-long"]
+
+
+def test_fuzzy_match_tolerates_typos():
+    index = PromptSearchIndex(PROMPTS)
+
+    assert "translate" in _ids(index.search("tranzlate"))
+
+
+def test_empty_query_matches_nothing():
+    index = PromptSearchIndex(PROMPTS)
+
+    assert index.search("   ") == []
+
+
+@pytest.mark.parametrize("word", ["summary", "code review", "tranzlate", "wr sql", "explian"])
+def test_extending_query_matches_fresh_search(word):
+    incremental = PromptSearchIndex(PROMPTS)
+
+    for length in range(1, len(word) + 1):
+        query = word[:length]
+        assert incremental.search(query) == PromptSearchIndex(PROMPTS).search(query), query
+
+
+class _RecordingList(list):
+    def __init__(self, items):
+        super().__init__(items)
+        self.accessed = set()
+
+    def __getitem__(self, index):
+        self.accessed.add(index)
+        return super().__getitem__(index)
+
+
+def test_extending_query_only_rechecks_previous_matches_and_trigram_candidates():
+    index = PromptSearchIndex(PROMPTS)
+    index.search("code")
+    index._names = _RecordingList(index._names)
+
+    assert _ids(index.search("code r")) == ["review", "sql"]
+
+    code_prompts = {i for i, prompt in enumerate(PROMPTS) if "code" in prompt.tags}
+    assert index._names.accessed <= code_prompts
+
+
+def test_query_that_does_not_extend_previous_one_searches_everything():
+    index = PromptSearchIndex(PROMPTS)
+    index.search("code")
+
+    assert _ids(index.search("grammar")) == ["fix"]
+    assert _ids(index.search("summ")) == ["summary", "summary-long"]
@@ -0,0 +1,36 @@
+from unittest.mock import Mock
+
+import pytest
+
+from core import speech_backends
+from core.speech_backends import LocalSpeechSettings, LocalWhisperBackend
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(speech_backends, "FASTER_WHISPER_AVAILABLE", True)
+    return LocalWhisperBackend(LocalSpeechSettings.from_dict({"model": "base.en"}))
+
+
+def test_close_stops_idle_worker(backend):
+    process, conn = Mock(), Mock()
+    process.is_alive.side_effect = [True, False]
+    backend._process, backend._conn = process, conn
+
+    backend.close()
+
+    conn.send.assert_called_once_with(("stop",))
+    conn.close.assert_called_once()
+    assert backend._process is None
+
+
+def test_close_does_not_wait_for_request_in_flight(backend):
+    process = Mock()
+    backend._process, backend._conn = process, Mock()
+
+    with backend._lock:
+        backend.close()
+
+    process.terminate.assert_called_once()
+    # The in-flight request owns the cleanup once it wakes up
+    assert backend._process is process
@@ -0,0 +1,47 @@
+from unittest.mock import Mock
+
+import pytest
+
+from modules.gui.settings_dialog.panels import speech_panel
+from modules.gui.settings_dialog.panels.speech_panel import SpeechPanel
+
+
+def _panel(monkeypatch, speech_config: dict) -> tuple[SpeechPanel, Mock]:
+    config_service = Mock()
+    config_service.get_settings_data.return_value = {"speech_to_text_model": speech_config}
+    monkeypatch.setattr(speech_panel, "ConfigService", lambda: config_service)
+    return SpeechPanel(), config_service
+
+
+def test_local_model_is_saved_without_api_key_env(qapp, monkeypatch):
+    panel, config_service = _panel(monkeypatch, {"backend": "local", "model": "base.en", "display_name": "Base"})
+
+    panel._model_edit.setText("small.en")
+    panel.save_changes()
+
+    (saved,), _ = config_service.update_speech_model.call_args
+    assert saved == {"backend": "local", "model": "small.en", "display_name": "Base"}
+    assert not panel.is_dirty()
+
+
+def test_openai_model_still_requires_api_key_env(qapp, monkeypatch):
+    panel, config_service = _panel(monkeypatch, {"model": "whisper-1", "display_name": "Whisper"})
+
+    panel._model_edit.setText("gpt-4o-transcribe")
+    panel.save_changes()
+
+    config_service.update_speech_model.assert_not_called()
+
+
+@pytest.mark.parametrize("backend", [{}, {"backend": "openai"}])
+def test_openai_model_is_saved_with_api_key_env(qapp, monkeypatch, backend):
+    panel, config_service = _panel(
+        monkeypatch, {**backend, "model": "whisper-1", "display_name": "Whisper", "api_key_env": "OPENAI_API_KEY"}
+    )
+
+    panel._model_edit.setText("gpt-4o-transcribe")
+    panel.save_changes()
+
+    (saved,), _ = config_service.update_speech_model.call_args
+    assert saved["model"] == "gpt-4o-transcribe"
+    assert saved["api_key_env"] == "OPENAI_API_KEY"